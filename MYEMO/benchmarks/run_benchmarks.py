@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de bout en bout de la collecte
+Chaque étape (collect_*, FileManager.append_or_create, export du snapshot)
+est mesurée sur une ligue synthétique avec 1, 30, 180 et 365 jours
+d'historique : temps, pic de mémoire (RSS) et lignes/seconde.
+
+Chaque mesure tourne dans un processus séparé (pic RSS propre à l'étape).
+Les historiques générés sont mis en cache dans benchmarks/.cache.
+
+Usage :
+    python benchmarks/run_benchmarks.py                  # toutes les tailles
+    python benchmarks/run_benchmarks.py --days 1 30      # tailles choisies
+    python benchmarks/run_benchmarks.py --save-baseline  # enregistre la référence
+"""
+
+import argparse
+import json
+import os
+import pickle
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic_league import LeagueShape, build_history, make_league
+
+HISTORY_DAYS = [1, 30, 180, 365]
+CASES = [
+    'league_snapshot',
+    'collect_general_standings',
+    'collect_stat_standings',
+    'collect_roster_history',
+    'collect_my_team_tracking',
+    'collect_free_agents',
+    'collect_daily_player_stats',
+    'file_manager_append',
+    'snapshot_export',
+]
+CACHE_DIR = os.path.join(BENCH_DIR, '.cache')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+HISTORY_VERSION = 2  # À incrémenter si le format des historiques générés change
+START_DATE = datetime(2025, 10, 21)  # Début de saison fixe : historiques reproductibles
+
+
+# --- Historiques -----------------------------------------------------------
+
+def history_dir(shape: LeagueShape, days: int) -> str:
+    key = f"v{HISTORY_VERSION}_t{shape.teams}_r{shape.roster_size}_fa{shape.free_agents}_s{shape.seed}"
+    return os.path.join(CACHE_DIR, key, f"days_{days}")
+
+
+def ensure_histories(shape: LeagueShape, sizes: list) -> None:
+    """Construit les historiques manquants en un seul passage incrémental (1 -> 30 -> 180 -> 365)"""
+    missing = [days for days in sorted(sizes) if not os.path.exists(os.path.join(history_dir(shape, days), 'league.pkl'))]
+    if not missing:
+        return
+
+    work_dir = tempfile.mkdtemp(prefix='bench_history_')
+    league = make_league(shape)
+    built_days = 0
+    try:
+        for days in sorted(sizes):
+            print(f"🏗️  Génération de l'historique : {days} jours...", flush=True)
+            build_history(work_dir, league, days - built_days, end_date=history_end_date(days))
+            built_days = days
+            if days in missing:
+                target = history_dir(shape, days)
+                shutil.rmtree(target, ignore_errors=True)
+                shutil.copytree(work_dir, target)
+                with open(os.path.join(target, 'league.pkl'), 'wb') as f:
+                    pickle.dump(league, f)
+            league.advance_day()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def history_end_date(days: int) -> datetime:
+    """Dernier jour d'un historique de N jours (les historiques courts sont des préfixes des longs)"""
+    return START_DATE + timedelta(days=days - 1)
+
+
+# --- Mesure d'une étape (processus enfant) ---------------------------------
+
+def run_case(case: str, history: str, today: str) -> dict:
+    """Prépare l'étape (non chronométré) puis mesure son exécution"""
+    import logging
+    logging.disable(logging.CRITICAL)
+
+    from collectors.collect_data import DataCollector
+
+    work_dir = tempfile.mkdtemp(prefix='bench_case_')
+    shutil.copytree(history, work_dir, dirs_exist_ok=True)
+    os.chdir(work_dir)
+    with open(os.path.join(work_dir, 'league.pkl'), 'rb') as f:
+        league = pickle.load(f)
+    league.advance_day()  # Journée mesurée : nouvelles stats et transactions
+
+    collector = DataCollector(league=league, base_path=work_dir, today=today)
+    if case != 'league_snapshot':
+        collector.refresh_snapshot()
+
+    if case == 'league_snapshot':
+        step = collector.refresh_snapshot
+        count = lambda snapshot: sum(len(roster) for roster in snapshot.rosters.values()) + len(snapshot.free_agents)
+    elif case.startswith('collect_'):
+        step = getattr(collector, case)
+        count = lambda result: sum(len(v) for v in result.values()) if isinstance(result, dict) else len(result)
+    elif case == 'file_manager_append':
+        rows = collector.file_manager.read_history('data/raw/stats/daily_player_stats.csv', partitions=1)
+        rows = rows.assign(date=today)
+        step = lambda: collector.file_manager.append_or_create(rows, 'data/raw/stats/daily_player_stats.csv') or rows
+        count = len
+    elif case == 'snapshot_export':
+        from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
+        analyzer = ESPNNBAAdvancedAnalyzer(0, league.year, league=league,
+                                           history_dir=os.path.join(work_dir, 'snapshot_history'))
+
+        def step():
+            snapshot = analyzer.collect_daily_data()
+            analyzer.save_daily_snapshot(snapshot)
+            return snapshot
+        count = lambda snapshot: sum(len(team.roster) for team in snapshot.teams)
+    else:
+        raise ValueError(f"Étape inconnue : {case}")
+
+    start = time.perf_counter()
+    result = step()
+    wall = time.perf_counter() - start
+
+    rows = count(result)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        'case': case,
+        'wall_s': round(wall, 6),
+        'rows': rows,
+        'rows_per_s': round(rows / wall, 1) if wall > 0 else None,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+
+
+def measure(case: str, days: int, shape: LeagueShape, repeat: int) -> dict:
+    """Lance l'étape dans un sous-processus (repeat fois, meilleur temps conservé)"""
+    today = (history_end_date(days) + timedelta(days=1)).strftime('%Y%m%d')
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', case,
+             '--history', history_dir(shape, days), '--today', today],
+            capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run['wall_s'])
+    best['days'] = days
+    best['peak_rss_mb'] = max(run['peak_rss_mb'] for run in runs)
+    return best
+
+
+# --- Référence et rapport --------------------------------------------------
+
+def compare_to_baseline(results: list, baseline: dict, tolerance: float, min_delta: float) -> list:
+    """Étapes plus lentes que la référence au-delà de la tolérance (et du bruit minimal)"""
+    regressions = []
+    for result in results:
+        reference = baseline.get(f"{result['case']}@{result['days']}")
+        if reference is None:
+            continue
+        delta = result['wall_s'] - reference['wall_s']
+        if delta > min_delta and result['wall_s'] > reference['wall_s'] * (1 + tolerance):
+            regressions.append({**result, 'baseline_s': reference['wall_s']})
+    return regressions
+
+
+def print_report(results: list) -> None:
+    print(f"\n{'Étape':<30} {'Jours':>6} {'Temps (s)':>10} {'Lignes':>8} {'Lignes/s':>12} {'RSS (Mo)':>9}")
+    print("-" * 80)
+    for r in results:
+        rows_per_s = f"{r['rows_per_s']:.0f}" if r['rows_per_s'] else '-'
+        print(f"{r['case']:<30} {r['days']:>6} {r['wall_s']:>10.4f} {r['rows']:>8} {rows_per_s:>12} {r['peak_rss_mb']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de la collecte sur ligue synthétique")
+    parser.add_argument('--days', type=int, nargs='+', default=HISTORY_DAYS, help="Jours d'historique")
+    parser.add_argument('--cases', nargs='+', default=CASES, choices=CASES, help="Étapes à mesurer")
+    parser.add_argument('--teams', type=int, default=LeagueShape.teams)
+    parser.add_argument('--roster-size', type=int, default=LeagueShape.roster_size)
+    parser.add_argument('--free-agents', type=int, default=LeagueShape.free_agents)
+    parser.add_argument('--repeat', type=int, default=3, help="Exécutions par mesure (meilleur temps)")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Ralentissement toléré (0.25 = +25%%)")
+    parser.add_argument('--min-delta', type=float, default=0.005, help="Écart minimal signalé (secondes)")
+    parser.add_argument('--save-baseline', action='store_true', help="Enregistre les résultats comme référence")
+    parser.add_argument('--output', help="Fichier JSON des résultats")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--history', help=argparse.SUPPRESS)
+    parser.add_argument('--today', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.history, args.today)))
+        return 0
+
+    shape = LeagueShape(teams=args.teams, roster_size=args.roster_size, free_agents=args.free_agents)
+    ensure_histories(shape, args.days)
+
+    results = []
+    for days in sorted(args.days):
+        for case in args.cases:
+            print(f"⏱️  {case} ({days} jours)...", flush=True)
+            results.append(measure(case, days, shape, args.repeat))
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'shape': asdict(shape), 'results': results}, f, indent=2)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({f"{r['case']}@{r['days']}": r for r in results}, f, indent=2, sort_keys=True)
+        print(f"\n💾 Référence enregistrée : {BASELINE_PATH}")
+        return 0
+
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} régression(s) par rapport à la référence :")
+            for r in regressions:
+                print(f"   {r['case']} ({r['days']} jours) : {r['wall_s']:.4f}s vs {r['baseline_s']:.4f}s")
+            return 1
+        print("\n✅ Aucune régression par rapport à la référence")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
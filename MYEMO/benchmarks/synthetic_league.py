@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Générateur de ligues synthétiques
+Produit des objets ligue / équipes / joueurs ayant la forme de ceux d'espn_api,
+consommables par DataCollector et ESPNNBAAdvancedAnalyzer, ainsi qu'un
+historique de N jours dans data/raw (écrit par les collecteurs eux-mêmes).
+"""
+
+import os
+import random
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+STATS = ['PTS', 'REB', 'AST', 'BLK', 'STL', '3PM', 'FG%', 'FT%', 'TO']
+# Moyenne et écart-type par match des catégories
+STAT_PROFILE = {
+    'PTS': (14.0, 6.0), 'REB': (5.5, 2.5), 'AST': (3.5, 2.0), 'BLK': (0.6, 0.4),
+    'STL': (1.0, 0.4), '3PM': (1.5, 0.9), 'FG%': (0.47, 0.04), 'FT%': (0.78, 0.07),
+    'TO': (1.8, 0.7)
+}
+PERIODS = ['total', 'last_30', 'last_15', 'last_7']
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+PRO_TEAMS = ['ATL', 'BOS', 'BKN', 'CHA', 'CHI', 'CLE', 'DAL', 'DEN', 'DET', 'GSW',
+             'HOU', 'IND', 'LAC', 'LAL', 'MEM', 'MIA', 'MIL', 'MIN', 'NOP', 'NYK',
+             'OKC', 'ORL', 'PHI', 'PHL', 'POR', 'SAC', 'SAS', 'TOR', 'UTA', 'WAS']
+MY_TEAM_NAME = "Neon Cobras 99"
+
+
+@dataclass
+class LeagueShape:
+    """Dimensions de la ligue générée"""
+    teams: int = 12
+    roster_size: int = 13
+    bench_size: int = 3
+    free_agents: int = 150
+    year: int = 2026
+    seed: int = 0
+
+
+class SyntheticLeague:
+    """Ligue avec l'interface utilisée par les collecteurs (teams, standings(), free_agents()...)"""
+
+    def __init__(self, shape: LeagueShape):
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+        self.year = shape.year
+        self.current_week = 1
+        self.settings = SimpleNamespace(name='Ligue synthétique', scoring_type='H2H_CATEGORY',
+                                        playoff_team_count=min(6, shape.teams))
+        self._next_player_id = 1
+        self.teams = [self._make_team(i + 1) for i in range(shape.teams)]
+        self.free_agent_pool = [self._make_player() for _ in range(shape.free_agents)]
+        self._update_team_stats()
+
+    def standings(self) -> List:
+        return sorted(self.teams, key=lambda team: team.standing)
+
+    def free_agents(self, week: int = None, size: int = 50, position: str = None, position_id: int = None) -> List:
+        return list(self.free_agent_pool[:size])
+
+    def recent_activity(self, size: int = 25, msg_type: str = None, offset: int = 0) -> List:
+        return []
+
+    def advance_day(self, transactions: int = 2) -> None:
+        """Nouvelle journée : stats qui bougent, blessures, échanges avec les agents libres"""
+        for team in self.teams:
+            for player in team.roster:
+                self._jitter_player(player)
+        for player in self.free_agent_pool:
+            self._jitter_player(player)
+
+        for _ in range(transactions):
+            team = self.rng.choice(self.teams)
+            out_index = self.rng.randrange(len(team.roster))
+            in_index = self.rng.randrange(len(self.free_agent_pool))
+            incoming = self.free_agent_pool[in_index]
+            outgoing = team.roster[out_index]
+            incoming.lineupSlot = incoming.slot_position = outgoing.lineupSlot
+            outgoing.lineupSlot = outgoing.slot_position = 'FA'
+            team.roster[out_index], self.free_agent_pool[in_index] = incoming, outgoing
+
+        self.current_week += 1
+        self._update_team_stats()
+
+    def _make_team(self, team_id: int):
+        name = MY_TEAM_NAME if team_id == 1 else f"Équipe {team_id:03d}"
+        roster = [self._make_player() for _ in range(self.shape.roster_size)]
+        for i, player in enumerate(roster):
+            slot = 'BE' if i >= self.shape.roster_size - self.shape.bench_size else player.position
+            player.lineupSlot = player.slot_position = slot
+        return SimpleNamespace(
+            team_id=team_id, team_abbrev=f"T{team_id}", team_name=name, owner=f"Manager {team_id}",
+            standing=team_id, rank=team_id, final_standing=0, wins=0, losses=0, ties=0,
+            points_for=0.0, stats={}, roster=roster
+        )
+
+    def _make_player(self):
+        player_id = self._next_player_id
+        self._next_player_id += 1
+        position = self.rng.choice(POSITIONS)
+        player = SimpleNamespace(
+            name=f"Joueur {player_id:05d}", playerId=player_id, position=position,
+            lineupSlot='FA', slot_position='FA', eligibleSlots=[position, 'UT', 'BE'],
+            proTeam=self.rng.choice(PRO_TEAMS), injuryStatus='ACTIVE', injured=False,
+            percent_owned=round(self.rng.uniform(0, 100), 1), percent_started=round(self.rng.uniform(0, 100), 1),
+            games_played=self.rng.randint(0, 60), stats={}, schedule={}
+        )
+        player.level = self.rng.uniform(0.5, 1.5)  # Niveau du joueur, fixe sur la saison
+        self._jitter_player(player)
+        return player
+
+    def _jitter_player(self, player) -> None:
+        """Tire de nouvelles moyennes (par période) autour du niveau du joueur"""
+        for period in PERIODS:
+            avg = {}
+            for stat, (mean, std) in STAT_PROFILE.items():
+                scale = 1.0 if stat in ('FG%', 'FT%') else player.level
+                avg[stat] = max(0.0, self.rng.gauss(mean * scale, std))
+            player.stats[f"{self.year}_{period}"] = {'avg': avg, 'total': {k: v * 30 for k, v in avg.items()}}
+        player.injured = self.rng.random() < 0.03
+        player.injuryStatus = 'OUT' if player.injured else 'ACTIVE'
+
+        # Attributs lus par ESPNNBAAdvancedAnalyzer
+        season = player.stats[f"{self.year}_total"]['avg']
+        player.total_points = season['PTS']
+        player.rebounds = season['REB']
+        player.assists = season['AST']
+        player.steals = season['STL']
+        player.blocks = season['BLK']
+        player.field_goal_percentage = season['FG%']
+        player.free_throw_percentage = season['FT%']
+        player.three_pointers_made = season['3PM']
+        player.turnovers = season['TO']
+
+    def _update_team_stats(self) -> None:
+        for team in self.teams:
+            team.stats = {stat: sum(p.stats[f"{self.year}_total"]['avg'][stat] for p in team.roster) for stat in STATS}
+            team.points_for = team.stats['PTS']
+        for rank, team in enumerate(sorted(self.teams, key=lambda t: t.points_for, reverse=True), start=1):
+            team.standing = team.rank = rank
+
+
+def make_league(shape: LeagueShape = None) -> SyntheticLeague:
+    return SyntheticLeague(shape or LeagueShape())
+
+
+def history_dates(days: int, end_date: datetime = None) -> List[str]:
+    """Les N jours se terminant à end_date (inclus), au format des collecteurs"""
+    end_date = end_date or datetime.now()
+    return [(end_date - timedelta(days=days - 1 - i)).strftime('%Y%m%d') for i in range(days)]
+
+
+def build_history(base_path: str, league: SyntheticLeague, days: int, end_date: datetime = None) -> None:
+    """Écrit N jours d'historique dans base_path/data/raw en exécutant les collecteurs jour par jour"""
+    from collectors.collect_data import DataCollector
+
+    for i, day in enumerate(history_dates(days, end_date)):
+        if i:
+            league.advance_day()
+        collector = DataCollector(league=league, base_path=base_path, today=day)
+        collector.refresh_snapshot()
+        collector.collect_general_standings()
+        collector.collect_stat_standings()
+        collector.collect_roster_history()
+        collector.collect_my_team_tracking()
+        collector.collect_free_agents()
+        collector.collect_daily_player_stats()
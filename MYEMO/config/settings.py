@@ -1,6 +1,20 @@
 # Configuration de la ligue
 LEAGUE_ID = "1557635339"
 YEAR = 2026
+MY_TEAM_NAME = "Neon Cobras 99"
+
+# Mode multi-ligues : (league_id, saison, mon équipe) par ligue collectée
+# Données de chaque ligue dans data/raw/<league_id>/
+LEAGUES = [
+    (LEAGUE_ID, YEAR, MY_TEAM_NAME),
+]
+# Nombre de ligues collectées en parallèle
+MULTI_LEAGUE_WORKERS = 4
+
+# Processus unique des travaux planifiés (src/job_runner.py)
+JOB_RUNNER_JOBS = ['collect_data', 'realtime', 'analyzer_snapshot', 'weekly_analysis']
+# Nombre de travaux exécutés en parallèle
+JOB_RUNNER_WORKERS = 2
 
 # Chemins des données
 DATA_DIR = "data"
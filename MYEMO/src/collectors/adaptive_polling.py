@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Fréquence de collecte adaptée aux matchs NBA
+- Fenêtres de match (tip-off -> fin estimée) déduites du calendrier des
+  joueurs ESPN (player.schedule) des rosters de la ligue
+- Pendant un match : collecte rapide (2 minutes), ralentie si la ligue ne
+  change plus
+- Hors match : intervalle de base (30 minutes) doublé à chaque collecte
+  sans changement, sans jamais dépasser le prochain tip-off
+- Un changement (ou le passage match / hors match) remet l'intervalle à sa base
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+# Durée estimée d'un match NBA (prolongations comprises)
+GAME_DURATION = timedelta(hours=2, minutes=45)
+# Calendrier considéré à partir de maintenant
+SCHEDULE_HORIZON = timedelta(days=2)
+
+Window = Tuple[datetime, datetime]
+
+
+def game_windows(players: Iterable, now: datetime = None, horizon: timedelta = SCHEDULE_HORIZON) -> List[Window]:
+    """Fenêtres de match (début, fin) des joueurs, fusionnées et triées
+
+    Seuls les matchs encore en cours ou débutant avant now + horizon sont gardés.
+    """
+    now = now or datetime.now()
+    tip_offs = set()
+    for player in players:
+        for game in (getattr(player, 'schedule', None) or {}).values():
+            tip_off = game.get('date')
+            if isinstance(tip_off, datetime) and now - GAME_DURATION < tip_off <= now + horizon:
+                tip_offs.add(tip_off)
+
+    windows: List[Window] = []
+    for tip_off in sorted(tip_offs):
+        end = tip_off + GAME_DURATION
+        if windows and tip_off <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((tip_off, end))
+    return windows
+
+
+def live_window(now: datetime, windows: Iterable[Window]) -> Optional[Window]:
+    return next((window for window in windows if window[0] <= now < window[1]), None)
+
+
+def next_tip_off(now: datetime, windows: Iterable[Window]) -> Optional[datetime]:
+    return min((start for start, _ in windows if start > now), default=None)
+
+
+@dataclass
+class PollingPolicy:
+    """Intervalles en secondes"""
+    live_interval: float = 120.0
+    live_max: float = 900.0
+    idle_interval: float = 1800.0
+    idle_max: float = 12 * 3600.0
+    backoff: float = 2.0
+    # Collecte juste avant le tip-off (changements de lineup de dernière minute)
+    pre_game: float = 600.0
+
+
+class AdaptivePoller:
+    """Délai avant la prochaine collecte, selon les matchs en cours et les derniers changements"""
+
+    def __init__(self, policy: PollingPolicy = None):
+        self.policy = policy or PollingPolicy()
+        self.unchanged = 0
+        self.live = None
+
+    def next_delay(self, now: datetime, changed: bool, windows: List[Window]) -> float:
+        policy = self.policy
+        live = live_window(now, windows) is not None
+        if changed or live != self.live:
+            self.unchanged = 0
+        else:
+            self.unchanged += 1
+        self.live = live
+
+        if live:
+            return min(policy.live_interval * policy.backoff ** self.unchanged, policy.live_max)
+        delay = min(policy.idle_interval * policy.backoff ** self.unchanged, policy.idle_max)
+        tip_off = next_tip_off(now, windows)
+        if tip_off is not None:
+            # Réveil avant le prochain match (au plus tôt dans live_interval)
+            delay = min(delay, max((tip_off - now).total_seconds() - policy.pre_game, policy.live_interval))
+        return delay
+
+    def describe(self, now: datetime, windows: List[Window]) -> str:
+        window = live_window(now, windows)
+        if window is not None:
+            return f"match en cours jusqu'à ~{window[1]:%H:%M}"
+        tip_off = next_tip_off(now, windows)
+        return f"prochain match à {tip_off:%d/%m %H:%M}" if tip_off else "aucun match prévu"
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Détection des changements de la ligue et journal d'événements
+- Chaque entité (équipe, joueur d'un roster, agent libre) est réduite à un
+  état (dict) et à son empreinte (hash) ; seules les entités dont
+  l'empreinte a changé sont comparées champ par champ
+- Événements émis : added, dropped, status_change (emplacement, blessure,
+  classement...), stat_delta (écart des valeurs numériques)
+- Journal JSON Lines en ajout seul (data/events/league_events.jsonl), numéroté
+  par seq ; abonnement dans le processus (subscribe) ou lecture depuis un
+  autre processus (read / follow)
+- Les empreintes sont persistées : un redémarrage n'émet que les vrais changements
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_EVENT_LOG = os.path.join('data', 'events', 'league_events.jsonl')
+DEFAULT_STATE_PATH = os.path.join('data', 'cache', 'change_detection.json')
+# Champs dont le changement est un changement de statut (les autres champs numériques sont des stats)
+STATUS_FIELDS = ('team', 'lineup_slot', 'injury_status', 'injured', 'standing', 'pro_team')
+STAT_PERIOD = '2026_total'
+# Arrondi des stats avant empreinte (évite les faux changements dus aux flottants)
+STAT_DECIMALS = 4
+
+
+def _player_stats(player) -> Dict[str, float]:
+    """Moyennes par catégorie d'un joueur ESPN (nine_cat_averages, sinon stats de la saison)"""
+    stats = getattr(player, 'nine_cat_averages', None)
+    if stats is None:
+        stats = ((getattr(player, 'stats', None) or {}).get(STAT_PERIOD) or {}).get('avg') or {}
+    return _rounded(stats)
+
+
+def _rounded(stats: Dict) -> Dict[str, float]:
+    return {str(key): round(float(value), STAT_DECIMALS) for key, value in stats.items()
+            if isinstance(value, (int, float))}
+
+
+def _player_state(player, **extra) -> Dict:
+    return {
+        'player': player.name,
+        'pro_team': getattr(player, 'proTeam', None),
+        'injury_status': getattr(player, 'injuryStatus', None),
+        'injured': bool(getattr(player, 'injured', False)),
+        **extra,
+        'stats': _player_stats(player),
+    }
+
+
+def league_entities(teams: Iterable, free_agents: Iterable = ()) -> Dict[str, Dict]:
+    """États des entités de la ligue, indexés par clé stable ('team:<id>', 'roster:<id>', 'fa:<id>')"""
+    entities = {}
+    for team in teams:
+        entities[f"team:{team.team_id}"] = {
+            'team': team.team_name.strip(),
+            'standing': getattr(team, 'standing', None),
+            'stats': _rounded(getattr(team, 'stats', None) or {}),
+        }
+        for player in team.roster:
+            entities[f"roster:{getattr(player, 'playerId', player.name)}"] = _player_state(
+                player, team=team.team_name.strip(), lineup_slot=getattr(player, 'lineupSlot', None))
+    for player in free_agents:
+        entities[f"fa:{getattr(player, 'playerId', player.name)}"] = _player_state(
+            player, percent_owned=round(float(getattr(player, 'percent_owned', 0) or 0), 2))
+    return entities
+
+
+def entity_hash(state: Dict) -> str:
+    return hashlib.blake2b(json.dumps(state, sort_keys=True, ensure_ascii=False).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def _flatten(state: Dict, prefix: str = '') -> Dict:
+    flat = {}
+    for key, value in state.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _event(key: str, entity_state: Dict, event_type: str, **data) -> Dict:
+    """Événement d'une entité : type d'entité, clé, nom lisible, type d'événement et détails"""
+    name = entity_state.get('player') or entity_state.get('team')
+    return {'entity': key.split(':', 1)[0], 'key': key, 'name': name,
+            'type': event_type, **data}
+
+
+def diff_entity(key: str, previous: Dict, current: Dict) -> List[Dict]:
+    """Événements status_change / stat_delta entre deux états d'une même entité"""
+    before, after = _flatten(previous), _flatten(current)
+    changes, deltas = {}, {}
+    for name in sorted(set(before) | set(after)):
+        old, new = before.get(name), after.get(name)
+        if old == new:
+            continue
+        numeric = isinstance(old, (int, float)) and isinstance(new, (int, float)) \
+            and not isinstance(old, bool) and not isinstance(new, bool)
+        if numeric and name.split('.')[0] not in STATUS_FIELDS:
+            deltas[name] = round(new - old, STAT_DECIMALS)
+        else:
+            changes[name] = {'from': old, 'to': new}
+    events = []
+    if changes:
+        events.append(_event(key, current, 'status_change', changes=changes))
+    if deltas:
+        events.append(_event(key, current, 'stat_delta', deltas=deltas))
+    return events
+
+
+class ChangeDetector:
+    """Empreintes des entités entre deux collectes"""
+
+    def __init__(self, state_path: str = None):
+        self.state_path = state_path
+        self.states: Dict[str, Dict] = {}
+        self.hashes: Dict[str, str] = {}
+        if state_path and os.path.exists(state_path):
+            try:
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                self.states, self.hashes = saved['states'], saved['hashes']
+            except (OSError, ValueError, KeyError):
+                pass  # État illisible : la prochaine collecte sert de référence
+
+    def detect(self, entities: Dict[str, Dict]) -> List[Dict]:
+        """Événements depuis la collecte précédente ; l'état courant devient la référence"""
+        hashes = {key: entity_hash(state) for key, state in entities.items()}
+        events = []
+        for key, state in entities.items():
+            if key not in self.hashes:
+                events.append(_event(key, state, 'added', state=state))
+            elif hashes[key] != self.hashes[key]:
+                events.extend(diff_entity(key, self.states[key], state))
+        for key in sorted(self.hashes.keys() - entities.keys()):
+            events.append(_event(key, self.states[key], 'dropped'))
+        self.states, self.hashes = dict(entities), hashes
+        return events
+
+    def save(self) -> None:
+        if not self.state_path:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'states': self.states, 'hashes': self.hashes}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+
+class EventLog:
+    """Journal d'événements en ajout seul (une ligne JSON par événement)"""
+
+    def __init__(self, path: str = DEFAULT_EVENT_LOG):
+        self.path = path
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[Callable[[Dict], None], Optional[set], Optional[set]]] = []
+        self.last_seq = self._read_last_seq()
+
+    def _read_last_seq(self) -> int:
+        """Numéro du dernier événement (lecture de la fin du fichier seulement)"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, os.path.getsize(self.path) - 65536))
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                return int(json.loads(line)['seq'])
+            except (ValueError, KeyError):
+                continue
+        return 0
+
+    def append(self, events: Sequence[Dict], timestamp: str = None) -> List[Dict]:
+        """Ajoute les événements (numérotés et horodatés) puis notifie les abonnés"""
+        if not events:
+            return []
+        timestamp = timestamp or datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            records = []
+            for event in events:
+                self.last_seq += 1
+                records.append({'seq': self.last_seq, 'ts': timestamp, **event})
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+        for record in records:
+            self._notify(record)
+        return records
+
+    def subscribe(self, callback: Callable[[Dict], None], entities: Iterable[str] = None,
+                  types: Iterable[str] = None) -> Callable[[], None]:
+        """Abonne callback aux nouveaux événements (filtres optionnels) ; retourne la fonction de désabonnement"""
+        subscription = (callback, set(entities) if entities else None, set(types) if types else None)
+        self._subscribers.append(subscription)
+        return lambda: self._subscribers.remove(subscription)
+
+    def _notify(self, record: Dict) -> None:
+        for callback, entities, types in list(self._subscribers):
+            if entities is not None and record.get('entity') not in entities:
+                continue
+            if types is not None and record.get('type') not in types:
+                continue
+            callback(record)
+
+    def read(self, since_seq: int = 0) -> Iterator[Dict]:
+        """Événements de numéro > since_seq (consommateurs d'un autre processus)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break  # Ligne en cours d'écriture
+                record = json.loads(line)
+                if record['seq'] > since_seq:
+                    yield record
+
+    def follow(self, since_seq: int = 0, poll_interval: float = 5.0,
+               stop: Callable[[], bool] = None) -> Iterator[Dict]:
+        """Suit le journal comme `tail -f` : événements > since_seq puis nouveaux, jusqu'à stop()
+
+        Seuls les octets ajoutés depuis la lecture précédente sont relus.
+        """
+        offset = 0
+        while True:
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    f.seek(offset)
+                    chunk = f.read()
+                complete = chunk[:chunk.rfind(b'\n') + 1]  # Ligne en cours d'écriture : relue ensuite
+                offset += len(complete)
+                for line in complete.splitlines():
+                    record = json.loads(line)
+                    if record['seq'] > since_seq:
+                        since_seq = record['seq']
+                        yield record
+            if stop is not None and stop():
+                return
+            time.sleep(poll_interval)
@@ -1,28 +1,56 @@
-from espn_api.basketball import League
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import os
 import logging
 from typing import Dict, List, Optional
-from collectors.data_models import GeneralStanding, StatStanding, RosterHistory, PlayerTracking, FreeAgentMarket
+from collectors.data_models import (FA_STAT_KEYS, FreeAgentMarketBatch, GeneralStanding, PlayerTracking,
+                                    RecordBatch, RosterHistory, StatStanding)
 from collectors.file_manager import FileManager
+from collectors.rolling_stats import DEFAULT_STATE_PATH, ROLLING_WINDOWS, load_or_rebuild
+from collectors.league_snapshot import LeagueRunSnapshot, player_category_averages
+from collectors.league_replay import open_league
+from processors.fa_index import FreeAgentIndex
+from processors.roto_simulator import RotoSimulator, SimulationResult
+from processors.team_fit import TeamFitScorer
+from utils.instrumentation import PipelineMetrics
 
 class DataCollector:
     STATS_CATEGORIES = ['PTS', 'REB', 'AST', 'BLK', 'STL', '3PM', 'FG%', 'FT%']
+    LEAGUE_ID = 1557635339
+    SEASON = 2026
     MY_TEAM_NAME = "Neon Cobras 99"
+    STORAGE_BACKEND = 'csv'  # 'csv' ou 'parquet' (voir collectors/storage.py)
+    SEASON_GAMES = 82  # Matchs de saison régulière (projection roto)
 
-    def __init__(self):
+    def __init__(self, league=None, base_path: str = None, today: str = None, league_id: int = None,
+                 season: int = None, my_team: str = None, namespace: str = None):
+        """league / base_path / today injectables (ligue synthétique, benchmarks, tests)
+
+        namespace : sous-dossier des données de la ligue (data/raw/<namespace>/,
+        mode multi-ligues) ; sans namespace, data/raw/ comme avant.
+        """
         self.logger = logging.getLogger(__name__)
-        self.league = None
+        self.league = league
+        self.league_id = league_id or self.LEAGUE_ID
+        self.season = season or self.SEASON
+        self.my_team_name = my_team or self.MY_TEAM_NAME
+        self.raw_dir = f'data/raw/{namespace}' if namespace else 'data/raw'
+        cache_dir, state_file = os.path.split(DEFAULT_STATE_PATH)
+        self.rolling_state_path = os.path.join(cache_dir, namespace, state_file) if namespace else DEFAULT_STATE_PATH
+        self.snapshot = None
+        self.rolling_stats = None
         self.prev_day_data = {}
-        self.today = datetime.now().strftime('%Y%m%d')
-        self.base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-        self.file_manager = FileManager(self.base_path)
+        self.today = today or datetime.now().strftime('%Y%m%d')
+        self.base_path = base_path or os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+        self.file_manager = FileManager(self.base_path, self.STORAGE_BACKEND)
         self.setup_logging()
-        self.connect_to_espn()
+        if self.league is None:
+            self.connect_to_espn()
         self.load_previous_data()
     
     def setup_logging(self):
+        os.makedirs(os.path.join(self.base_path, 'logs'), exist_ok=True)
         logging.basicConfig(
             level=logging.DEBUG,  # Changé en DEBUG pour voir plus de détails
             format='%(asctime)s - %(levelname)s - %(message)s',
@@ -36,47 +64,77 @@ class DataCollector:
         """Charge les données précédentes pour calculer les différences"""
         try:
             for stat in self.STATS_CATEGORIES:
-                prev_file = os.path.join(self.base_path, f'data/raw/stats/stats_{stat.lower()}_history.csv')
-                if os.path.exists(prev_file):
-                    df = pd.read_csv(prev_file)
-                    # Obtenir les données de la dernière date pour chaque équipe
-                    self.prev_day_data[stat] = df.sort_values('date').groupby('team').last().reset_index()
+                prev_file = f'{self.raw_dir}/stats/stats_{stat.lower()}_history.csv'
+                if self.file_manager.exists(prev_file):
+                    # Dernier état matérialisé à l'écriture (une ligne par équipe)
+                    self.prev_day_data[stat] = self.file_manager.load_latest(
+                        prev_file, ['team'], columns=['daily_total'], partitions=1
+                    )
         except Exception as e:
             self.logger.warning(f"Impossible de charger les données précédentes : {str(e)}")
     
     def connect_to_espn(self):
         try:
-            self.league = League(league_id=1557635339, year=2026)
+            # ESPN_LEAGUE_MODE=record|replay pour enregistrer / rejouer la ligue hors ligne
+            self.league = open_league(league_id=self.league_id, year=self.season)
             self.logger.info(f"✅ Connexion ESPN réussie: {self.league.settings.name}")
             self.logger.info(f"👥 {len(self.league.teams)} équipes")
         except Exception as e:
             self.logger.error(f"❌ Erreur de connexion ESPN: {str(e)}")
             raise
 
-    def collect_general_standings(self) -> List[GeneralStanding]:
-        standings_data = []
+    def refresh_snapshot(self) -> LeagueRunSnapshot:
+        """Récupère la ligue une seule fois pour l'exécution de collecte en cours"""
+        self.snapshot = LeagueRunSnapshot.fetch(self.league, self.STATS_CATEGORIES)
+        return self.snapshot
+
+    def _get_snapshot(self) -> LeagueRunSnapshot:
+        if self.snapshot is None:
+            self.refresh_snapshot()
+        return self.snapshot
+
+    # Étapes d'une collecte complète : (étape des mesures, méthode, libellé)
+    COLLECTION_STEPS = [
+        ('general_standings', 'collect_general_standings', "classement général"),
+        ('stat_standings', 'collect_stat_standings', "classements par statistique"),
+        ('roster_history', 'collect_roster_history', "historique des rosters"),
+        ('my_team_tracking', 'collect_my_team_tracking', "suivi de votre équipe"),
+        ('free_agents', 'collect_free_agents', "agents libres"),
+        ('daily_player_stats', 'collect_daily_player_stats', "statistiques quotidiennes des joueurs"),
+    ]
+
+    def run_collection(self, metrics: PipelineMetrics, verbose: bool = False) -> None:
+        """Collecte complète : ligue récupérée une seule fois, puis chaque étape mesurée"""
+        with metrics.stage('league_snapshot'):
+            self.refresh_snapshot()
+        for number, (stage, method, label) in enumerate(self.COLLECTION_STEPS, 1):
+            if verbose:
+                print(f"\n{number}. Collecte : {label}...")
+            with metrics.stage(stage):
+                getattr(self, method)()
+            if verbose:
+                print(f"✅ {label[0].upper() + label[1:]} : sauvegarde terminée")
+
+    def collect_general_standings(self) -> RecordBatch:
+        standings_data = RecordBatch(GeneralStanding)
         prev_standings = self._load_previous_standings()
+        snapshot = self._get_snapshot()
         
-        for team in self.league.standings():
-            # Calculer le total pour chaque catégorie
-            category_totals = []
-            for stat in self.STATS_CATEGORIES:
-                stat_total = 0
-                for player in team.roster:
-                    if hasattr(player, 'nine_cat_averages'):
-                        stat_total += float(player.nine_cat_averages.get(stat, 0))
-                    elif hasattr(player, 'stats') and '2026_total' in player.stats:
-                        stat_total += float(player.stats['2026_total']['avg'].get(stat, 0))
-                category_totals.append(stat_total)
+        # Totaux par équipe et par catégorie en une seule agrégation vectorisée
+        matrix = snapshot.categories
+        team_totals = matrix.team_totals()
+        
+        for team in snapshot.standings:
+            category_totals = team_totals[matrix.team_row(team.team_id)]
             
-            total_points = sum(category_totals)
-            avg_points = total_points / len(self.STATS_CATEGORIES) if category_totals else 0
+            total_points = float(category_totals.sum())
+            avg_points = total_points / len(self.STATS_CATEGORIES) if len(category_totals) else 0
             
             # Calcul de la différence avec la veille
             prev_points = prev_standings.get(team.team_name, {}).get('total_points', total_points)
             diff = total_points - prev_points
             
-            standing = GeneralStanding(
+            standings_data.append(
                 date=self.today,
                 team=team.team_name.strip(),
                 total_rank=getattr(team, 'standing', 0),
@@ -86,33 +144,26 @@ class DataCollector:
                 prev_day_diff=diff,
                 important_event=None  # À remplir manuellement ou via analyse
             )
-            standings_data.append(standing)
         
         # Sauvegarde en CSV avec historique
-        df = pd.DataFrame([vars(s) for s in standings_data])
-        self.file_manager.append_or_create(df, 'data/raw/general/standings_history.csv')
+        df = standings_data.to_frame()
+        self.file_manager.append_or_create(df, f'{self.raw_dir}/general/standings_history.csv')
         return standings_data
 
-    def collect_stat_standings(self) -> Dict[str, List[StatStanding]]:
+    def collect_stat_standings(self) -> Dict[str, RecordBatch]:
         stats_data = {}
+        snapshot = self._get_snapshot()
         
-        for stat in self.STATS_CATEGORIES:
-            stat_standings = []
-            for team in self.league.standings():
-                # Calculer le total des stats pour l'équipe
-                daily_total = 0
-                total_games = 0
-                
-                for player in team.roster:
-                    if hasattr(player, 'nine_cat_averages'):
-                        daily_total += float(player.nine_cat_averages.get(stat, 0))
-                        total_games += 1
-                    elif hasattr(player, 'stats') and '2026_total' in player.stats:
-                        daily_total += float(player.stats['2026_total']['avg'].get(stat, 0))
-                        total_games += 1
-                
-                # Calculer la moyenne (éviter division par 0)
-                daily_avg = daily_total / total_games if total_games > 0 else 0
+        matrix = snapshot.categories
+        team_totals = matrix.team_totals()
+        team_averages = matrix.team_averages()
+        
+        for j, stat in enumerate(self.STATS_CATEGORIES):
+            stat_standings = RecordBatch(StatStanding)
+            for team in snapshot.standings:
+                row = matrix.team_row(team.team_id)
+                daily_total = float(team_totals[row, j])
+                daily_avg = float(team_averages[row, j])
                 
                 # Différence avec la veille
                 prev_stat = 0
@@ -123,30 +174,30 @@ class DataCollector:
                     if not prev_team_data.empty:
                         prev_stat = prev_team_data.iloc[0]['daily_total']
                 
-                standing = StatStanding(
+                stat_standings.append(
                     date=self.today,
                     team=team.team_name.strip(),
                     stat_name=stat,
                     daily_total=daily_total,
                     daily_average=daily_avg,
-                    stat_rank=self._calculate_stat_rank(team, stat),
+                    stat_rank=snapshot.stat_rank(team, stat),
                     prev_day_diff=daily_total - prev_stat
                 )
-                stat_standings.append(standing)
             
             # Sauvegarde en CSV avec historique pour chaque stat
-            df = pd.DataFrame([vars(s) for s in stat_standings])
-            self.file_manager.append_or_create(df, f'data/raw/stats/stats_{stat.lower()}_history.csv')
+            df = stat_standings.to_frame()
+            self.file_manager.append_or_create(df, f'{self.raw_dir}/stats/stats_{stat.lower()}_history.csv')
             stats_data[stat] = stat_standings
         
         return stats_data
 
-    def collect_roster_history(self) -> List[RosterHistory]:
-        roster_data = []
+    def collect_roster_history(self) -> RecordBatch:
+        roster_data = RecordBatch(RosterHistory)
         previous_rosters = self._load_previous_rosters()
+        snapshot = self._get_snapshot()
         
-        for team in self.league.teams:
-            for player in team.roster:
+        for team in snapshot.teams:
+            for player in snapshot.roster(team):
                 # Vérification du statut
                 status = 'active'  # Par défaut, on considère le joueur comme actif
                 if hasattr(player, 'injured') and player.injured:
@@ -159,7 +210,7 @@ class DataCollector:
                 
                 if prev_record is None:
                     # Nouveau joueur dans l'équipe
-                    roster = RosterHistory(
+                    roster_data.append(
                         date=self.today,
                         team=team.team_name.strip(),
                         player=player.name,
@@ -170,7 +221,7 @@ class DataCollector:
                     )
                 else:
                     # Joueur existant, mettre à jour son statut si nécessaire
-                    roster = RosterHistory(
+                    roster_data.append(
                         date=self.today,
                         team=team.team_name.strip(),
                         player=player.name,
@@ -179,15 +230,13 @@ class DataCollector:
                         arrival_date=prev_record['arrival_date'],
                         annotation=None if status == prev_record['status'] else f"Changement de statut: {prev_record['status']} → {status}"
                     )
-                
-                roster_data.append(roster)
         
         # Vérifier les joueurs qui ne sont plus dans leur équipe précédente
-        current_players = {(p.name, t.team_name.strip()) for t in self.league.teams for p in t.roster}
+        current_players = {(p.name, t.team_name.strip()) for t in snapshot.teams for p in snapshot.roster(t)}
         for (player_name, team_name), prev_record in previous_rosters.items():
             if (player_name, team_name) not in current_players:
                 # Marquer le joueur comme parti
-                roster = RosterHistory(
+                roster_data.append(
                     date=self.today,
                     team=team_name,
                     player=player_name,
@@ -197,30 +246,30 @@ class DataCollector:
                     departure_date=self.today,
                     annotation=f"Quitté l'équipe le {self.today}"
                 )
-                roster_data.append(roster)
         
         # Sauvegarde en CSV avec historique
-        df = pd.DataFrame([vars(r) for r in roster_data])
-        self.file_manager.append_or_create(df, 'data/raw/rosters/roster_history.csv')
+        df = roster_data.to_frame()
+        self.file_manager.append_or_create(df, f'{self.raw_dir}/rosters/roster_history.csv')
         return roster_data
 
-    def collect_my_team_tracking(self) -> List[PlayerTracking]:
-        tracking_data = []
+    def collect_my_team_tracking(self) -> RecordBatch:
+        tracking_data = RecordBatch(PlayerTracking)
+        snapshot = self._get_snapshot()
         
         # Trouve mon équipe
-        my_team = next((team for team in self.league.teams 
-                       if team.team_name.strip() == self.MY_TEAM_NAME), None)
+        my_team = next((team for team in snapshot.teams 
+                       if team.team_name.strip() == self.my_team_name), None)
         
         if not my_team:
-            self.logger.error(f"Équipe {self.MY_TEAM_NAME} non trouvée!")
+            self.logger.error(f"Équipe {self.my_team_name} non trouvée!")
             return tracking_data
         
-        for player in my_team.roster:
+        for player in snapshot.roster(my_team):
             # Informations NBA à compléter via API NBA ou autre source
-            tracking = PlayerTracking(
+            tracking_data.append(
                 date=self.today,
                 player=player.name,
-                fantasy_team=self.MY_TEAM_NAME,
+                fantasy_team=self.my_team_name,
                 nba_opponent=None,  # À compléter via API NBA
                 points=getattr(player, 'stats_pts', 0),
                 rebounds=getattr(player, 'stats_reb', 0),
@@ -233,108 +282,156 @@ class DataCollector:
                 next_game=None,  # À compléter via API NBA
                 back_to_back=False  # À compléter via API NBA
             )
-            tracking_data.append(tracking)
         
         # Sauvegarde en CSV avec historique
-        df = pd.DataFrame([vars(t) for t in tracking_data])
-        self.file_manager.append_or_create(df, 'data/raw/tracking/my_team_history.csv')
+        df = tracking_data.to_frame()
+        self.file_manager.append_or_create(df, f'{self.raw_dir}/tracking/my_team_history.csv')
         return tracking_data
 
-    def collect_free_agents(self) -> List[FreeAgentMarket]:
-        fa_data = []
-        free_agents = self.league.free_agents()
+    def collect_free_agents(self) -> FreeAgentMarketBatch:
+        free_agents = self._get_snapshot().free_agents
         previous_fa = self._load_previous_free_agents()
+        fa_data = FreeAgentMarketBatch(FA_STAT_KEYS, capacity=len(free_agents) + len(previous_fa))
         current_fa_set = set()
         
-        for player in free_agents:
+        # Statistiques du jour, alignées sur FA_STAT_KEYS (un joueur par ligne)
+        free_agents = list({player.name: player for player in free_agents}.values())
+        names = [player.name for player in free_agents]
+        daily_stats = self.free_agent_stat_matrix(free_agents)
+        
+        # Moyennes 7/14/30 jours : seules les lignes du jour sont intégrées à l'état glissant
+        rolling = self._update_rolling_stats(names, daily_stats)
+        
+        # Gain roto marginal de chaque agent libre pour mon équipe (calcul matriciel sur tout le pool)
+        fit_scores = self._team_fit_scores(
+            np.where(np.isnan(rolling['rolling_14d']), daily_stats, rolling['rolling_14d'])
+        )
+        
+        for i, player in enumerate(free_agents):
             current_fa_set.add(player.name)
-            # Statistiques du jour
-            daily_stats = {
-                'pts': getattr(player, 'stats_pts', 0),
-                'reb': getattr(player, 'stats_reb', 0),
-                'ast': getattr(player, 'stats_ast', 0),
-                'blk': getattr(player, 'stats_blk', 0),
-                'stl': getattr(player, 'stats_stl', 0),
-                '3pm': getattr(player, 'stats_3pm', 0),
-                'fg_pct': getattr(player, 'stats_fg%', 0),
-                'ft_pct': getattr(player, 'stats_ft%', 0),
-            }
             
-            # Récupérer l'historique du joueur s'il existe
-            prev_record = previous_fa.get(player.name)
             annotation = None
-            
-            if prev_record is None:
+            if player.name not in previous_fa.index:
                 # Nouveau dans les agents libres
                 annotation = f"Devenu agent libre le {self.today}"
             
-            fa = FreeAgentMarket(
+            fa_data.append(
                 date=self.today,
                 player=player.name,
                 nba_team=getattr(player, 'proTeam', 'Unknown'),
-                last_week_stats=daily_stats,  # On utilise les stats du jour
-                rolling_14d_stats=daily_stats,  # À améliorer avec calcul sur historique
-                rolling_30d_stats=daily_stats,  # À améliorer avec calcul sur historique
+                last_week=rolling['last_week'][i],
+                rolling_14d=rolling['rolling_14d'][i],
+                rolling_30d=rolling['rolling_30d'][i],
                 roster_percentage=getattr(player, 'percent_owned', 0),
                 start_percentage=getattr(player, 'percent_started', 0),
-                team_fit_score=None,  # À calculer
-                pickup_stats=daily_stats,  # Stats au moment où il devient FA
+                team_fit_score=None if fit_scores is None else float(fit_scores[i]),
+                pickup=daily_stats[i],  # Stats du jour
                 annotation=annotation
             )
-            fa_data.append(fa)
         
-        # Vérifier les joueurs qui ne sont plus agents libres
-        for player_name, prev_record in previous_fa.items():
-            if player_name not in current_fa_set:
-                # Le joueur n'est plus agent libre
-                fa = FreeAgentMarket(
-                    date=self.today,
-                    player=player_name,
-                    nba_team=prev_record['nba_team'],
-                    last_week_stats=prev_record['last_week_stats'],
-                    rolling_14d_stats=prev_record['rolling_14d_stats'],
-                    rolling_30d_stats=prev_record['rolling_30d_stats'],
-                    roster_percentage=0,
-                    start_percentage=0,
-                    annotation=f"N'est plus agent libre depuis le {self.today}"
-                )
-                fa_data.append(fa)
-        
-        # Sauvegarde en CSV
-        df = pd.DataFrame([{
-            **vars(fa),
-            **{'last_week_' + k: v for k, v in fa.last_week_stats.items()},
-            **{'rolling_14d_' + k: v for k, v in fa.rolling_14d_stats.items()},
-            **{'rolling_30d_' + k: v for k, v in fa.rolling_30d_stats.items()},
-            **({'pickup_' + k: v for k, v in fa.pickup_stats.items()} if fa.pickup_stats else {})
-        } for fa in fa_data])
+        # Joueurs qui ne sont plus agents libres : ajoutés en bloc depuis l'historique
+        departed = previous_fa[~previous_fa.index.isin(current_fa_set)]
+        fa_data.extend(
+            date=self.today,
+            players=departed.index.tolist(),
+            nba_teams=departed['nba_team'].tolist(),
+            **{window: departed.reindex(columns=[f"{window}_{key}" for key in FA_STAT_KEYS]).to_numpy(dtype=float)
+               for window in ('last_week', 'rolling_14d', 'rolling_30d')},
+            annotation=f"N'est plus agent libre depuis le {self.today}"
+        )
         
-        # Supprimer les colonnes dictionnaire
-        df = df.drop(columns=['last_week_stats', 'rolling_14d_stats', 'rolling_30d_stats', 'pickup_stats'])
-        self.file_manager.append_or_create(df, 'data/raw/free_agents/fa_market_history.csv')
+        # Sauvegarde en CSV (colonnes <fenêtre>_<stat>, construites depuis les matrices)
+        df = fa_data.to_frame()
+        self.file_manager.append_or_create(df, f'{self.raw_dir}/free_agents/fa_market_history.csv')
         
         return fa_data
 
+    @staticmethod
+    def free_agent_stat_matrix(players) -> np.ndarray:
+        """Moyennes des agents libres (joueurs × FA_STAT_KEYS), même source que les joueurs des rosters"""
+        stats = [key.upper().replace('_PCT', '%') for key in FA_STAT_KEYS]  # 'fg_pct' -> 'FG%'
+        values = np.zeros((len(players), len(FA_STAT_KEYS)))
+        for i, player in enumerate(players):
+            averages = player_category_averages(player) or {}
+            values[i] = [averages.get(stat) or 0 for stat in stats]
+        return values
+
+    def free_agent_index(self, window: str = 'rolling_14d') -> FreeAgentIndex:
+        """Index des agents libres du snapshot courant sur une fenêtre glissante ('daily' = stats du jour)"""
+        free_agents = list({player.name: player for player in self._get_snapshot().free_agents}.values())
+        values = self.free_agent_stat_matrix(free_agents)
+        if window != 'daily':
+            # Moyennes de l'état glissant (lecture seule), stats du jour à défaut d'historique
+            rolling = self._rolling_engine().means([player.name for player in free_agents])[window]
+            values = np.where(np.isnan(rolling), values, rolling)
+        return FreeAgentIndex.from_players(free_agents, values, FA_STAT_KEYS)
+
+    def _team_fit_scores(self, fa_values: np.ndarray) -> Optional[np.ndarray]:
+        """team_fit_score des agents libres (lignes alignées sur fa_values, colonnes FA_STAT_KEYS)"""
+        snapshot = self._get_snapshot()
+        my_team = next((team for team in snapshot.teams
+                        if team.team_name.strip() == self.my_team_name), None)
+        if my_team is None or not len(fa_values):
+            return None
+        matrix = snapshot.categories
+        columns = [FA_STAT_KEYS.index(self._stat_column(stat)) for stat in matrix.categories]
+        scorer = TeamFitScorer.from_category_matrix(
+            matrix, my_team.team_id, [stat for stat in matrix.categories if stat.endswith('%')]
+        )
+        return scorer.score(fa_values[:, columns])
+
+    def roto_simulator(self, season_games: int = None) -> RotoSimulator:
+        """Simulateur de fin de saison : classement actuel + rosters et historique glissant 30 jours"""
+        season_games = season_games or self.SEASON_GAMES
+        snapshot = self._get_snapshot()
+        matrix = snapshot.categories
+        names = [player.name for player in matrix.players]
+        columns = [FA_STAT_KEYS.index(self._stat_column(stat)) for stat in matrix.categories]
+        engine = self._rolling_engine()
+        means = engine.means(names)['rolling_30d'][:, columns]
+        means = np.where(np.isnan(means) & matrix.has_stats[:, None], matrix.values, means)
+        stds = engine.stds(names, 'rolling_30d')[:, columns]
+
+        # Valeurs actuelles du classement (stats de l'équipe ESPN, dans l'ordre de la matrice)
+        teams = {team.team_id: team for team in snapshot.teams}
+        current = np.array([
+            [float((getattr(teams.get(team_id), 'stats', None) or {}).get(stat, 0) or 0)
+             for stat in matrix.categories]
+            for team_id in matrix.team_ids
+        ]).reshape(matrix.n_teams, len(matrix.categories))
+
+        # Matchs restants estimés depuis les matchs joués (saison régulière de season_games matchs)
+        played = np.array([float(getattr(player, 'games_played', 0) or 0) for player in matrix.players])
+        return RotoSimulator.from_category_matrix(
+            matrix, current, means, stds,
+            games_remaining=np.maximum(season_games - played, 0),
+            percentage_categories=[stat for stat in matrix.categories if stat.endswith('%')],
+            season_progress=float(np.clip(played.mean() / season_games, 0, 1)) if len(played) else 0.0,
+            teams=[teams[team_id].team_name.strip() if team_id in teams else team_id
+                   for team_id in matrix.team_ids]
+        )
+
+    def roto_projection(self, n_sims: int = 10000, workers: int = None, seed=None) -> SimulationResult:
+        """Distribution des rangs par catégorie et des points roto de fin de saison"""
+        result = self.roto_simulator().run(n_sims, workers=workers, seed=seed)
+        self.logger.info(f"🎲 Projection roto : {result.n_sims} simulations")
+        return result
+
     def collect_daily_player_stats(self) -> List[Dict]:
         """Collecte les statistiques quotidiennes de tous les joueurs de la ligue"""
         daily_stats = []
+        snapshot = self._get_snapshot()
+        
+        matrix = snapshot.categories
+        stat_columns = [self._stat_column(stat) for stat in matrix.categories]
         
-        for team in self.league.teams:
+        for team in snapshot.teams:
             processed_players = set()  # Pour suivre les joueurs déjà traités
-            for player in team.roster:
+            for i in matrix.player_rows(team.team_id):
+                player = matrix.players[i]
                 if player.name in processed_players:  # Éviter les doublons
                     continue
-                    
-                # Collecter les statistiques de base
-                # Log les attributs du joueur et ses statistiques pour debug
-                self.logger.debug(f"Attributs du joueur {player.name}: {dir(player)}")
-                if hasattr(player, 'stats'):
-                    self.logger.debug(f"Statistiques disponibles pour {player.name}: {player.stats}")
-                if hasattr(player, 'nine_cat_averages'):
-                    self.logger.debug(f"Moyennes des 9 catégories pour {player.name}: {player.nine_cat_averages}")
                 
-                # Récupérer les stats depuis l'objet player
-                # Récupérer les statistiques des moyennes des 9 catégories
                 stats = {
                     'date': self.today,
                     'player': player.name,
@@ -342,38 +439,8 @@ class DataCollector:
                     'status': 'IR' if (hasattr(player, 'injured') and player.injured) else ('bench' if hasattr(player, 'slot_position') and player.slot_position == 'BE' else 'active')
                 }
                 
-                # Ajouter les statistiques si nine_cat_averages existe
-                if hasattr(player, 'nine_cat_averages'):
-                    stats.update({
-                        'pts': float(player.nine_cat_averages.get('PTS', 0)),
-                        'reb': float(player.nine_cat_averages.get('REB', 0)),
-                        'ast': float(player.nine_cat_averages.get('AST', 0)),
-                        'blk': float(player.nine_cat_averages.get('BLK', 0)),
-                        'stl': float(player.nine_cat_averages.get('STL', 0)),
-                        '3pm': float(player.nine_cat_averages.get('3PM', 0)),
-                        'fg_pct': float(player.nine_cat_averages.get('FG%', 0)),
-                        'ft_pct': float(player.nine_cat_averages.get('FT%', 0))
-                    })
-                # Si pas de nine_cat_averages, essayer d'obtenir depuis les stats
-                elif hasattr(player, 'stats') and '2026_total' in player.stats:
-                    total_stats = player.stats['2026_total']['avg']
-                    stats.update({
-                        'pts': float(total_stats.get('PTS', 0)),
-                        'reb': float(total_stats.get('REB', 0)),
-                        'ast': float(total_stats.get('AST', 0)),
-                        'blk': float(total_stats.get('BLK', 0)),
-                        'stl': float(total_stats.get('STL', 0)),
-                        '3pm': float(total_stats.get('3PM', 0)),
-                        'fg_pct': float(total_stats.get('FG%', 0)),
-                        'ft_pct': float(total_stats.get('FT%', 0))
-                    })
-                else:
-                    # Si aucune statistique n'est disponible, mettre des 0
-                    stats.update({
-                        'pts': 0.0, 'reb': 0.0, 'ast': 0.0,
-                        'blk': 0.0, 'stl': 0.0, '3pm': 0.0,
-                        'fg_pct': 0.0, 'ft_pct': 0.0
-                    })
+                # Moyennes des catégories (0 si aucune statistique n'est disponible)
+                stats.update(zip(stat_columns, matrix.values[i].tolist()))
                 
                 # Ajouter les informations supplémentaires
                 stats.update({
@@ -394,19 +461,58 @@ class DataCollector:
                (df['blk'] > 0) | (df['stl'] > 0) | (df['3pm'] > 0) |
                (df['fg_pct'] > 0) | (df['ft_pct'] > 0)]
         
-        self.file_manager.append_or_create(df, 'data/raw/stats/daily_player_stats.csv')
+        self.file_manager.append_or_create(df, f'{self.raw_dir}/stats/daily_player_stats.csv')
+        self._update_rolling_stats(df['player'].tolist(), df[list(FA_STAT_KEYS)].to_numpy(dtype=float))
         
         return daily_stats
 
+    def _rolling_engine(self):
+        """État glissant persisté (reconstruit une fois depuis l'historique s'il manque)"""
+        if self.rolling_stats is None:
+            self.rolling_stats, rebuilt = load_or_rebuild(
+                os.path.join(self.base_path, self.rolling_state_path), self._rolling_history
+            )
+            if rebuilt:
+                self.logger.info(f"🔁 Moyennes glissantes reconstruites depuis l'historique "
+                                 f"({len(self.rolling_stats.players)} joueurs)")
+        return self.rolling_stats
+
+    def _rolling_history(self) -> List[pd.DataFrame]:
+        """30 derniers jours des historiques joueurs et agents libres (bootstrap uniquement)"""
+        days = max(ROLLING_WINDOWS.values())
+        frames = []
+        stats_file = f'{self.raw_dir}/stats/daily_player_stats.csv'
+        if self.file_manager.exists(stats_file):
+            frames.append(self.file_manager.read_history(
+                stats_file, columns=['date', 'player'] + list(FA_STAT_KEYS), partitions=days))
+        fa_file = f'{self.raw_dir}/free_agents/fa_market_history.csv'
+        pickup_columns = [f"pickup_{key}" for key in FA_STAT_KEYS]
+        if self.file_manager.exists(fa_file) and set(pickup_columns) <= set(self.file_manager.columns(fa_file)):
+            # pickup_* = stats du jour des agents libres
+            fa_history = self.file_manager.read_history(fa_file, columns=['date', 'player'] + pickup_columns,
+                                                        partitions=days)
+            frames.append(fa_history.dropna(subset=pickup_columns, how='all')
+                          .rename(columns=dict(zip(pickup_columns, FA_STAT_KEYS))))
+        return frames
+
+    def _update_rolling_stats(self, players: List[str], values: np.ndarray) -> Dict[str, np.ndarray]:
+        """Intègre les stats du jour et retourne les moyennes par fenêtre de ces joueurs"""
+        engine = self._rolling_engine()
+        try:
+            engine.update(self.today, players, values)
+            engine.save(os.path.join(self.base_path, self.rolling_state_path))
+        except ValueError as e:
+            self.logger.warning(f"Moyennes glissantes non mises à jour : {str(e)}")
+        return engine.means(players)
+
     def _load_previous_standings(self) -> Dict[str, Dict]:
         prev_standings = {}
         try:
-            prev_file = os.path.join(self.base_path, 'data/raw/general/standings_history.csv')
-            if os.path.exists(prev_file):
-                df = pd.read_csv(prev_file)
+            prev_file = f'{self.raw_dir}/general/standings_history.csv'
+            if self.file_manager.exists(prev_file):
                 # Obtenir les données de la dernière date pour chaque équipe
-                latest_data = df.sort_values('date').groupby('team').last()
-                for team_name, row in latest_data.iterrows():
+                latest_data = self.file_manager.load_latest(prev_file, ['team'], columns=['total_points'])
+                for team_name, row in latest_data.set_index('team').iterrows():
                     prev_standings[team_name] = row.to_dict()
         except Exception as e:
             self.logger.warning(f"Impossible de charger les classements précédents : {str(e)}")
@@ -416,103 +522,71 @@ class DataCollector:
         """Charge l'historique des rosters pour détecter les changements"""
         previous_rosters = {}
         try:
-            roster_file = os.path.join(self.base_path, 'data/raw/rosters/roster_history.csv')
-            if os.path.exists(roster_file):
-                df = pd.read_csv(roster_file)
+            roster_file = f'{self.raw_dir}/rosters/roster_history.csv'
+            if self.file_manager.exists(roster_file):
                 # Obtenir les données les plus récentes pour chaque paire joueur-équipe
-                latest_data = df.sort_values('date').groupby(['player', 'team']).last()
-                for (player_name, team_name), row in latest_data.iterrows():
+                latest_data = self.file_manager.load_latest(
+                    roster_file, ['player', 'team'], columns=['status', 'origin', 'arrival_date']
+                )
+                for (player_name, team_name), row in latest_data.set_index(['player', 'team']).iterrows():
                     previous_rosters[(player_name, team_name)] = row.to_dict()
         except Exception as e:
             self.logger.warning(f"Impossible de charger l'historique des rosters : {str(e)}")
         return previous_rosters
 
-    def _load_previous_free_agents(self) -> Dict:
-        """Charge l'historique des agents libres pour détecter les changements"""
-        previous_fa = {}
+    def _load_previous_free_agents(self) -> pd.DataFrame:
+        """Charge l'historique des agents libres pour détecter les changements
+        
+        Retourne un DataFrame indexé par joueur (nba_team + colonnes <fenêtre>_<stat>)
+        """
+        previous_fa = pd.DataFrame(columns=['nba_team'], index=pd.Index([], name='player'))
         try:
-            fa_file = os.path.join(self.base_path, 'data/raw/free_agents/fa_market_history.csv')
-            if os.path.exists(fa_file):
-                df = pd.read_csv(fa_file)
+            fa_file = f'{self.raw_dir}/free_agents/fa_market_history.csv'
+            if self.file_manager.exists(fa_file):
+                # Seules les colonnes de stats glissantes sont lues
+                stats_columns = [
+                    col for col in self.file_manager.columns(fa_file)
+                    if col.startswith(('last_week_', 'rolling_14d_', 'rolling_30d_'))
+                ]
                 # Obtenir les données les plus récentes pour chaque joueur
-                latest_data = df.sort_values('date').groupby('player').last()
-                
-                for player_name, row in latest_data.iterrows():
-                    # Reconstruire les dictionnaires de stats
-                    last_week_stats = {}
-                    rolling_14d_stats = {}
-                    rolling_30d_stats = {}
-                    
-                    for col in df.columns:
-                        if col.startswith('last_week_'):
-                            last_week_stats[col.replace('last_week_', '')] = row[col]
-                        elif col.startswith('rolling_14d_'):
-                            rolling_14d_stats[col.replace('rolling_14d_', '')] = row[col]
-                        elif col.startswith('rolling_30d_'):
-                            rolling_30d_stats[col.replace('rolling_30d_', '')] = row[col]
-                    
-                    previous_fa[player_name] = {
-                        'nba_team': row['nba_team'],
-                        'last_week_stats': last_week_stats,
-                        'rolling_14d_stats': rolling_14d_stats,
-                        'rolling_30d_stats': rolling_30d_stats
-                    }
+                latest_data = self.file_manager.load_latest(
+                    fa_file, ['player'], columns=['nba_team'] + stats_columns
+                )
+                previous_fa = latest_data.set_index('player')
         except Exception as e:
             self.logger.warning(f"Impossible de charger l'historique des agents libres : {str(e)}")
         return previous_fa
 
+    @staticmethod
+    def _stat_column(stat: str) -> str:
+        """Nom de colonne d'une catégorie ('FG%' -> 'fg_pct')"""
+        return stat.lower().replace('%', '_pct')
+
     def _calculate_stat_rank(self, team: object, stat: str) -> int:
-        """Calcule le rang d'une équipe pour une statistique donnée"""
-        all_teams = self.league.standings()
-        sorted_teams = sorted(
-            all_teams,
-            key=lambda x: getattr(x, f'stats_{stat.lower()}', 0),
-            reverse=True
-        )
-        return next((i + 1 for i, t in enumerate(sorted_teams) if t.team_id == team.team_id), 0)
+        """Rang d'une équipe pour une statistique donnée (calculé une fois par stat dans le snapshot)"""
+        return self._get_snapshot().stat_rank(team, stat)
 
 def main():
+    # Mesures par étape (logs/metrics/)
+    metrics = PipelineMetrics('collect_data', os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs')))
+    
     # Initialiser le collecteur
-    collector = DataCollector()
+    with metrics.stage('connect'):
+        collector = DataCollector()
     
     print("🚀 Début de la collecte des données...")
     
     try:
-        # 1. Classement général
-        print("\n1. Collecte du classement général...")
-        general_standings = collector.collect_general_standings()
-        print("✅ Classement général sauvegardé")
-        
-        # 2. Classement par statistique
-        print("\n2. Collecte des classements par statistique...")
-        stats_standings = collector.collect_stat_standings()
-        print("✅ Classements par statistique sauvegardés")
-        
-        # 3. Historique des rosters
-        print("\n3. Collecte de l'historique des rosters...")
-        roster_history = collector.collect_roster_history()
-        print("✅ Historique des rosters sauvegardé")
-        
-        # 4. Suivi de mon équipe
-        print("\n4. Collecte du suivi de votre équipe...")
-        team_tracking = collector.collect_my_team_tracking()
-        print("✅ Suivi de votre équipe sauvegardé")
-        
-        # 5. Marché des agents libres
-        print("\n5. Collecte des agents libres...")
-        free_agents = collector.collect_free_agents()
-        print("✅ Données des agents libres sauvegardées")
-        
-        # 6. Statistiques quotidiennes des joueurs
-        print("\n6. Collecte des statistiques quotidiennes des joueurs...")
-        daily_stats = collector.collect_daily_player_stats()
-        print("✅ Statistiques quotidiennes des joueurs sauvegardées")
-        
-        print("\n✨ Collecte terminée avec succès ! Les données sont dans data/raw/")
+        collector.run_collection(metrics, verbose=True)
+        print(f"\n✨ Collecte terminée avec succès ! Les données sont dans {collector.raw_dir}/")
         
     except Exception as e:
         print(f"\n❌ Erreur lors de la collecte : {str(e)}")
         logging.error(f"Erreur détaillée : {str(e)}")
+    finally:
+        metrics_file = metrics.write()
+        print(f"\n⏱️ Mesures par étape ({metrics_file}) :\n{metrics.summary()}")
+    return collector
 
 if __name__ == "__main__":
     main()
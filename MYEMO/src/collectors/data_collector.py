@@ -3,7 +3,11 @@ import pandas as pd
 from datetime import datetime
 import logging
 import os
-from espn_api.basketball import League
+
+try:
+    from collectors.league_replay import open_league
+except ImportError:  # Import via src.collectors (run_realtime.py)
+    from src.collectors.league_replay import open_league
 
 class ESPNDataCollectorError(Exception):
     """Classe personnalisée pour les erreurs de collecte"""
@@ -25,7 +29,7 @@ class ESPNDataCollector:
         self.league_id = league_id
         self.year = year
         try:
-            self.league = League(league_id=league_id, year=year)
+            self.league = open_league(league_id=league_id, year=year)
         except Exception as e:
             raise ESPNDataCollectorError(str(e), "CONN", "League Initialization")
         self.setup_logger()
@@ -1,7 +1,29 @@
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterator, List, Optional, Sequence
 
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _slotted(cls):
+    """Équivalent de @dataclass(slots=True) (Python 3.10+) compatible Python 3.8 :
+    recrée la dataclass avec __slots__ (pas de __dict__ par enregistrement).
+    Les valeurs par défaut restent dans __init__ ; leurs attributs de classe
+    sont retirés (ils entreraient en conflit avec les slots).
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted
 @dataclass
 class GeneralStanding:
     date: str
@@ -13,6 +35,7 @@ class GeneralStanding:
     prev_day_diff: float
     important_event: Optional[str] = None
 
+@_slotted
 @dataclass
 class StatStanding:
     date: str
@@ -24,6 +47,7 @@ class StatStanding:
     prev_day_diff: float
     annotation: Optional[str] = None
 
+@_slotted
 @dataclass
 class RosterHistory:
     date: str
@@ -35,6 +59,7 @@ class RosterHistory:
     departure_date: Optional[str] = None
     annotation: Optional[str] = None
 
+@_slotted
 @dataclass
 class PlayerTracking:
     date: str
@@ -53,6 +78,7 @@ class PlayerTracking:
     back_to_back: bool
     change_source: Optional[str] = None
 
+@_slotted
 @dataclass
 class FreeAgentMarket:
     date: str
@@ -66,3 +92,165 @@ class FreeAgentMarket:
     team_fit_score: Optional[float] = None
     pickup_stats: Optional[dict] = None
     annotation: Optional[str] = None
+
+
+def _arrow_table(frame: pd.DataFrame):
+    if pa is None:
+        raise ImportError("pyarrow est requis pour to_arrow() (pip install pyarrow)")
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+class RecordBatch:
+    """Lot colonnaire (une liste par champ) d'enregistrements d'un même type.
+
+    append() ne crée aucun objet par ligne ; les enregistrements ne sont
+    matérialisés qu'à l'itération (compatibilité avec les listes d'objets).
+    """
+
+    def __init__(self, record_type):
+        self.record_type = record_type
+        self.fields = [f.name for f in fields(record_type)]
+        self.defaults = {f.name: f.default for f in fields(record_type) if f.default is not MISSING}
+        self.columns: Dict[str, list] = {name: [] for name in self.fields}
+
+    def append(self, **values) -> None:
+        for name in self.fields:
+            if name in values:
+                value = values[name]
+            elif name in self.defaults:
+                value = self.defaults[name]
+            else:
+                raise TypeError(f"{self.record_type.__name__} : champ obligatoire manquant '{name}'")
+            self.columns[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]])
+
+    def __getitem__(self, i: int):
+        return self.record_type(*(self.columns[name][i] for name in self.fields))
+
+    def __iter__(self) -> Iterator:
+        for row in zip(*(self.columns[name] for name in self.fields)):
+            yield self.record_type(*row)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns, columns=self.fields)
+
+    def to_arrow(self):
+        return _arrow_table(self.to_frame())
+
+
+FA_STAT_KEYS = ('pts', 'reb', 'ast', 'blk', 'stl', '3pm', 'fg_pct', 'ft_pct')
+FA_STAT_WINDOWS = ('last_week', 'rolling_14d', 'rolling_30d', 'pickup')
+
+
+class FreeAgentMarketBatch:
+    """Marché des agents libres d'une journée en struct-of-arrays.
+
+    Une matrice (joueurs x stat_keys) par fenêtre de stats au lieu de quatre
+    dictionnaires par joueur ; la fenêtre 'pickup' est facultative (masque).
+    """
+
+    SCALAR_FIELDS = ('date', 'player', 'nba_team', 'roster_percentage', 'start_percentage',
+                     'team_fit_score', 'annotation')
+
+    def __init__(self, stat_keys: Sequence[str] = FA_STAT_KEYS, capacity: int = 64):
+        self.stat_keys = tuple(stat_keys)
+        self.scalars: Dict[str, list] = {name: [] for name in self.SCALAR_FIELDS}
+        self.stats = {window: np.zeros((capacity, len(self.stat_keys))) for window in FA_STAT_WINDOWS}
+        self.has_pickup = np.zeros(capacity, dtype=bool)
+        self.size = 0
+
+    def append(self, date: str, player: str, nba_team: str, last_week: Sequence[float],
+               rolling_14d: Sequence[float], rolling_30d: Sequence[float], roster_percentage: float,
+               start_percentage: float, team_fit_score: Optional[float] = None,
+               pickup: Optional[Sequence[float]] = None, annotation: Optional[str] = None) -> None:
+        """Ajoute un joueur ; les stats sont des séquences alignées sur stat_keys"""
+        self._reserve(self.size + 1)
+        i = self.size
+        for name, value in zip(self.SCALAR_FIELDS, (date, player, nba_team, roster_percentage,
+                                                    start_percentage, team_fit_score, annotation)):
+            self.scalars[name].append(value)
+        self.stats['last_week'][i] = last_week
+        self.stats['rolling_14d'][i] = rolling_14d
+        self.stats['rolling_30d'][i] = rolling_30d
+        if pickup is not None:
+            self.stats['pickup'][i] = pickup
+            self.has_pickup[i] = True
+        self.size += 1
+
+    def extend(self, date: str, players: Sequence[str], nba_teams: Sequence[str], last_week: np.ndarray,
+               rolling_14d: np.ndarray, rolling_30d: np.ndarray, roster_percentage: float = 0,
+               start_percentage: float = 0, annotation: Optional[str] = None) -> None:
+        """Ajoute un bloc de joueurs d'un coup (matrices joueurs x stat_keys)"""
+        count = len(players)
+        if not count:
+            return
+        self._reserve(self.size + count)
+        block = slice(self.size, self.size + count)
+        self.scalars['date'].extend([date] * count)
+        self.scalars['player'].extend(players)
+        self.scalars['nba_team'].extend(nba_teams)
+        self.scalars['roster_percentage'].extend([roster_percentage] * count)
+        self.scalars['start_percentage'].extend([start_percentage] * count)
+        self.scalars['team_fit_score'].extend([None] * count)
+        self.scalars['annotation'].extend([annotation] * count)
+        self.stats['last_week'][block] = last_week
+        self.stats['rolling_14d'][block] = rolling_14d
+        self.stats['rolling_30d'][block] = rolling_30d
+        self.size += count
+
+    def window(self, name: str) -> np.ndarray:
+        """Matrice (joueurs x stat_keys) d'une fenêtre, sans copie"""
+        return self.stats[name][:self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[FreeAgentMarket]:
+        for i in range(self.size):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> FreeAgentMarket:
+        stats = {window: dict(zip(self.stat_keys, self.stats[window][i].tolist())) for window in FA_STAT_WINDOWS}
+        return FreeAgentMarket(
+            date=self.scalars['date'][i],
+            player=self.scalars['player'][i],
+            nba_team=self.scalars['nba_team'][i],
+            last_week_stats=stats['last_week'],
+            rolling_14d_stats=stats['rolling_14d'],
+            rolling_30d_stats=stats['rolling_30d'],
+            roster_percentage=self.scalars['roster_percentage'][i],
+            start_percentage=self.scalars['start_percentage'][i],
+            team_fit_score=self.scalars['team_fit_score'][i],
+            pickup_stats=stats['pickup'] if self.has_pickup[i] else None,
+            annotation=self.scalars['annotation'][i]
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Colonnes scalaires puis <fenêtre>_<stat> (pickup_* seulement si renseigné)"""
+        columns = {name: values for name, values in self.scalars.items()}
+        windows = FA_STAT_WINDOWS if self.has_pickup[:self.size].any() else FA_STAT_WINDOWS[:-1]
+        for window in windows:
+            matrix = self.window(window)
+            if window == 'pickup':
+                matrix = np.where(self.has_pickup[:self.size, None], matrix, np.nan)
+            for j, key in enumerate(self.stat_keys):
+                columns[f"{window}_{key}"] = matrix[:, j]
+        return pd.DataFrame(columns)
+
+    def to_arrow(self):
+        return _arrow_table(self.to_frame())
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self.has_pickup)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for window, matrix in self.stats.items():
+            grown = np.zeros((capacity, len(self.stat_keys)))
+            grown[:self.size] = matrix[:self.size]
+            self.stats[window] = grown
+        grown_mask = np.zeros(capacity, dtype=bool)
+        grown_mask[:self.size] = self.has_pickup[:self.size]
+        self.has_pickup = grown_mask
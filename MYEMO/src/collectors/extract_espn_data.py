@@ -4,10 +4,14 @@ Extraction Améliorée ESPN
 Script pour extraire correctement les données ESPN
 """
 
-import requests
 import json
 from datetime import datetime
 
+try:
+    from collectors.http_cache import get_default_client
+except ImportError:  # Exécution directe depuis src/collectors
+    from http_cache import get_default_client
+
 def extract_league_data():
     """Extraction améliorée des données de ligue"""
     print("🔍 EXTRACTION AMÉLIORÉE ESPN")
@@ -22,9 +26,14 @@ def extract_league_data():
     
     try:
         print(f"🌐 Endpoint : {endpoint}")
-        response = requests.get(endpoint, timeout=10)
+        response = get_default_client().get(endpoint, timeout=10)
         print(f"📊 Status : {response.status_code}")
         
+        if response.status_code == 200 and response.not_modified:
+            # Réponse identique à la précédente (304 ou cache) : pas de nouvelle analyse
+            print(f"♻️ Données inchangées depuis la dernière extraction (cache)")
+            return response.json()
+        
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Données récupérées")
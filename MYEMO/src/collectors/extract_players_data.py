@@ -4,23 +4,62 @@ Extraction des Données des Joueurs ESPN
 Script pour extraire les données des joueurs et statistiques
 """
 
+import asyncio
 import requests
 import json
 import pandas as pd
 from datetime import datetime
 import os
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from collectors.http_cache import CachedHTTPClient
+except ImportError:  # Exécution directe depuis src/collectors
+    from http_cache import CachedHTTPClient
+from utils.rate_limiter import RETRY_STATUSES, get_backoff_policy, get_rate_limiter, mount_rate_limiting
 
 # Configuration
 LEAGUE_ID = 1557635339
 SEASON = 2026
 MY_TEAM_ABBREV = "NC99"
 
+# Réseau
+MAX_CONCURRENT_REQUESTS = 8  # Requêtes simultanées vers ESPN
+REQUEST_TIMEOUT = 15  # Secondes par requête
+CACHE_TTL = 300  # Secondes pendant lesquelles une réponse en cache est servie sans requête
+
+LEAGUE_URL = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/FBA/seasons/{SEASON}/segments/0/leagues/{LEAGUE_ID}"
+
+_session = None
+_http_client = None
+
+def get_session():
+    """Session HTTP partagée (connexions keep-alive réutilisées entre les requêtes)"""
+    global _session
+    if _session is None:
+        # Budget par hôte + reprises sur 429/5xx
+        _session = mount_rate_limiting(requests.Session(), pool_connections=1,
+                                       pool_maxsize=MAX_CONCURRENT_REQUESTS)
+    return _session
+
+def get_http_client():
+    """Cache HTTP disque (TTL + ETag/If-Modified-Since) au-dessus de la session partagée"""
+    global _http_client
+    if _http_client is None:
+        _http_client = CachedHTTPClient(default_ttl=CACHE_TTL, timeout=REQUEST_TIMEOUT, session=get_session())
+    return _http_client
+
 def get_team_roster(team_id):
     """Récupère le roster d'une équipe"""
-    url = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/FBA/seasons/{SEASON}/segments/0/leagues/{LEAGUE_ID}/teams/{team_id}"
+    url = f"{LEAGUE_URL}/teams/{team_id}"
     
     try:
-        response = requests.get(url)
+        response = get_http_client().get(url)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -29,16 +68,77 @@ def get_team_roster(team_id):
 
 def get_league_standings():
     """Récupère le classement de la ligue"""
-    url = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/FBA/seasons/{SEASON}/segments/0/leagues/{LEAGUE_ID}"
-    
     try:
-        response = requests.get(url)
+        response = get_http_client().get(LEAGUE_URL)
         response.raise_for_status()
         return response.json()
     except Exception as e:
         print(f"❌ Erreur classement : {e}")
         return None
 
+async def _fetch_json(session, url, label):
+    """GET asynchrone via le cache HTTP ; None en cas d'erreur (comme les versions synchrones)"""
+    cache = get_http_client()
+    limiter, policy = get_rate_limiter(), get_backoff_policy()
+    host = urlsplit(url).hostname
+    try:
+        cached, conditional_headers = cache.lookup(url)
+        attempt = 0
+        while cached is None:
+            # Même budget par hôte que les requêtes synchrones, attente non bloquante
+            await asyncio.sleep(limiter.reserve(host))
+            async with session.get(url, headers=conditional_headers) as response:
+                if response.status in RETRY_STATUSES and attempt < policy.max_retries:
+                    wait = policy.delay(attempt, float(response.headers.get('Retry-After', 0) or 0))
+                    limiter.record_backoff(host, wait)
+                    await asyncio.sleep(wait)
+                    attempt += 1
+                    continue
+                cached = cache.store(url, response.status, response.headers, await response.read())
+        cached.raise_for_status()
+        return cached.json()
+    except Exception as e:
+        print(f"❌ Erreur {label} : {e}")
+        return None
+
+async def fetch_league_async(team_ids=None, max_concurrency=MAX_CONCURRENT_REQUESTS, timeout=REQUEST_TIMEOUT):
+    """Récupère le classement et tous les rosters en parallèle sur une session keep-alive.
+
+    Si team_ids est fourni, classement et rosters partent dans le même lot ;
+    sinon les identifiants sont lus dans le classement avant de lancer les rosters.
+    Retourne (league_data, {team_id: roster_data ou None}).
+    """
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        if team_ids is None:
+            league_data = await _fetch_json(session, LEAGUE_URL, "classement")
+            team_ids = [team.get('id') for team in (league_data or {}).get('teams', [])]
+            rosters = await asyncio.gather(*[
+                _fetch_json(session, f"{LEAGUE_URL}/teams/{team_id}", f"pour l'équipe {team_id}")
+                for team_id in team_ids
+            ])
+        else:
+            league_data, *rosters = await asyncio.gather(
+                _fetch_json(session, LEAGUE_URL, "classement"),
+                *[_fetch_json(session, f"{LEAGUE_URL}/teams/{team_id}", f"pour l'équipe {team_id}")
+                  for team_id in team_ids]
+            )
+    return league_data, dict(zip(team_ids, rosters))
+
+def fetch_league_sync(team_ids=None):
+    """Même résultat que fetch_league_async, requête par requête sur la session partagée"""
+    league_data = get_league_standings()
+    if team_ids is None:
+        team_ids = [team.get('id') for team in (league_data or {}).get('teams', [])]
+    return league_data, {team_id: get_team_roster(team_id) for team_id in team_ids}
+
+def fetch_league_data(team_ids=None, use_async=True):
+    """Classement + rosters : mode asynchrone si aiohttp est installé, sinon synchrone"""
+    if use_async and aiohttp is not None:
+        return asyncio.run(fetch_league_async(team_ids))
+    return fetch_league_sync(team_ids)
+
 def extract_player_data(roster_data):
     """Extrait les données des joueurs"""
     players = []
@@ -132,9 +232,9 @@ def main():
     print("🏀 EXTRACTION DES DONNÉES DES JOUEURS ESPN")
     print("=" * 60)
     
-    # Récupérer les données de la ligue
-    print("📡 Récupération des données de la ligue...")
-    league_data = get_league_standings()
+    # Récupérer les données de la ligue et les rosters de toutes les équipes en parallèle
+    print("📡 Récupération des données de la ligue et des rosters...")
+    league_data, rosters = fetch_league_data()
     
     if not league_data:
         print("❌ Impossible de récupérer les données de la ligue")
@@ -156,7 +256,7 @@ def main():
         
         print(f"   📋 Équipe {team_abbrev} (ID: {team_id})...")
         
-        roster_data = get_team_roster(team_id)
+        roster_data = rosters.get(team_id)
         if roster_data:
             players = extract_player_data(roster_data)
             all_players.extend(players)
@@ -1,34 +1,102 @@
 import os
 import pandas as pd
 from datetime import datetime
+from collectors.storage import get_storage, history_key_columns
+from utils.file_lock import LOCK_DIR, file_lock
+from utils.instrumentation import add_rows
 
 class FileManager:
-    def __init__(self, base_path: str):
+    # Table "dernier état" matérialisée à côté de chaque historique
+    LATEST_SUFFIX = '.latest.csv'
+
+    def __init__(self, base_path: str, backend: str = 'csv'):
         self.base_path = base_path
+        self.storage = get_storage(backend, base_path)
 
     def append_or_create(self, df: pd.DataFrame, file_path: str) -> None:
-        """Ajoute les données au fichier existant ou crée un nouveau fichier si nécessaire."""
-        full_path = os.path.join(self.base_path, file_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-
-        if os.path.exists(full_path):
-            # Charger les données existantes
-            existing_df = pd.read_csv(full_path)
-            
-            # Combiner avec les nouvelles données
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            
-            # Supprimer les doublons potentiels basés sur la date et l'identifiant unique
-            if 'date' in combined_df.columns:
-                # Pour les classements d'équipe
-                if 'team' in combined_df.columns:
-                    combined_df = combined_df.drop_duplicates(subset=['date', 'team'], keep='last')
-                # Pour les données de joueurs
-                elif 'player' in combined_df.columns:
-                    combined_df = combined_df.drop_duplicates(subset=['date', 'player'], keep='last')
-            
-            # Sauvegarder le fichier mis à jour
-            combined_df.to_csv(full_path, index=False)
+        """Ajoute les données à l'historique existant ou le crée si nécessaire.
+
+        La table "dernier état" (une ligne par équipe/joueur) est mise à jour
+        au moment de l'écriture avec les lignes effectivement ajoutées.
+        Un verrou par fichier sérialise les écritures concurrentes (autres
+        travaux, autres processus).
+        """
+        with file_lock(file_path, os.path.join(self.base_path, LOCK_DIR)):
+            had_history = self.storage.exists(file_path)
+            written = self.storage.append(df, file_path)
+            add_rows(len(written))
+
+            if had_history and not os.path.exists(self._latest_path(file_path)):
+                # Historique antérieur à la table matérialisée : construction unique
+                self._write_latest(self._latest_from_history(file_path), file_path)
+            else:
+                self._update_latest(written, file_path)
+
+    def exists(self, file_path: str) -> bool:
+        return self.storage.exists(file_path)
+
+    def columns(self, file_path: str) -> list:
+        return self.storage.columns(file_path)
+
+    def read_history(self, file_path: str, columns: list = None, filters: list = None,
+                     partitions: int = None) -> pd.DataFrame:
+        """Lit l'historique (projection des colonnes, filtres (colonne, op, valeur), N dernières dates)"""
+        return self.storage.read(file_path, columns=columns, filters=filters, partitions=partitions)
+
+    def load_latest(self, file_path: str, key_columns: list, columns: list = None,
+                    partitions: int = None) -> pd.DataFrame:
+        """Dernière ligne connue pour chaque clé (équipe, joueur...) de l'historique.
+
+        Lit la table "dernier état" matérialisée (O(équipes + joueurs)) ; l'historique
+        complet n'est parcouru qu'une fois, pour la construire si elle manque.
+        """
+        if columns is not None:
+            columns = list(dict.fromkeys(['date'] + key_columns + list(columns)))
+
+        latest_path = self._latest_path(file_path)
+        if os.path.exists(latest_path):
+            df = pd.read_csv(latest_path, dtype={'date': str})
         else:
-            # Créer un nouveau fichier
-            df.to_csv(full_path, index=False)
+            df = self._latest_from_history(file_path, partitions=partitions)
+            if partitions is None:
+                self._write_latest(df, file_path)
+
+        if columns is not None:
+            df = df[[col for col in columns if col in df.columns]]
+        return df.sort_values('date', kind='stable').groupby(key_columns).last().reset_index()
+
+    def _latest_path(self, file_path: str) -> str:
+        return os.path.join(self.base_path, os.path.splitext(file_path)[0] + self.LATEST_SUFFIX)
+
+    def _entity_columns(self, columns) -> list:
+        return [col for col in history_key_columns(columns) if col != 'date']
+
+    def _latest_from_history(self, file_path: str, partitions: int = None) -> pd.DataFrame:
+        """Reconstruit le dernier état à partir de l'historique complet"""
+        df = self.read_history(file_path, partitions=partitions)
+        entity_columns = self._entity_columns(df.columns)
+        if not entity_columns:
+            return df.iloc[0:0]
+        return df.sort_values('date', kind='stable').drop_duplicates(entity_columns, keep='last')
+
+    def _update_latest(self, written: pd.DataFrame, file_path: str) -> None:
+        """Fusionne les lignes écrites dans la table "dernier état" (O(entités))"""
+        entity_columns = self._entity_columns(written.columns)
+        if not entity_columns or written.empty:
+            return
+
+        written = written.astype({'date': str})
+        latest_path = self._latest_path(file_path)
+        if os.path.exists(latest_path):
+            latest = pd.read_csv(latest_path, dtype={'date': str})
+            written = pd.concat([latest, written], ignore_index=True)
+
+        written = written.sort_values('date', kind='stable').drop_duplicates(entity_columns, keep='last')
+        self._write_latest(written, file_path)
+
+    def _write_latest(self, df: pd.DataFrame, file_path: str) -> None:
+        latest_path = self._latest_path(file_path)
+        os.makedirs(os.path.dirname(latest_path), exist_ok=True)
+        tmp_path = latest_path + '.tmp'
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, latest_path)
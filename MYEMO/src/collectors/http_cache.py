@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Cache HTTP sur disque pour les endpoints ESPN
+Réponses stockées avec une durée de vie (TTL) et requêtes conditionnelles
+(ETag / If-Modified-Since) : sur un 304 le corps en cache est réutilisé.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+try:
+    from utils.rate_limiter import mount_rate_limiting
+except ImportError:  # Exécution directe (src/ absent du chemin)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from utils.rate_limiter import mount_rate_limiting
+
+DEFAULT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/cache/http'))
+
+
+@dataclass
+class CachedResponse:
+    """Réponse HTTP servie par le réseau ou par le cache"""
+    url: str
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False  # Corps lu sur disque (TTL valide ou 304)
+    not_modified: bool = False  # Contenu identique à la réponse précédente
+    cache_key: str = ''
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class CachedHTTPClient:
+    """Client GET partagé : cache disque + TTL + requêtes conditionnelles"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, default_ttl: float = 300,
+                 timeout: float = 10, session: requests.Session = None):
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        if isinstance(self.session, requests.Session):
+            # Budget par hôte + reprises sur 429/5xx, sur cette session uniquement
+            mount_rate_limiting(self.session)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get(self, url: str, params: Dict = None, headers: Dict = None, ttl: float = None,
+            timeout: float = None) -> CachedResponse:
+        """GET avec cache.
+
+        - entrée plus jeune que le TTL : servie sans requête réseau
+        - sinon requête conditionnelle ; 304 (ou corps identique) -> not_modified
+        """
+        cached, conditional_headers = self.lookup(url, params=params, ttl=ttl)
+        if cached is not None:
+            return cached
+
+        response = self.session.get(url, params=params, headers={**(headers or {}), **conditional_headers},
+                                    timeout=self.timeout if timeout is None else timeout)
+        return self.store(url, response.status_code, response.headers, response.content, params=params)
+
+    def lookup(self, url: str, params: Dict = None, ttl: float = None) -> Tuple[Optional[CachedResponse], Dict]:
+        """(réponse du cache si encore valide, en-têtes conditionnels pour la requête sinon)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        key = self._cache_key(url, params)
+        meta = self._load_meta(key)
+        if meta is None:
+            return None, {}
+        if time.time() - meta['stored_at'] < ttl:
+            return self._cached_response(key, meta), {}
+
+        conditional_headers = {}
+        if meta.get('etag'):
+            conditional_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = meta['last_modified']
+        return None, conditional_headers
+
+    def store(self, url: str, status_code: int, headers, content: bytes, params: Dict = None) -> CachedResponse:
+        """Enregistre une réponse réseau (requests ou aiohttp) et la compare au cache"""
+        key = self._cache_key(url, params)
+        meta = self._load_meta(key)
+
+        if status_code == 304 and meta is not None:
+            meta['stored_at'] = time.time()
+            self._write_meta(key, meta)
+            return self._cached_response(key, meta)
+
+        digest = hashlib.sha256(content).hexdigest()
+        if status_code == 200:
+            self._store(key, url, headers, content, digest)
+
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            content=content,
+            headers=dict(headers),
+            not_modified=meta is not None and meta.get('sha256') == digest,
+            cache_key=key
+        )
+
+    def get_parsed(self, url: str, parser: Callable[[CachedResponse], object], **kwargs) -> Tuple[object, CachedResponse]:
+        """GET + parsing ; le résultat (JSON-sérialisable) est réutilisé tant que la réponse ne change pas"""
+        response = self.get(url, **kwargs)
+        parsed_path = self._path(response.cache_key, '.parsed.json')
+
+        if response.not_modified and os.path.exists(parsed_path):
+            with open(parsed_path, 'r', encoding='utf-8') as f:
+                return json.load(f), response
+
+        parsed = parser(response)
+        if response.status_code == 200 and parsed is not None:
+            try:
+                self._write_json(parsed_path, parsed)
+            except (TypeError, ValueError):
+                pass  # Résultat non sérialisable : simplement non mis en cache
+        return parsed, response
+
+    def invalidate(self, url: str, params: Dict = None) -> None:
+        key = self._cache_key(url, params)
+        for suffix in ('.json', '.body', '.parsed.json'):
+            path = self._path(key, suffix)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _cache_key(self, url: str, params: Dict = None) -> str:
+        raw = url + '?' + json.dumps(params or {}, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _load_meta(self, key: str) -> Optional[Dict]:
+        meta_path = self._path(key, '.json')
+        if not os.path.exists(meta_path) or not os.path.exists(self._path(key, '.body')):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cached_response(self, key: str, meta: Dict) -> CachedResponse:
+        with open(self._path(key, '.body'), 'rb') as f:
+            content = f.read()
+        return CachedResponse(
+            url=meta['url'],
+            status_code=200,
+            content=content,
+            headers=meta.get('headers', {}),
+            from_cache=True,
+            not_modified=True,
+            cache_key=key
+        )
+
+    def _store(self, key: str, url: str, headers, content: bytes, digest: str) -> None:
+        body_path = self._path(key, '.body')
+        with open(body_path + '.tmp', 'wb') as f:
+            f.write(content)
+        os.replace(body_path + '.tmp', body_path)
+        self._write_meta(key, {
+            'url': url,
+            'stored_at': time.time(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'sha256': digest,
+            'headers': {k: v for k, v in headers.items() if k.lower() == 'content-type'}
+        })
+
+    def _write_meta(self, key: str, meta: Dict) -> None:
+        self._write_json(self._path(key, '.json'), meta)
+
+    def _write_json(self, path: str, data) -> None:
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+
+
+_default_client = None
+
+def get_default_client() -> CachedHTTPClient:
+    """Client partagé par les scripts d'extraction"""
+    global _default_client
+    if _default_client is None:
+        _default_client = CachedHTTPClient()
+    return _default_client
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Enregistrement / rejeu des réponses ESPN d'une ligue
+Mode record : chaque réponse JSON brute est ajoutée à une archive JSONL gzip
+(un membre gzip par réponse : écriture en O(1), archive lisible même si la
+collecte s'interrompt).
+Mode replay : la même League (équipes, joueurs...) est reconstruite depuis
+l'archive, sans réseau, pour profiler et tester la collecte hors ligne.
+
+Sélection du mode par variable d'environnement :
+    ESPN_LEAGUE_MODE=live|record|replay   (défaut : live)
+    ESPN_REPLAY_ARCHIVE=chemin.jsonl.gz   (défaut : data/replay/, dernière archive en replay)
+"""
+
+import glob
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Optional
+
+from espn_api.basketball import League
+import requests
+from espn_api.requests.espn_requests import EspnFantasyRequests, checkRequestStatus
+
+try:
+    from utils.rate_limiter import mount_rate_limiting
+except ImportError:  # Exécution directe (src/ absent du chemin)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from utils.rate_limiter import mount_rate_limiting
+
+LEAGUE_MODES = ('live', 'record', 'replay')
+DEFAULT_REPLAY_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/replay'))
+
+
+class ReplayMissError(KeyError):
+    """Requête absente de l'archive de rejeu"""
+
+
+def request_key(method: str, extend: str, params: Optional[Dict], headers: Optional[Dict]) -> str:
+    """Clé stable d'une requête ESPN (méthode, chemin, paramètres, en-têtes)"""
+    return json.dumps([method, extend or '', params or {}, headers or {}], sort_keys=True)
+
+
+class RateLimitedRequests(EspnFantasyRequests):
+    """Requêtes ESPN réelles via une session propre (budget ESPN + reprises sur 429/5xx)
+
+    espn_api appelle requests.get directement : league_get / get sont repris
+    à l'identique, mais sur une session où l'adaptateur limité est monté.
+    """
+
+    def __init__(self, inner: EspnFantasyRequests, session: requests.Session = None):
+        self.__dict__.update(inner.__dict__)
+        self.session = mount_rate_limiting(session or requests.Session())
+
+    def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        endpoint = self.LEAGUE_ENDPOINT + extend
+        r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        checkRequestStatus(r.status_code, cookies=self.cookies, league_id=self.league_id)
+        data = r.json()
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data if self.year > 2017 else data[0]
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        endpoint = self.ENDPOINT + extend
+        r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        checkRequestStatus(r.status_code)
+        data = r.json()
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data
+
+
+class RecordingRequests(RateLimitedRequests):
+    """Requêtes ESPN réelles, dont chaque réponse est ajoutée à l'archive"""
+
+    def __init__(self, inner: EspnFantasyRequests, archive_path: str):
+        super().__init__(inner)
+        self.archive_path = archive_path
+        self.responses = {}
+        start_archive(archive_path, self.league_id, self.year)
+
+    def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        data = super().league_get(params=params, headers=headers, extend=extend)
+        self._record(request_key('league_get', extend, params, headers), data)
+        return data
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        data = super().get(params=params, headers=headers, extend=extend)
+        self._record(request_key('get', extend, params, headers), data)
+        return data
+
+    def _record(self, key: str, data) -> None:
+        self.responses[key] = data
+        append_response(self.archive_path, key, data)
+
+
+class ReplayRequests(EspnFantasyRequests):
+    """Requêtes ESPN servies depuis une archive enregistrée"""
+
+    def __init__(self, inner: EspnFantasyRequests, responses: Dict):
+        self.__dict__.update(inner.__dict__)
+        self.responses = responses
+
+    def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        return self._replay(request_key('league_get', extend, params, headers))
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        return self._replay(request_key('get', extend, params, headers))
+
+    def _replay(self, key: str):
+        if key not in self.responses:
+            raise ReplayMissError(f"Requête absente de l'archive : {key}")
+        return self.responses[key]
+
+
+def start_archive(path: str, league_id: int, year: int) -> None:
+    """Crée l'archive avec sa ligne d'en-tête (ligue, saison, date d'enregistrement)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'league_id': league_id, 'year': year,
+                            'recorded_at': datetime.now().isoformat()}) + '\n')
+
+
+def append_response(path: str, key: str, data) -> None:
+    """Ajoute une réponse en fin d'archive (nouveau membre gzip, le reste n'est pas relu)"""
+    with gzip.open(path, 'at', encoding='utf-8') as f:
+        f.write(json.dumps({'key': key, 'data': data}) + '\n')
+
+
+def load_archive(path: str) -> Dict:
+    """En-tête + réponses {clé: données} ; une requête enregistrée deux fois garde la dernière réponse"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        responses = {}
+        try:
+            for line in f:
+                record = json.loads(line)
+                responses[record['key']] = record['data']
+        except (EOFError, json.JSONDecodeError):
+            pass  # Dernière réponse tronquée (collecte interrompue en pleine écriture)
+    return dict(header, responses=responses)
+
+
+def default_archive_path(league_id: int, year: int) -> str:
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(DEFAULT_REPLAY_DIR, f'league_{league_id}_{year}_{timestamp}.jsonl.gz')
+
+
+def latest_archive_path(league_id: int, year: int) -> Optional[str]:
+    archives = sorted(glob.glob(os.path.join(DEFAULT_REPLAY_DIR, f'league_{league_id}_{year}_*.jsonl.gz')))
+    return archives[-1] if archives else None
+
+
+def open_league(league_id: int, year: int, mode: str = None, archive_path: str = None) -> League:
+    """Construit la League ESPN en mode live, record ou replay (voir l'en-tête du module)"""
+    mode = (mode or os.getenv('ESPN_LEAGUE_MODE', 'live')).lower()
+    archive_path = archive_path or os.getenv('ESPN_REPLAY_ARCHIVE')
+    if mode not in LEAGUE_MODES:
+        raise ValueError(f"Mode de ligue inconnu : {mode} (attendu : {', '.join(LEAGUE_MODES)})")
+
+    league = League(league_id=league_id, year=year, fetch_league=False)
+    if mode == 'live':
+        league.espn_request = RateLimitedRequests(league.espn_request)
+    elif mode == 'record':
+        league.espn_request = RecordingRequests(
+            league.espn_request, archive_path or default_archive_path(league_id, year)
+        )
+    else:
+        archive_path = archive_path or latest_archive_path(league_id, year)
+        if archive_path is None:
+            raise FileNotFoundError(f"Aucune archive de rejeu pour la ligue {league_id} ({year}) dans {DEFAULT_REPLAY_DIR}")
+        league.espn_request = ReplayRequests(league.espn_request, load_archive(archive_path)['responses'])
+
+    league.fetch_league()
+    return league
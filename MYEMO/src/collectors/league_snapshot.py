@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from processors.category_matrix import CategoryMatrix
+
+
+def player_category_averages(player) -> Optional[Dict]:
+    """Moyennes par catégorie d'un joueur (nine_cat_averages, sinon stats de la saison)"""
+    if hasattr(player, 'nine_cat_averages'):
+        return player.nine_cat_averages
+    if hasattr(player, 'stats') and '2026_total' in player.stats:
+        return player.stats['2026_total']['avg']
+    return None
+
+
+def is_bench_player(player) -> bool:
+    return getattr(player, 'slot_position', None) == 'BE'
+
+
+@dataclass(frozen=True)
+class LeagueRunSnapshot:
+    """Vue figée de la ligue, récupérée une seule fois par exécution de collecte"""
+    fetched_at: str
+    standings: Tuple  # Équipes triées par classement
+    teams: Tuple
+    rosters: Mapping[int, Tuple]  # team_id -> joueurs
+    free_agents: Tuple
+    stat_ranks: Mapping[str, Mapping[int, int]]  # stat -> team_id -> rang
+    categories: CategoryMatrix  # joueurs des rosters × STATS_CATEGORIES
+
+    @classmethod
+    def fetch(cls, league, stats_categories: List[str]) -> 'LeagueRunSnapshot':
+        """Interroge la ligue (classement, équipes, rosters, agents libres) une seule fois"""
+        standings = tuple(league.standings())
+        teams = tuple(league.teams)
+        rosters = {team.team_id: tuple(team.roster) for team in teams}
+        return cls(
+            fetched_at=datetime.now().isoformat(),
+            standings=standings,
+            teams=teams,
+            rosters=MappingProxyType(rosters),
+            free_agents=tuple(league.free_agents()),
+            stat_ranks=MappingProxyType(cls._compute_stat_ranks(standings, stats_categories)),
+            categories=CategoryMatrix.from_rosters(
+                stats_categories, rosters.items(), player_category_averages, is_bench_player
+            )
+        )
+
+    @staticmethod
+    def _compute_stat_ranks(standings: Tuple, stats_categories: List[str]) -> Dict[str, Mapping[int, int]]:
+        """Calcule les rangs de toutes les équipes en un seul argsort (équipes × stats)"""
+        values = np.array([
+            [float(getattr(team, f'stats_{stat.lower()}', 0) or 0) for stat in stats_categories]
+            for team in standings
+        ]).reshape(len(standings), len(stats_categories))
+        ranks = CategoryMatrix.rank(values)
+        return {
+            stat: MappingProxyType({team.team_id: int(ranks[i, j]) for i, team in enumerate(standings)})
+            for j, stat in enumerate(stats_categories)
+        }
+
+    def roster(self, team) -> Tuple:
+        return self.rosters.get(team.team_id, ())
+
+    def stat_rank(self, team, stat: str) -> int:
+        return self.stat_ranks.get(stat, {}).get(team.team_id, 0)
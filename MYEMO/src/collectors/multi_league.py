@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Collecte de plusieurs ligues dans un seul processus
+- Liste des ligues : LEAGUES de config/settings.py, ou fichier JSON
+  ([{"league_id": ..., "season": ..., "my_team": ...}, ...])
+- Chaque ligue est collectée par un DataCollector dans son propre espace
+  de données (data/raw/<league_id>/, data/cache/<league_id>/)
+- Pool borné de threads (défaut : l'attente réseau domine) ou de processus
+- Un résumé des temps par ligue et par étape : logs/metrics/multi_league_<horodatage>.csv
+
+Usage :
+    PYTHONPATH=src python src/collectors/multi_league.py --workers 4
+    PYTHONPATH=src python src/collectors/multi_league.py --config leagues.json --processes
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+try:
+    from collectors.collect_data import DataCollector
+    from utils.instrumentation import PipelineMetrics
+except ImportError:  # Exécution directe (src/ absent du chemin)
+    sys.path.insert(0, os.path.join(BASE_PATH, 'src'))
+    from collectors.collect_data import DataCollector
+    from utils.instrumentation import PipelineMetrics
+
+
+@dataclass(frozen=True)
+class LeagueConfig:
+    """Une ligue à collecter"""
+    league_id: int
+    season: int
+    my_team: str
+
+    @property
+    def namespace(self) -> str:
+        """Sous-dossier des données de la ligue (data/raw/<league_id>/)"""
+        return str(self.league_id)
+
+
+def _settings():
+    """Module config/settings.py (racine du projet ajoutée au chemin si besoin)"""
+    if BASE_PATH not in sys.path:
+        sys.path.insert(0, BASE_PATH)
+    from config import settings
+    return settings
+
+
+def load_league_configs(path: str = None) -> List[LeagueConfig]:
+    """Ligues du fichier JSON, sinon LEAGUES de config/settings.py"""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    else:
+        entries = _settings().LEAGUES
+    configs = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            configs.append(LeagueConfig(int(entry['league_id']), int(entry['season']), entry['my_team']))
+        else:
+            league_id, season, my_team = entry
+            configs.append(LeagueConfig(int(league_id), int(season), my_team))
+    if len({config.namespace for config in configs}) < len(configs):
+        raise ValueError("Une même ligue apparaît plusieurs fois dans la configuration")
+    return configs
+
+
+def collect_league(config: LeagueConfig, base_path: str = BASE_PATH, today: str = None,
+                   league_factory: Callable[[LeagueConfig], object] = None) -> Dict:
+    """Collecte complète d'une ligue ; retourne ses temps par étape (sans lever d'exception).
+
+    league_factory : construit la League (ligue synthétique, rejeu) ; défaut : ESPN
+    (ESPN_LEAGUE_MODE respecté).
+    """
+    metrics = PipelineMetrics(f'collect_data_{config.namespace}', os.path.join(base_path, 'logs'))
+    start = time.perf_counter()
+    error = None
+    try:
+        with metrics.stage('connect'):
+            collector = DataCollector(
+                league=league_factory(config) if league_factory else None,
+                base_path=base_path, today=today, league_id=config.league_id,
+                season=config.season, my_team=config.my_team, namespace=config.namespace
+            )
+        collector.run_collection(metrics)
+    except Exception as e:
+        error = str(e)
+        logging.getLogger(__name__).error(f"❌ Ligue {config.league_id} : {error}")
+    finally:
+        metrics.write()
+    return {
+        'league_id': config.league_id,
+        'season': config.season,
+        'my_team': config.my_team,
+        'status': 'error' if error else 'ok',
+        'error': error,
+        'total_s': round(time.perf_counter() - start, 6),
+        'rows_written': sum(stage.rows_written for stage in metrics.stages),
+        # Temps réel par étape (réseau et CPU sont partagés entre threads : voir les métriques du processus)
+        'stages': {stage.stage: stage.wall_s for stage in metrics.stages},
+    }
+
+
+def collect_leagues(configs: Sequence[LeagueConfig], base_path: str = BASE_PATH, workers: int = 4,
+                    use_processes: bool = False, today: str = None,
+                    league_factory: Callable[[LeagueConfig], object] = None) -> List[Dict]:
+    """Collecte toutes les ligues avec au plus `workers` ligues en parallèle (ordre de configs conservé)"""
+    if not configs:
+        return []
+    workers = max(1, min(workers, len(configs)))
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as pool:
+        futures = [pool.submit(collect_league, config, base_path, today, league_factory) for config in configs]
+        return [future.result() for future in futures]
+
+
+def write_summary(results: Sequence[Dict], base_path: str = BASE_PATH) -> str:
+    """Résumé CSV (une ligne par ligue, une colonne par étape) dans logs/metrics/"""
+    stages = list(dict.fromkeys(stage for result in results for stage in result['stages']))
+    metrics_dir = os.path.join(base_path, 'logs', 'metrics')
+    os.makedirs(metrics_dir, exist_ok=True)
+    path = os.path.join(metrics_dir, f"multi_league_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+    fieldnames = ['league_id', 'season', 'my_team', 'status', 'total_s', 'rows_written'] + \
+        [f"{stage}_s" for stage in stages] + ['error']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for result in results:
+            row = {key: result[key] for key in fieldnames if key in result}
+            row.update({f"{stage}_s": wall_s for stage, wall_s in result['stages'].items()})
+            writer.writerow(row)
+    return path
+
+
+def format_summary(results: Sequence[Dict]) -> str:
+    lines = [f"{'Ligue':<14} {'Saison':>6} {'Statut':>7} {'Temps':>8} {'Lignes':>8}  Étape la plus lente"]
+    for result in results:
+        slowest = max(result['stages'].items(), key=lambda item: item[1], default=('-', 0.0))
+        lines.append(f"{result['league_id']:<14} {result['season']:>6} {result['status']:>7} "
+                     f"{result['total_s']:>7.2f}s {result['rows_written']:>8}  {slowest[0]} ({slowest[1]:.2f}s)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Collecte de plusieurs ligues ESPN en parallèle")
+    parser.add_argument('--config', help="Fichier JSON des ligues (défaut : LEAGUES de config/settings.py)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Ligues collectées en parallèle (défaut : MULTI_LEAGUE_WORKERS)")
+    parser.add_argument('--processes', action='store_true', help="Pool de processus au lieu de threads")
+    args = parser.parse_args(argv)
+
+    configs = load_league_configs(args.config)
+    workers = args.workers if args.workers is not None else _settings().MULTI_LEAGUE_WORKERS
+
+    print(f"🚀 Collecte de {len(configs)} ligue(s), {workers} en parallèle "
+          f"({'processus' if args.processes else 'threads'})...")
+    start = time.perf_counter()
+    results = collect_leagues(configs, workers=workers, use_processes=args.processes)
+    summary_file = write_summary(results)
+    print(f"\n⏱️ Temps par ligue ({summary_file}, total {time.perf_counter() - start:.2f}s) :")
+    print(format_summary(results))
+    failed = [result for result in results if result['status'] != 'ok']
+    for result in failed:
+        print(f"❌ Ligue {result['league_id']} : {result['error']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
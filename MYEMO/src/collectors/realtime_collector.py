@@ -1,15 +1,29 @@
-import schedule
 import time
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
+from src.collectors.adaptive_polling import AdaptivePoller, PollingPolicy, game_windows
+from src.collectors.change_detection import (DEFAULT_EVENT_LOG, DEFAULT_STATE_PATH, ChangeDetector, EventLog,
+                                             league_entities)
 from src.collectors.data_collector import ESPNDataCollector
+from src.collectors.http_cache import CachedHTTPClient
 from config.settings import LEAGUE_ID, YEAR
 
 class RealTimeCollector:
-    def __init__(self):
+    LEAGUE_URL = f"https://lm-api-reads.fantasy.espn.com/apis/v3/games/FBA/seasons/{YEAR}/segments/0/leagues/{LEAGUE_ID}"
+    CHANGE_CHECK_VIEWS = ['mTeam', 'mRoster', 'mStandings']
+
+    def __init__(self, event_log_path: str = DEFAULT_EVENT_LOG, state_path: str = DEFAULT_STATE_PATH):
         self.collector = ESPNDataCollector(LEAGUE_ID, YEAR)
+        self.http = CachedHTTPClient(default_ttl=0)  # Toujours une requête conditionnelle
+        self.league_is_fresh = True  # Ligue chargée à la construction, pas encore collectée
+        # Seuls les changements (équipes, rosters, agents libres) sont écrits dans le journal
+        self.detector = ChangeDetector(state_path)
+        self.events = EventLog(event_log_path)
+        self.poller = AdaptivePoller()
         self.setup_logger()
+        # Fenêtres des matchs NBA des joueurs des rosters (ligue déjà chargée)
+        self.windows = self.current_game_windows()
         
     def setup_logger(self):
         log_dir = Path("logs/realtime")
@@ -22,43 +36,69 @@ class RealTimeCollector:
         )
         self.logger = logging.getLogger(__name__)
 
-    def collect_all_data(self):
-        """Collecte toutes les données en une fois"""
+    def current_game_windows(self):
+        return game_windows(player for team in self.collector.league.teams for player in team.roster)
+
+    def league_has_changed(self) -> bool:
+        """Requête conditionnelle sur la ligue : False si la réponse est identique à la précédente"""
+        try:
+            response = self.http.get(self.LEAGUE_URL, params={'view': self.CHANGE_CHECK_VIEWS})
+            response.raise_for_status()
+            return not response.not_modified
+        except Exception as e:
+            self.logger.warning(f"Vérification des changements impossible, collecte forcée: {str(e)}")
+            return True
+
+    def collect_all_data(self) -> bool:
+        """Collecte toutes les données en une fois ; True si la ligue a changé"""
         try:
             current_time = datetime.now().strftime("%H:%M:%S")
+            if not self.league_has_changed():
+                self.logger.info(f"Ligue inchangée à {current_time}, collecte ignorée")
+                return False
+            
             self.logger.info(f"Début de la collecte à {current_time}")
+            if not self.league_is_fresh:
+                self.collector.league.fetch_league()
+            self.league_is_fresh = False
 
-            # Collecte des classements
-            standings_df = self.collector.collect_daily_standings()
-            standings_df.to_csv(f"data/raw/standings/standings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv", index=False)
-
-            # Collecte des rosters
-            rosters_df = self.collector.collect_roster_data()
-            rosters_df.to_csv(f"data/raw/rosters/rosters_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv", index=False)
-
-            # Collecte des agents libres
-            fa_df = self.collector.collect_free_agents()
-            fa_df.to_csv(f"data/raw/free_agents/fa_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv", index=False)
+            # Empreintes des équipes, joueurs des rosters et agents libres : événements de changement uniquement
+            entities = league_entities(self.collector.league.teams, self.collector.league.free_agents())
+            events = self.events.append(self.detector.detect(entities))
+            self.detector.save()
+            self.logger.info(f"{len(events)} événement(s) sur {len(entities)} entités")
 
             self.logger.info("Collecte terminée avec succès")
+            return bool(events)
         except Exception as e:
             self.logger.error(f"Erreur lors de la collecte: {str(e)}")
+            return False
+
+    def poll_once(self) -> float:
+        """Une collecte ; retourne le délai (secondes) avant la suivante"""
+        changed = self.collect_all_data()
+        # Recalculées à chaque collecte, même sans changement (cache conditionnel conservé sur disque
+        # après un redémarrage : la première réponse peut déjà être « non modifiée »)
+        self.windows = self.current_game_windows()
+        now = datetime.now()
+        delay = self.poller.next_delay(now, changed, self.windows)
+        self.logger.info(f"Prochaine collecte dans {delay / 60:.1f} min ({self.poller.describe(now, self.windows)})")
+        return delay
 
     def start_collection(self, interval_minutes: int = 30):
-        """Démarre la collecte en temps réel avec un intervalle spécifié"""
-        self.logger.info(f"Démarrage de la collecte en temps réel (intervalle: {interval_minutes} minutes)")
-        
-        # Première collecte immédiate
-        self.collect_all_data()
-        
-        # Planification des collectes suivantes
-        schedule.every(interval_minutes).minutes.do(self.collect_all_data)
+        """Démarre la collecte en temps réel
+
+        Toutes les 2 minutes pendant les matchs NBA des joueurs des rosters,
+        toutes les interval_minutes hors match ; l'intervalle double tant que
+        la ligue ne change pas (sans dépasser le prochain tip-off).
+        """
+        self.poller = AdaptivePoller(PollingPolicy(idle_interval=interval_minutes * 60))
+        self.logger.info(f"Démarrage de la collecte en temps réel (intervalle hors match: {interval_minutes} minutes)")
         
-        # Boucle principale
+        # Boucle principale (première collecte immédiate)
         while True:
             try:
-                schedule.run_pending()
-                time.sleep(60)  # Vérifie toutes les minutes
+                time.sleep(self.poll_once())
             except KeyboardInterrupt:
                 self.logger.info("Arrêt manuel de la collecte")
                 break
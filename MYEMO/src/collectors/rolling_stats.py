@@ -0,0 +1,204 @@
+"""
+Moyennes glissantes incrémentales (7 / 14 / 30 jours) des joueurs
+- Un tampon circulaire de 30 jours (joueurs × jours × stats) et, par fenêtre,
+  les sommes et le nombre d'observations de chaque joueur
+- update() n'ajoute que les lignes du jour et retire celles qui sortent des
+  fenêtres : O(nouvelles lignes + joueurs suivis), sans relire l'historique CSV
+- L'état est persisté dans un fichier .npz ; s'il manque, il est reconstruit
+  une fois depuis les 30 derniers jours d'historique (bootstrap)
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from collectors.data_models import FA_STAT_KEYS
+
+DEFAULT_STATE_PATH = os.path.join('data', 'cache', 'rolling_stats.npz')
+# Fenêtre (colonnes du marché des agents libres) -> nombre de jours
+ROLLING_WINDOWS = {'last_week': 7, 'rolling_14d': 14, 'rolling_30d': 30}
+
+
+def day_number(date: str) -> int:
+    """'YYYYMMDD' (format des historiques) -> numéro de jour"""
+    return datetime.strptime(str(date), '%Y%m%d').toordinal()
+
+
+class RollingStatsEngine:
+    """Sommes et compteurs glissants par joueur, mis à jour jour après jour"""
+
+    def __init__(self, stat_keys: Sequence[str] = FA_STAT_KEYS, windows: Dict[str, int] = None):
+        self.stat_keys = tuple(stat_keys)
+        self.windows = dict(windows or ROLLING_WINDOWS)
+        self.horizon = max(self.windows.values())
+        self.players: Dict[str, int] = {}
+        self.last_day = None
+        k = len(self.stat_keys)
+        self.ring = np.full((0, self.horizon, k), np.nan)       # valeurs des derniers jours
+        self.sums = np.zeros((len(self.windows), 0, k))         # fenêtres × joueurs × stats
+        self.counts = np.zeros((len(self.windows), 0, k), dtype=np.int32)
+
+    # --- Mise à jour ---------------------------------------------------------
+
+    def update(self, date: str, players: Sequence[str], values: np.ndarray) -> None:
+        """Intègre les stats d'une journée (matrice joueurs × stat_keys, NaN = absent).
+
+        Un même jour peut être mis à jour plusieurs fois (agents libres puis
+        rosters, ou nouvelle exécution) : la valeur d'un joueur est remplacée.
+        """
+        day = day_number(date)
+        if self.last_day is not None and day < self.last_day:
+            raise ValueError(f"Date {date} antérieure au dernier jour intégré")
+        self._advance(day)
+
+        values = np.asarray(values, dtype=float).reshape(len(players), len(self.stat_keys))
+        if len(set(players)) < len(players):
+            # Doublons : la dernière ligne d'un joueur l'emporte
+            last = {name: i for i, name in enumerate(players)}
+            players, values = list(last), values[list(last.values())]
+        rows = self._rows(players)
+        slot = day % self.horizon
+        # Remplace une éventuelle valeur déjà intégrée pour ce jour
+        previous = self.ring[rows, slot]
+        for w in range(len(self.windows)):
+            self._add(w, rows, previous, sign=-1)
+            self._add(w, rows, values, sign=1)
+        self.ring[rows, slot] = values
+
+    def _advance(self, day: int) -> None:
+        """Fait sortir des fenêtres les jours écoulés depuis last_day"""
+        if self.last_day is None or day - self.last_day >= self.horizon:
+            self.ring[:] = np.nan
+            self.sums[:] = 0
+            self.counts[:] = 0
+            self.last_day = day
+            return
+        all_rows = np.arange(len(self.players))
+        for t in range(self.last_day + 1, day + 1):
+            for w, length in enumerate(self.windows.values()):
+                self._add(w, all_rows, self.ring[:, (t - length) % self.horizon], sign=-1)
+            self.ring[:, t % self.horizon] = np.nan
+        self.last_day = day
+
+    def _add(self, window: int, rows: np.ndarray, values: np.ndarray, sign: int) -> None:
+        present = ~np.isnan(values)
+        np.add.at(self.sums[window], rows, sign * np.where(present, values, 0.0))
+        np.add.at(self.counts[window], rows, sign * present.astype(np.int32))
+
+    def _rows(self, players: Sequence[str]) -> np.ndarray:
+        """Lignes des joueurs ; les nouveaux joueurs agrandissent les tableaux"""
+        new = [name for name in dict.fromkeys(players) if name not in self.players]
+        if new:
+            start = len(self.players)
+            self.players.update((name, start + i) for i, name in enumerate(new))
+            k = len(self.stat_keys)
+            self.ring = np.concatenate([self.ring, np.full((len(new), self.horizon, k), np.nan)])
+            self.sums = np.concatenate([self.sums, np.zeros((len(self.windows), len(new), k))], axis=1)
+            self.counts = np.concatenate(
+                [self.counts, np.zeros((len(self.windows), len(new), k), dtype=np.int32)], axis=1)
+        return np.fromiter((self.players[name] for name in players), dtype=np.intp, count=len(players))
+
+    # --- Lecture -------------------------------------------------------------
+
+    def means(self, players: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Moyennes par fenêtre (joueurs × stat_keys) ; NaN si aucune observation"""
+        known = np.array([name in self.players for name in players], dtype=bool)
+        rows = np.array([self.players.get(name, 0) for name in players], dtype=np.intp)
+        result = {}
+        for w, window in enumerate(self.windows):
+            counts = self.counts[w, rows]
+            means = np.divide(self.sums[w, rows], counts, out=np.full(counts.shape, np.nan), where=counts > 0)
+            means[~known] = np.nan
+            result[window] = means
+        return result
+
+    def stds(self, players: Sequence[str], window: str = 'rolling_30d') -> np.ndarray:
+        """Écarts-types d'une fenêtre (joueurs × stat_keys) ; NaN sous 2 observations"""
+        known = np.array([name in self.players for name in players], dtype=bool)
+        rows = np.array([self.players.get(name, 0) for name in players], dtype=np.intp)
+        result = np.full((len(players), len(self.stat_keys)), np.nan)
+        if self.last_day is None or not len(self.players):
+            return result
+        slots = [(self.last_day - t) % self.horizon for t in range(self.windows[window])]
+        values = self.ring[rows][:, slots]                       # joueurs × jours × stats
+        present = ~np.isnan(values)
+        counts = present.sum(axis=1)
+        means = np.divide(np.where(present, values, 0.0).sum(axis=1), counts,
+                          out=np.zeros(counts.shape), where=counts > 0)
+        squares = np.where(present, (values - means[:, None]) ** 2, 0.0).sum(axis=1)
+        np.divide(squares, counts - 1, out=result, where=counts > 1)
+        np.sqrt(result, out=result)
+        result[~known] = np.nan
+        return result
+
+    # --- Persistance ---------------------------------------------------------
+
+    def compact(self) -> None:
+        """Oublie les joueurs sans aucune observation dans l'horizon (fenêtres vides)"""
+        keep = ~np.isnan(self.ring).all(axis=(1, 2))
+        if keep.all():
+            return
+        self.ring = self.ring[keep]
+        self.sums = self.sums[:, keep]
+        self.counts = self.counts[:, keep]
+        kept = [name for name, row in self.players.items() if keep[row]]
+        self.players = {name: i for i, name in enumerate(kept)}
+
+    def save(self, path: str) -> None:
+        """Écrit l'état (non compressé : relu et réécrit à chaque collecte)"""
+        self.compact()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        meta = {'stat_keys': self.stat_keys, 'windows': self.windows, 'last_day': self.last_day,
+                'players': list(self.players)}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, ring=self.ring, sums=self.sums, counts=self.counts,
+                                meta=np.array(json.dumps(meta, ensure_ascii=False)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'RollingStatsEngine':
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(str(archive['meta']))
+            engine = cls(meta['stat_keys'], meta['windows'])
+            engine.ring = archive['ring']
+            engine.sums = archive['sums']
+            engine.counts = archive['counts']
+        engine.last_day = meta['last_day']
+        engine.players = {name: i for i, name in enumerate(meta['players'])}
+        return engine
+
+    @classmethod
+    def from_history(cls, frames: Iterable[pd.DataFrame], stat_keys: Sequence[str] = FA_STAT_KEYS,
+                     windows: Dict[str, int] = None) -> 'RollingStatsEngine':
+        """Reconstruit l'état depuis des historiques (date, player, colonnes stat_keys)"""
+        engine = cls(stat_keys, windows)
+        columns = ['date', 'player'] + list(engine.stat_keys)
+        frames = [frame.reindex(columns=columns) for frame in frames if not frame.empty]
+        if not frames:
+            return engine
+        history = pd.concat(frames, ignore_index=True)
+        history['date'] = history['date'].astype(str)
+        # Une ligne par (jour, joueur) : la dernière source l'emporte, comme dans update()
+        history = history.drop_duplicates(['date', 'player'], keep='last').sort_values('date', kind='stable')
+        for date, day in history.groupby('date', sort=True):
+            engine.update(date, day['player'].tolist(), day[list(engine.stat_keys)].to_numpy(dtype=float))
+        return engine
+
+
+def load_or_rebuild(state_path: str,
+                    history: Callable[[], List[pd.DataFrame]] = None) -> Tuple[RollingStatsEngine, bool]:
+    """État persisté s'il existe, sinon reconstruit depuis l'historique ; (moteur, reconstruit ?)
+
+    history n'est appelé (lecture des CSV) que si l'état doit être reconstruit.
+    """
+    if os.path.exists(state_path):
+        try:
+            return RollingStatsEngine.load(state_path), False
+        except (OSError, ValueError, KeyError):
+            pass  # État illisible : reconstruction
+    return RollingStatsEngine.from_history(history() if history else []), True
@@ -10,6 +10,11 @@ import json
 import re
 from datetime import datetime
 
+try:
+    from collectors.http_cache import get_default_client
+except ImportError:  # Exécution directe depuis src/collectors
+    from http_cache import get_default_client
+
 def scrape_league_standings():
     """Scrape la page des classements"""
     print("🔍 SCRAPING PAGE CLASSEMENTS")
@@ -18,45 +23,14 @@ def scrape_league_standings():
     url = "https://fantasy.espn.com/basketball/league/standings?leagueId=1557635339&seasonId=2026"
     
     try:
-        response = requests.get(url, timeout=10)
+        # Le parsing HTML n'est refait que si la page a changé depuis le dernier passage
+        data, response = get_default_client().get_parsed(url, _parse_standings_page, timeout=10)
         print(f"📊 Status : {response.status_code}")
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Chercher des données de ligue
-            print(f"✅ Page accessible")
-            
-            # Chercher des scripts JSON
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'league' in script.string.lower():
-                    print(f"✅ Script trouvé avec 'league'")
-                    # Extraire les données JSON
-                    try:
-                        # Chercher des objets JSON
-                        json_match = re.search(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', script.string)
-                        if json_match:
-                            data = json.loads(json_match.group(1))
-                            print(f"✅ Données JSON extraites")
-                            return data
-                    except:
-                        pass
-            
-            # Chercher des éléments HTML
-            standings = soup.find_all(['table', 'div'], class_=re.compile(r'standings|team|league'))
-            if standings:
-                print(f"✅ Éléments de classement trouvés : {len(standings)}")
-            
-            # Chercher du texte
-            if "Neon Cobras" in response.text:
-                print(f"🎉 TROUVÉ ! 'Neon Cobras' dans la page")
-            if "league" in response.text.lower():
-                print(f"✅ Contient 'league'")
-            if "team" in response.text.lower():
-                print(f"✅ Contient 'team'")
-            
-            return response.text
+            if response.not_modified:
+                print(f"♻️ Page inchangée depuis le dernier scraping (cache)")
+            return data
             
         else:
             print(f"❌ Erreur : {response.status_code}")
@@ -66,6 +40,47 @@ def scrape_league_standings():
         print(f"❌ Erreur : {e}")
         return None
 
+def _parse_standings_page(response):
+    """Extrait les données de la page des classements (JSON initial ou HTML brut)"""
+    if response.status_code != 200:
+        return None
+    
+    soup = BeautifulSoup(response.text, 'html.parser')
+    
+    # Chercher des données de ligue
+    print(f"✅ Page accessible")
+    
+    # Chercher des scripts JSON
+    scripts = soup.find_all('script')
+    for script in scripts:
+        if script.string and 'league' in script.string.lower():
+            print(f"✅ Script trouvé avec 'league'")
+            # Extraire les données JSON
+            try:
+                # Chercher des objets JSON
+                json_match = re.search(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', script.string)
+                if json_match:
+                    data = json.loads(json_match.group(1))
+                    print(f"✅ Données JSON extraites")
+                    return data
+            except:
+                pass
+    
+    # Chercher des éléments HTML
+    standings = soup.find_all(['table', 'div'], class_=re.compile(r'standings|team|league'))
+    if standings:
+        print(f"✅ Éléments de classement trouvés : {len(standings)}")
+    
+    # Chercher du texte
+    if "Neon Cobras" in response.text:
+        print(f"🎉 TROUVÉ ! 'Neon Cobras' dans la page")
+    if "league" in response.text.lower():
+        print(f"✅ Contient 'league'")
+    if "team" in response.text.lower():
+        print(f"✅ Contient 'team'")
+    
+    return response.text
+
 def scrape_league_settings():
     """Scrape la page des paramètres"""
     print(f"\n🔍 SCRAPING PAGE PARAMÈTRES")
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Backends de stockage de l'historique data/raw
+CSV en mode append (par défaut) ou Parquet partitionné par date
+"""
+
+import io
+import os
+import json
+import uuid
+import argparse
+import operator
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Opérateurs acceptés dans les filtres (colonne, opérateur, valeur)
+FILTER_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def history_key_columns(columns) -> list:
+    """Colonnes identifiant une ligne d'historique : la date et l'équipe et/ou le joueur"""
+    if 'date' not in columns:
+        return []
+    identifiers = [col for col in ('team', 'player') if col in columns]
+    return ['date'] + identifiers if identifiers else []
+
+
+class CSVStorage:
+    """Historique CSV écrit en mode append, avec un index annexe des clés"""
+
+    # Index annexe conservé à côté de chaque fichier d'historique
+    INDEX_SUFFIX = '.idx.json'
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+
+    def _full_path(self, file_path: str) -> str:
+        return os.path.join(self.base_path, file_path)
+
+    def exists(self, file_path: str) -> bool:
+        return os.path.exists(self._full_path(file_path))
+
+    def columns(self, file_path: str) -> list:
+        return list(pd.read_csv(self._full_path(file_path), nrows=0).columns)
+
+    def read(self, file_path: str, columns: list = None, filters: list = None,
+             partitions: int = None) -> pd.DataFrame:
+        """Lit l'historique en ne parsant que les colonnes demandées"""
+        usecols = None
+        if columns is not None:
+            usecols = list(dict.fromkeys(list(columns) + [f[0] for f in filters or []]))
+        df = pd.read_csv(self._full_path(file_path), usecols=usecols, dtype={'date': str})
+
+        if partitions and 'date' in df.columns:
+            kept_dates = sorted(df['date'].unique())[-partitions:]
+            df = df[df['date'].isin(kept_dates)]
+        for column, op, value in filters or []:
+            mask = df[column].isin(value) if op == 'in' else FILTER_OPERATORS[op](df[column], value)
+            df = df[mask]
+        return df[columns].reset_index(drop=True) if columns is not None else df.reset_index(drop=True)
+
+    def append(self, df: pd.DataFrame, file_path: str) -> pd.DataFrame:
+        """Ajoute les nouvelles lignes en fin de fichier ou crée le fichier si nécessaire.
+
+        Le fichier existant n'est jamais relu en entier : un index annexe
+        (<fichier>.idx.json) conserve l'en-tête, les clés de la dernière date
+        écrite et la position (octet) de ses lignes. Une nouvelle date est
+        ajoutée en fin de fichier ; une nouvelle collecte de la dernière date
+        (collecte du matin puis d'après-match) remplace ses lignes (clés
+        (date, équipe) / (date, joueur)) en ne réécrivant que cette fin de fichier.
+        Retourne les lignes effectivement écrites.
+        """
+        full_path = self._full_path(file_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        key_columns = history_key_columns(df.columns)
+        if key_columns:
+            # Supprimer les doublons internes au lot
+            df = df.drop_duplicates(subset=key_columns, keep='last')
+
+        if not os.path.exists(full_path):
+            # Créer un nouveau fichier
+            self._write_full(df, full_path, key_columns)
+            return df
+
+        if df.empty:
+            return df
+
+        index = self._load_index(full_path, key_columns)
+
+        # Nouvelles colonnes ou données antérieures à la dernière date : réécriture complète
+        new_columns = [col for col in df.columns if col not in index['columns']]
+        dates = df['date'].astype(str) if 'date' in df.columns else None
+        if new_columns or (dates is not None and index['last_date'] is not None
+                           and (dates < index['last_date']).any()):
+            return self._rewrite(df, full_path, key_columns)
+
+        if not key_columns:
+            # Pas de clés : écriture en mode append, dans l'ordre des colonnes du fichier existant
+            df.reindex(columns=index['columns']).to_csv(full_path, mode='a', header=False, index=False)
+            return df
+
+        if index['last_date'] is None or not (dates == index['last_date']).any():
+            # Nouvelle(s) date(s) : ajout en fin de fichier
+            self._write_tail(df, full_path, index, key_columns, start=None)
+            return df
+
+        if index.get('last_offset') is None:
+            # Index antérieur à la position de la dernière date : réécriture unique
+            return self._rewrite(df, full_path, key_columns)
+
+        # Même date que la dernière écrite : ses lignes (seules relues) sont remplacées par clé
+        with open(full_path, 'rb') as f:
+            f.seek(index['last_offset'])
+            tail_bytes = f.read()
+        tail = pd.read_csv(io.BytesIO(tail_bytes), header=None, names=index['columns'], dtype={'date': str}) \
+            if tail_bytes.strip() else pd.DataFrame(columns=index['columns'])
+        combined = pd.concat([tail, df.astype({'date': str})], ignore_index=True)
+        combined = combined[~combined[key_columns].astype(str).duplicated(keep='last')]
+        self._write_tail(combined, full_path, index, key_columns, start=index['last_offset'])
+        return df
+
+    def _index_path(self, full_path: str) -> str:
+        return full_path + self.INDEX_SUFFIX
+
+    def _write_full(self, df: pd.DataFrame, full_path: str, key_columns: list) -> None:
+        """Écrit le fichier complet (en-tête compris) et son index"""
+        with open(full_path, 'wb') as f:
+            f.write(df.iloc[0:0].to_csv(index=False).encode('utf-8'))
+        index = {'columns': list(df.columns), 'key_columns': key_columns, 'last_date': None, 'keys': [],
+                 'last_offset': None}
+        if key_columns:
+            self._write_tail(df, full_path, index, key_columns, start=None)
+        else:
+            df.to_csv(full_path, mode='a', header=False, index=False)
+            self._write_index(full_path, index)
+
+    def _write_tail(self, df: pd.DataFrame, full_path: str, index: dict, key_columns: list,
+                    start: int = None) -> None:
+        """Écrit les lignes en fin de fichier (à partir de l'octet start : la fin du fichier est remplacée).
+
+        Les lignes de la date la plus récente sont écrites en dernier ; leur
+        position et leurs clés sont gardées dans l'index.
+        """
+        df = df.reindex(columns=index['columns'])
+        dates = df['date'].astype(str)
+        last_date = dates.max() if not df.empty else index['last_date']
+        if index['last_date'] is not None and last_date is not None:
+            last_date = max(last_date, index['last_date'])
+        older, latest = df[dates < last_date], df[dates == last_date]
+        with open(full_path, 'r+b') as f:
+            if start is None:
+                f.seek(0, os.SEEK_END)
+            else:
+                f.seek(start)
+                f.truncate()
+            if not older.empty:
+                f.write(older.to_csv(header=False, index=False).encode('utf-8'))
+            offset = f.tell()
+            if not latest.empty:
+                f.write(latest.to_csv(header=False, index=False).encode('utf-8'))
+
+        if last_date != index['last_date'] or start is not None:
+            index['keys'] = []
+            index['last_offset'] = offset
+        index['last_date'] = last_date
+        index['keys'].extend(
+            list(key) for key in latest[key_columns].astype(str).itertuples(index=False, name=None)
+        )
+        self._write_index(full_path, index)
+
+    def _update_index(self, index: dict, df: pd.DataFrame, key_columns: list) -> dict:
+        if not key_columns or df.empty:
+            return index
+
+        dates = df['date'].astype(str)
+        last_date = dates.max()
+        if index['last_date'] is None or last_date > index['last_date']:
+            # Nouvelle date : les clés précédentes ne peuvent plus entrer en conflit
+            index['last_date'] = last_date
+            index['keys'] = []
+
+        latest_rows = df[dates == index['last_date']]
+        index['keys'].extend(
+            list(key) for key in latest_rows[key_columns].astype(str).itertuples(index=False, name=None)
+        )
+        return index
+
+    def _load_index(self, full_path: str, key_columns: list) -> dict:
+        """Charge l'index annexe, ou le reconstruit une seule fois pour un fichier existant"""
+        index_path = self._index_path(full_path)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('key_columns') == key_columns:
+                return index
+
+        # Fichier créé avant l'index (ou clés différentes) : reconstruction unique
+        # (sans position de la dernière date : une collecte de cette date réécrira le fichier)
+        header = list(pd.read_csv(full_path, nrows=0).columns)
+        index = {'columns': header, 'key_columns': key_columns, 'last_date': None, 'keys': []}
+        if key_columns and all(col in header for col in key_columns):
+            existing_df = pd.read_csv(full_path, usecols=key_columns, dtype=str)
+            index = self._update_index(index, existing_df, key_columns)
+        self._write_index(full_path, index)
+        return index
+
+    def _write_index(self, full_path: str, index: dict) -> None:
+        index_path = self._index_path(full_path)
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+
+    def _rewrite(self, df: pd.DataFrame, full_path: str, key_columns: list) -> pd.DataFrame:
+        """Chemin lent : relit l'historique, fusionne et réécrit le fichier complet"""
+        existing_df = pd.read_csv(full_path, dtype={'date': str})
+        if 'date' in df.columns:
+            df = df.astype({'date': str})
+        combined_df = pd.concat([existing_df, df], ignore_index=True)
+
+        # Une clé déjà présente est remplacée par la nouvelle ligne
+        if key_columns:
+            combined_df = combined_df.drop_duplicates(subset=key_columns, keep='last')
+            # Ordre chronologique : les lignes de la dernière date en fin de fichier
+            combined_df = combined_df.sort_values('date', kind='stable')
+
+        self._write_full(combined_df, full_path, key_columns)
+        return combined_df[combined_df.index >= len(existing_df)]
+
+
+class ParquetStorage:
+    """Historique Parquet partitionné par date (data/raw/<table>/date=YYYYMMDD/*.parquet)"""
+
+    PARTITION_PREFIX = 'date='
+
+    def __init__(self, base_path: str):
+        if pa is None:
+            raise ImportError("pyarrow est requis pour le stockage Parquet (pip install pyarrow)")
+        self.base_path = base_path
+        self.partitioning = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+    def _dataset_path(self, file_path: str) -> str:
+        """stats/stats_pts_history.csv -> stats/stats_pts_history/"""
+        return os.path.join(self.base_path, os.path.splitext(file_path)[0])
+
+    def _partitions(self, dataset_path: str) -> list:
+        if not os.path.isdir(dataset_path):
+            return []
+        return sorted(
+            name for name in os.listdir(dataset_path)
+            if name.startswith(self.PARTITION_PREFIX)
+        )
+
+    def _partition_files(self, dataset_path: str, partitions: list) -> list:
+        files = []
+        for partition in partitions:
+            partition_dir = os.path.join(dataset_path, partition)
+            files.extend(
+                os.path.join(partition_dir, name)
+                for name in sorted(os.listdir(partition_dir)) if name.endswith('.parquet')
+            )
+        return files
+
+    def _schema(self, files: list):
+        """Schéma unifié des fichiers (seuls les pieds de page Parquet sont lus)"""
+        schemas = [pq.read_schema(path) for path in files] + [pa.schema([('date', pa.string())])]
+        return pa.unify_schemas(schemas, promote_options='permissive')
+
+    def exists(self, file_path: str) -> bool:
+        return bool(self._partitions(self._dataset_path(file_path)))
+
+    def columns(self, file_path: str) -> list:
+        dataset_path = self._dataset_path(file_path)
+        files = self._partition_files(dataset_path, self._partitions(dataset_path))
+        return ['date'] + [name for name in self._schema(files).names if name != 'date']
+
+    def read(self, file_path: str, columns: list = None, filters: list = None,
+             partitions: int = None) -> pd.DataFrame:
+        """Lit l'historique avec projection des colonnes et filtres poussés au scan"""
+        dataset_path = self._dataset_path(file_path)
+        selected = self._partitions(dataset_path)
+        if partitions:
+            selected = selected[-partitions:]
+        files = self._partition_files(dataset_path, selected)
+        if not files:
+            return pd.DataFrame(columns=columns or [])
+
+        schema = self._schema(files)
+        dataset = ds.dataset(files, schema=schema, format='parquet',
+                             partitioning=self.partitioning, partition_base_dir=dataset_path)
+
+        expression = None
+        for column, op, value in filters or []:
+            field = ds.field(column)
+            condition = field.isin(value) if op == 'in' else FILTER_OPERATORS[op](field, value)
+            expression = condition if expression is None else expression & condition
+
+        if columns is not None:
+            columns = [col for col in columns if col in schema.names]
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    def append(self, df: pd.DataFrame, file_path: str) -> pd.DataFrame:
+        """Écrit un fichier Parquet par date ; une clé déjà présente dans la partition
+        (nouvelle collecte du même jour) est remplacée par la nouvelle ligne.
+
+        Retourne les lignes effectivement écrites.
+        """
+        if 'date' not in df.columns:
+            raise ValueError(f"Colonne 'date' requise pour le stockage Parquet : {file_path}")
+
+        dataset_path = self._dataset_path(file_path)
+        key_columns = history_key_columns(df.columns)
+        if key_columns:
+            df = df.drop_duplicates(subset=key_columns, keep='last')
+
+        written = []
+        dates = df['date'].astype(str)
+        for date in sorted(dates.unique()):
+            part = df[dates == date].drop(columns=['date'])
+            partition_dir = os.path.join(dataset_path, f'{self.PARTITION_PREFIX}{date}')
+
+            identifiers = [col for col in key_columns if col != 'date']
+            existing_files = self._partition_files(dataset_path, [os.path.basename(partition_dir)]) \
+                if os.path.isdir(partition_dir) else []
+            if part.empty:
+                continue
+
+            new_rows, replaced_files = part, []
+            if identifiers and existing_files:
+                # Seules les colonnes clés de la partition du jour sont relues
+                existing = ds.dataset(existing_files, format='parquet').to_table(columns=identifiers).to_pandas()
+                new_keys = set(part[identifiers].astype(str).itertuples(index=False, name=None))
+                is_replaced = [key in new_keys for key in existing.astype(str).itertuples(index=False, name=None)]
+                if any(is_replaced):
+                    # Partition réécrite (un seul fichier) sans les lignes remplacées
+                    kept = pd.concat([pq.read_table(path).to_pandas() for path in existing_files],
+                                     ignore_index=True)
+                    kept = kept[[not replaced for replaced in is_replaced]]
+                    part = pd.concat([kept, part], ignore_index=True)
+                    replaced_files = existing_files
+
+            os.makedirs(partition_dir, exist_ok=True)
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            pq.write_table(table, os.path.join(partition_dir, f'part-{uuid.uuid4().hex}.parquet'))
+            for path in replaced_files:
+                os.remove(path)
+            written.append(new_rows.assign(date=date))
+
+        return pd.concat(written, ignore_index=True) if written else df.iloc[0:0]
+
+
+STORAGE_BACKENDS = {
+    'csv': CSVStorage,
+    'parquet': ParquetStorage,
+}
+
+
+def get_storage(backend: str, base_path: str):
+    """Instancie le backend de stockage demandé ('csv' ou 'parquet')"""
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Backend de stockage inconnu : {backend} (disponibles : {list(STORAGE_BACKENDS)})")
+    return STORAGE_BACKENDS[backend](base_path)
+
+
+def migrate_csv_to_parquet(base_path: str, raw_dir: str = 'data/raw') -> list:
+    """Migration unique des historiques CSV de data/raw vers des datasets Parquet"""
+    parquet = ParquetStorage(base_path)
+    migrated = []
+
+    for root, _, files in os.walk(os.path.join(base_path, raw_dir)):
+        for name in sorted(files):
+            # Les tables "dernier état" (*.latest.csv) restent valables telles quelles
+            if not name.endswith('.csv') or name.endswith('.latest.csv'):
+                continue
+            full_path = os.path.join(root, name)
+            file_path = os.path.relpath(full_path, base_path)
+            df = pd.read_csv(full_path, dtype={'date': str})
+            if 'date' not in df.columns:
+                print(f"   ⚠️ {file_path} ignoré (pas de colonne date)")
+                continue
+            parquet.append(df, file_path)
+            migrated.append(file_path)
+            print(f"   ✅ {file_path} → {os.path.splitext(file_path)[0]}/ ({len(df)} lignes)")
+
+    return migrated
+
+
+def main():
+    """Fonction principale : migration CSV → Parquet"""
+    parser = argparse.ArgumentParser(description="Migration de l'historique data/raw vers Parquet")
+    parser.add_argument('--base-path', default=os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+    parser.add_argument('--raw-dir', default='data/raw')
+    args = parser.parse_args()
+
+    print("📦 MIGRATION CSV → PARQUET")
+    print("=" * 50)
+    migrated = migrate_csv_to_parquet(args.base_path, args.raw_dir)
+    print(f"\n✨ {len(migrated)} fichiers migrés")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,41 +8,82 @@ import schedule
 import time
 import os
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from collectors.adaptive_polling import game_windows
 from collectors.collect_data import main as collect_data
 
+MORNING_COLLECTION = "08:00"
+# Collecte du soir : une fois les matchs des joueurs des rosters terminés (pas de collecte sans match)
+POST_GAME_DELAY = timedelta(minutes=30)
+# Pas de collecte d'après-match si la collecte matinale suit de peu
+MIN_GAP_BEFORE_MORNING = timedelta(hours=1)
+
 def daily_collection():
-    """Collecte quotidienne automatique"""
+    """Collecte quotidienne automatique ; retourne l'heure de la collecte d'après-match (ou None)"""
     print(f"\n🔄 Collecte automatique - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
         # Lancement de la collecte
-        collect_data()
+        collector = collect_data()
         print("✅ Collecte automatique terminée")
+        return plan_post_game_collection(collector)
         
     except Exception as e:
         print(f"❌ Erreur collecte automatique : {e}")
 
+def post_game_time(windows, now: datetime):
+    """Heure de la collecte d'après-match (fin du dernier match des prochaines 24h), None si inutile"""
+    if not windows:
+        return None
+    target = windows[-1][1] + POST_GAME_DELAY
+    morning = datetime.combine(now.date(), datetime.strptime(MORNING_COLLECTION, "%H:%M").time())
+    while morning <= target - MIN_GAP_BEFORE_MORNING:
+        morning += timedelta(days=1)
+    if target - now >= timedelta(days=1) or morning - target < MIN_GAP_BEFORE_MORNING:
+        return None
+    return target
+
+def post_game_collection():
+    daily_collection()
+    return schedule.CancelJob  # Collecte unique, replanifiée par daily_collection
+
+def next_post_game(collector):
+    """Heure de la collecte d'après-match d'après le calendrier des rosters de la ligue collectée"""
+    league = getattr(collector, 'league', None)
+    if league is None:
+        return None
+    now = datetime.now()
+    windows = game_windows((player for team in league.teams for player in team.roster), now, timedelta(days=1))
+    return post_game_time(windows, now)
+
+def plan_post_game_collection(collector):
+    """Planifie (une fois) la collecte suivant la fin des matchs de la journée"""
+    schedule.clear('post_game')
+    target = next_post_game(collector)
+    if target is None:
+        print("📅 Pas de collecte d'après-match (aucun match, ou collecte matinale juste après)")
+        return None
+    schedule.every().day.at(target.strftime("%H:%M")).do(post_game_collection).tag('post_game')
+    print(f"📅 Collecte d'après-match planifiée à {target.strftime('%H:%M')}")
+    return target
+
 def setup_scheduler():
     """Configure le scheduler quotidien"""
     print("⏰ Configuration de l'automatisation quotidienne")
     
     # Collecte à 8h00
-    schedule.every().day.at("08:00").do(daily_collection)
-    
-    # Collecte à 20h00
-    schedule.every().day.at("20:00").do(daily_collection)
+    schedule.every().day.at(MORNING_COLLECTION).do(daily_collection)
     
     print("✅ Scheduler configuré :")
     print("   - 8h00 : Collecte matinale")
-    print("   - 20h00 : Collecte vespérale")
+    print("   - Après le dernier match de la journée : Collecte d'après-match")
     print("\n🔄 Démarrage du scheduler...")
     print("Appuyez sur Ctrl+C pour arrêter")
     
-    # Boucle principale
+    # Boucle principale : sommeil jusqu'à la prochaine collecte planifiée
     while True:
         schedule.run_pending()
-        time.sleep(60)  # Vérification toutes les minutes
+        time.sleep(min(max(schedule.idle_seconds() or 60, 1), 3600))
 
 def main():
     """Fonction principale"""
@@ -52,7 +93,7 @@ def main():
     try:
         # Test initial
         print("🧪 Test initial...")
-        collect_data()
+        plan_post_game_collection(collect_data())
         
         # Configuration du scheduler
         setup_scheduler()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Exécution de tous les travaux planifiés dans un seul processus
+(remplace les boucles schedule de daily_automation, nba_data_scheduler
+et du collecteur temps réel)
+- collect_data : 8h00 et après le dernier match de la journée
+- realtime : délai adaptatif selon les matchs NBA
+- analyzer_snapshot : 8h00 et 20h00 ; weekly_analysis : dimanche 9h00
+- auto_sync_google_sheets n'est pas hébergé : complete_google_sheets_system
+  dépend de advanced_analysis_sheets, absent du projet
+- Un travail encore en cours n'est pas relancé (lancement sauté), y compris
+  s'il tourne dans un autre processus (verrou data/locks/job_<nom>.lock)
+- Au plus JOB_RUNNER_WORKERS travaux en parallèle ; les écritures d'un même
+  historique sont sérialisées par FileManager (verrou par fichier)
+- État de chaque travail (en cours, dernier lancement, résultat, prochain
+  lancement) : logs/job_runner_status.json
+
+Usage :
+    PYTHONPATH=src python src/job_runner.py
+    PYTHONPATH=src python src/job_runner.py --only collect_data realtime
+    PYTHONPATH=src python src/job_runner.py --status
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Racine (config, src.collectors), src/ et src/utils/ (scripts Google Sheets en imports à plat)
+for _path in (BASE_PATH, os.path.join(BASE_PATH, 'src'), os.path.join(BASE_PATH, 'src', 'utils')):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from utils.file_lock import LOCK_DIR, LockTimeout, file_lock
+
+STATUS_PATH = os.path.join('logs', 'job_runner_status.json')
+# Attente maximale entre deux vérifications des échéances
+MAX_IDLE_SECONDS = 60.0
+
+# (maintenant, résultat du dernier lancement) -> prochain lancement
+NextTime = Callable[[datetime, object], datetime]
+
+
+def daily_at(*times: str, weekday: int = None) -> NextTime:
+    """Prochaine occurrence d'une des heures 'HH:MM' (weekday : 0 = lundi ... 6 = dimanche)"""
+    parsed = [datetime.strptime(t, "%H:%M").time() for t in times]
+
+    def next_time(now: datetime, result: object = None) -> datetime:
+        candidates = []
+        for days in range(8):
+            day = now.date() + timedelta(days=days)
+            if weekday is not None and day.weekday() != weekday:
+                continue
+            candidates.extend(datetime.combine(day, t) for t in parsed if datetime.combine(day, t) > now)
+            if candidates:
+                return min(candidates)
+        raise ValueError(f"Aucune échéance pour {times}")
+    return next_time
+
+
+def after_result(fallback: NextTime = None, default_seconds: float = MAX_IDLE_SECONDS) -> NextTime:
+    """Prochain lancement donné par le travail : délai en secondes ou datetime (sinon fallback)"""
+    def next_time(now: datetime, result: object = None) -> datetime:
+        candidates = []
+        if isinstance(result, (int, float)) and not isinstance(result, bool):
+            candidates.append(now + timedelta(seconds=result))
+        elif isinstance(result, datetime) and result > now:
+            candidates.append(result)
+        if fallback is not None:
+            candidates.append(fallback(now, result))
+        return min(candidates) if candidates else now + timedelta(seconds=default_seconds)
+    return next_time
+
+
+@dataclass
+class Job:
+    """Travail planifié et son état"""
+    name: str
+    func: Callable[[], object]
+    next_time: NextTime
+    run_at_start: bool = False
+    module: Optional[str] = None  # Module importé au lancement (vérifié par les tests)
+    next_run: Optional[datetime] = None
+    running: bool = False
+    last_start: Optional[datetime] = None
+    last_end: Optional[datetime] = None
+    last_status: Optional[str] = None      # ok / error / skipped
+    last_error: Optional[str] = None
+    last_duration_s: Optional[float] = None
+    runs: int = 0
+    skipped: int = 0
+
+    def to_dict(self) -> Dict:
+        def fmt(value):
+            return value.isoformat(timespec='seconds') if value else None
+        return {'running': self.running, 'next_run': fmt(self.next_run), 'last_start': fmt(self.last_start),
+                'last_end': fmt(self.last_end), 'last_status': self.last_status, 'last_error': self.last_error,
+                'last_duration_s': self.last_duration_s, 'runs': self.runs, 'skipped': self.skipped}
+
+
+class JobRunner:
+    """Boucle unique : lance les travaux échus dans un pool borné de threads"""
+
+    def __init__(self, jobs: Sequence[Job], workers: int = 2, status_path: str = STATUS_PATH,
+                 lock_dir: str = LOCK_DIR, clock: Callable[[], datetime] = datetime.now):
+        self.jobs = {job.name: job for job in jobs}
+        self.status_path = status_path
+        self.lock_dir = lock_dir
+        self.clock = clock
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='job')
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self.logger = logging.getLogger(__name__)
+        now = self.clock()
+        for job in self.jobs.values():
+            if job.next_run is None:
+                job.next_run = now if job.run_at_start else job.next_time(now, None)
+
+    def tick(self) -> List[str]:
+        """Lance les travaux échus ; retourne leurs noms (les travaux encore en cours sont sautés)"""
+        now = self.clock()
+        started = []
+        with self._lock:
+            for job in self.jobs.values():
+                if job.next_run > now:
+                    continue
+                if job.running:
+                    self._skip(job, now, "lancement précédent toujours en cours")
+                    continue
+                job.running = True
+                job.next_run = job.next_time(now, None)  # Provisoire : recalculé avec le résultat du lancement
+                started.append(job.name)
+                self.pool.submit(self._run, job)
+        self.write_status()
+        return started
+
+    def _skip(self, job: Job, now: datetime, reason: str) -> None:
+        job.skipped += 1
+        job.last_status, job.last_error = 'skipped', reason
+        job.next_run = job.next_time(now, None)
+        self.logger.warning(f"⏭️ {job.name} sauté : {reason}")
+
+    def _run(self, job: Job) -> None:
+        start = self.clock()
+        result, status, error = None, 'ok', None
+        try:
+            # Verrou par travail : pas de double lancement depuis un autre processus
+            with file_lock(f"job_{job.name}", self.lock_dir, blocking=False):
+                with self._lock:
+                    job.last_start = start
+                self.write_status()
+                self.logger.info(f"▶️ {job.name}")
+                result = job.func()
+        except LockTimeout:
+            status, error = 'skipped', "déjà en cours dans un autre processus"
+        except Exception as e:
+            status, error = 'error', str(e)
+            self.logger.error(f"❌ {job.name} : {error}")
+        end = self.clock()
+        with self._lock:
+            job.running = False
+            job.last_status, job.last_error = status, error
+            if status == 'skipped':
+                job.skipped += 1
+                self.logger.warning(f"⏭️ {job.name} sauté : {error}")
+            else:
+                job.runs += 1
+                job.last_end = end
+                job.last_duration_s = round((end - start).total_seconds(), 3)
+            job.next_run = job.next_time(end, result)
+        self.write_status()
+        self._wakeup.set()
+
+    def seconds_until_next(self) -> float:
+        now = self.clock()
+        with self._lock:
+            pending = [job.next_run for job in self.jobs.values()]
+        if not pending:
+            return MAX_IDLE_SECONDS
+        return min(max((min(pending) - now).total_seconds(), 0.0), MAX_IDLE_SECONDS)
+
+    def run_forever(self) -> None:
+        """Boucle principale : dort jusqu'à la prochaine échéance ou la fin d'un travail"""
+        self.logger.info(f"🚀 Démarrage des travaux : {', '.join(self.jobs)}")
+        while not self._stop.is_set():
+            self.tick()
+            self._wakeup.wait(self.seconds_until_next())
+            self._wakeup.clear()
+        self.logger.info("🛑 Arrêt : attente des travaux en cours")
+        self.shutdown()
+
+    def stop(self) -> None:
+        """Demande l'arrêt (aucun nouveau lancement, les travaux en cours se terminent)"""
+        self._stop.set()
+        self._wakeup.set()
+
+    def shutdown(self) -> None:
+        self.pool.shutdown(wait=True)
+        self.write_status()
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {'updated': self.clock().isoformat(timespec='seconds'), 'pid': os.getpid(),
+                    'jobs': {name: job.to_dict() for name, job in self.jobs.items()}}
+
+    def write_status(self) -> None:
+        """Fichier d'état (écriture atomique : lisible à tout moment par un autre processus)"""
+        status = self.status()
+        os.makedirs(os.path.dirname(self.status_path) or '.', exist_ok=True)
+        tmp_path = f"{self.status_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.status_path)
+
+
+_instances: Dict[str, object] = {}
+_instances_lock = threading.Lock()
+
+
+def _instance(name: str, factory: Callable[[], object]):
+    """Objet construit au premier lancement (connexion ESPN / Google) puis réutilisé"""
+    with _instances_lock:
+        if name not in _instances:
+            _instances[name] = factory()
+        return _instances[name]
+
+
+def _collect_data():
+    from collectors.collect_data import main as collect_data
+    from daily_automation import next_post_game
+    return next_post_game(collect_data())
+
+
+def _realtime():
+    from src.collectors.realtime_collector import RealTimeCollector
+    return _instance('realtime', RealTimeCollector).poll_once()
+
+
+def _analyzer():
+    from nba_data_scheduler import NBADataScheduler
+    return _instance('analyzer', NBADataScheduler)
+
+
+def default_jobs() -> List[Job]:
+    """Travaux des anciens schedulers (mêmes horaires)"""
+    twice_daily = daily_at("08:00", "20:00")
+    sunday_morning = daily_at("09:00", weekday=6)
+    return [
+        Job('collect_data', _collect_data, after_result(daily_at("08:00")), run_at_start=True,
+            module='collectors.collect_data'),
+        # Erreur (connexion ESPN...) : nouvel essai dans 5 minutes
+        Job('realtime', _realtime, after_result(default_seconds=300), run_at_start=True,
+            module='src.collectors.realtime_collector'),
+        Job('analyzer_snapshot', lambda: _analyzer().daily_data_collection(), twice_daily,
+            module='nba_data_scheduler'),
+        Job('weekly_analysis', lambda: _analyzer().weekly_analysis(), sunday_morning,
+            module='nba_data_scheduler'),
+    ]
+
+
+def format_status(status: Dict) -> str:
+    lines = [f"{'Travail':<18} {'En cours':>8} {'Dernier lancement':>20} {'Résultat':>9} {'Prochain':>20}"]
+    for name, job in status['jobs'].items():
+        lines.append(f"{name:<18} {'oui' if job['running'] else 'non':>8} {job['last_start'] or '-':>20} "
+                     f"{job['last_status'] or '-':>9} {job['next_run'] or '-':>20}")
+        if job['last_error']:
+            lines.append(f"{'':<18} ⚠️ {job['last_error']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from config import settings
+
+    parser = argparse.ArgumentParser(description="Travaux planifiés ESPN NBA (processus unique)")
+    parser.add_argument('--only', nargs='+', help=f"Travaux à lancer (défaut : {' '.join(settings.JOB_RUNNER_JOBS)})")
+    parser.add_argument('--workers', type=int, default=settings.JOB_RUNNER_WORKERS,
+                        help="Travaux exécutés en parallèle")
+    parser.add_argument('--status', action='store_true', help="Affiche l'état des travaux et quitte")
+    args = parser.parse_args(argv)
+
+    os.chdir(BASE_PATH)  # Chemins relatifs (data/, logs/) des scripts hébergés
+    if args.status:
+        if not os.path.exists(STATUS_PATH):
+            print(f"❌ Aucun état ({STATUS_PATH}) : le processus des travaux n'a jamais tourné")
+            return 1
+        with open(STATUS_PATH, 'r', encoding='utf-8') as f:
+            status = json.load(f)
+        print(f"📋 État au {status['updated']} (PID {status['pid']}) :")
+        print(format_status(status))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    names = args.only or settings.JOB_RUNNER_JOBS
+    jobs = [job for job in default_jobs() if job.name in names]
+    unknown = set(names) - {job.name for job in jobs}
+    if unknown:
+        print(f"❌ Travaux inconnus : {', '.join(sorted(unknown))}")
+        return 1
+
+    try:
+        # Un seul processus des travaux à la fois
+        with file_lock('job_runner', blocking=False):
+            print(f"🚀 {len(jobs)} travaux, {args.workers} en parallèle ; état : {STATUS_PATH}")
+            runner = JobRunner(jobs, workers=args.workers)
+            signal.signal(signal.SIGTERM, lambda signum, frame: runner.stop())  # stop_collection.sh
+            runner.run_forever()
+    except LockTimeout:
+        print("❌ Le processus des travaux tourne déjà (voir --status)")
+        return 1
+    except KeyboardInterrupt:
+        print("\n🛑 Travaux arrêtés par l'utilisateur")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime, timedelta
 import json
 import os
-from espn_nba_advanced_analyzer import ESPNNBAAdvancedAnalyzer
+from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -88,15 +88,15 @@ class NBADataScheduler:
         if not my_team:
             return alerts
         
-        # Alerte: Points perdus sur le banc
-        bench_points = my_team.bench_stats.get('points', 0)
-        if bench_points > 20:
-            alerts.append({
-                'type': 'bench_optimization',
-                'priority': 'high',
-                'message': f"⚠️ {bench_points:.1f} points perdus sur le banc!",
-                'action': "Vérifiez votre lineup et considérez des changements"
-            })
+        # Alerte: Lineup non optimal (production perdue sur le banc, voir lineup_optimizer)
+        for recommendation in snapshot.ai_recommendations:
+            if recommendation.get('type') == 'lineup_optimization':
+                alerts.append({
+                    'type': 'bench_optimization',
+                    'priority': 'high',
+                    'message': f"⚠️ {recommendation['message']}",
+                    'action': "Appliquez le lineup optimal du jour"
+                })
         
         # Alerte: Classement en chute
         if my_team.ranking > 6:  # Seuil arbitraire
@@ -212,14 +212,42 @@ class NBADataScheduler:
     
     def analyze_weekly_trends(self) -> dict:
         """Analyse les tendances sur une semaine"""
-        # Cette fonction analyserait les données historiques
-        # pour identifier les tendances et patterns
-        return {
+        trends = {
             'hot_players': [],
             'cold_players': [],
             'team_trends': [],
             'category_trends': []
         }
+        
+        # Seuls les snapshots des 7 derniers jours sont relus depuis l'historique persistant
+        week_start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        week = self.analyzer.data_history.since(week_start)
+        if len(week) < 2:
+            return trends
+        first, last = week[0], week[-1]
+        
+        # Évolution des points de chaque équipe présente au début et à la fin de la semaine
+        previous = {team.team_id: team for team in first.teams}
+        for team in last.teams:
+            if team.team_id in previous:
+                start = previous[team.team_id]
+                trends['team_trends'].append({
+                    'team': team.team_name,
+                    'ranking_change': start.ranking - team.ranking,
+                    'points_change': team.total_stats.get('points', 0) - start.total_stats.get('points', 0)
+                })
+        
+        # Évolution de mes catégories
+        my_first, my_last = first.my_team, last.my_team
+        if my_first and my_last:
+            for category, value in my_last.total_stats.items():
+                trends['category_trends'].append({
+                    'category': category,
+                    'change': value - my_first.total_stats.get(category, 0),
+                    'rank': my_last.category_rankings.get(category)
+                })
+        
+        return trends
     
     def generate_weekly_report(self, snapshot, trends):
         """Génère un rapport hebdomadaire détaillé"""
@@ -228,7 +256,7 @@ class NBADataScheduler:
         report = {
             'date': datetime.now().strftime('%Y-%m-%d'),
             'type': 'weekly_analysis',
-            'snapshot': snapshot.__dict__,
+            'snapshot': snapshot.to_dict(),
             'trends': trends,
             'recommendations': self.generate_weekly_recommendations(snapshot, trends)
         }
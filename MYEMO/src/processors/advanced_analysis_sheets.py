@@ -13,6 +13,11 @@ import logging
 from typing import Dict, List, Any
 import numpy as np
 
+try:
+    from utils.sheets_batch import SheetsBatch
+except ImportError:
+    from sheets_batch import SheetsBatch
+
 class AdvancedAnalysisSheets:
     """Créateur de feuilles d'analyse avancée pour Google Sheets"""
     
@@ -28,20 +33,23 @@ class AdvancedAnalysisSheets:
         )
         self.logger = logging.getLogger(__name__)
     
-    def create_my_team_analysis(self):
+    def create_my_team_analysis(self, batch: SheetsBatch = None):
         """Crée la feuille d'analyse détaillée de mon équipe"""
         try:
-            # Vérifie si la feuille existe
-            try:
-                worksheet = self.spreadsheet.worksheet('👑 Mon Équipe - Analyse')
-            except:
-                worksheet = self.spreadsheet.add_worksheet('👑 Mon Équipe - Analyse', rows=2000, cols=30)
+            # Feuille existante ou créée ; écritures mises en file dans le batch
+            own_batch = batch is None
+            if own_batch:
+                batch = SheetsBatch(self.spreadsheet)
+            worksheet = batch.worksheet('👑 Mon Équipe - Analyse', rows=2000, cols=30)
             
             # Configuration de la feuille
             self._setup_my_team_headers(worksheet)
             self._setup_my_team_formulas(worksheet)
             self._setup_my_team_formatting(worksheet)
             
+            if own_batch:
+                batch.flush()
+            
             self.logger.info("✅ Feuille 'Mon Équipe - Analyse' configurée")
             
         except Exception as e:
@@ -121,18 +129,21 @@ class AdvancedAnalysisSheets:
         worksheet.format('A13:H13', header_format)
         worksheet.format('A18:F18', header_format)
     
-    def create_roto_optimization(self):
+    def create_roto_optimization(self, batch: SheetsBatch = None):
         """Crée la feuille d'optimisation ROTO"""
         try:
-            try:
-                worksheet = self.spreadsheet.worksheet('🎯 Optimisation ROTO')
-            except:
-                worksheet = self.spreadsheet.add_worksheet('🎯 Optimisation ROTO', rows=2000, cols=30)
+            own_batch = batch is None
+            if own_batch:
+                batch = SheetsBatch(self.spreadsheet)
+            worksheet = batch.worksheet('🎯 Optimisation ROTO', rows=2000, cols=30)
             
             self._setup_roto_headers(worksheet)
             self._setup_roto_formulas(worksheet)
             self._setup_roto_formatting(worksheet)
             
+            if own_batch:
+                batch.flush()
+            
             self.logger.info("✅ Feuille 'Optimisation ROTO' configurée")
             
         except Exception as e:
@@ -195,18 +206,21 @@ class AdvancedAnalysisSheets:
         worksheet.format('A9:H9', header_format)
         worksheet.format('A14:H14', header_format)
     
-    def create_bench_analysis(self):
+    def create_bench_analysis(self, batch: SheetsBatch = None):
         """Crée la feuille d'analyse du banc"""
         try:
-            try:
-                worksheet = self.spreadsheet.worksheet('🪑 Analyse Banc')
-            except:
-                worksheet = self.spreadsheet.add_worksheet('🪑 Analyse Banc', rows=2000, cols=30)
+            own_batch = batch is None
+            if own_batch:
+                batch = SheetsBatch(self.spreadsheet)
+            worksheet = batch.worksheet('🪑 Analyse Banc', rows=2000, cols=30)
             
             self._setup_bench_headers(worksheet)
             self._setup_bench_formulas(worksheet)
             self._setup_bench_formatting(worksheet)
             
+            if own_batch:
+                batch.flush()
+            
             self.logger.info("✅ Feuille 'Analyse Banc' configurée")
             
         except Exception as e:
@@ -273,18 +287,21 @@ class AdvancedAnalysisSheets:
         worksheet.format('A9:H9', header_format)
         worksheet.format('A14:H14', header_format)
     
-    def create_dashboard(self):
+    def create_dashboard(self, batch: SheetsBatch = None):
         """Crée le dashboard principal"""
         try:
-            try:
-                worksheet = self.spreadsheet.worksheet('📊 Dashboard Principal')
-            except:
-                worksheet = self.spreadsheet.add_worksheet('📊 Dashboard Principal', rows=2000, cols=30)
+            own_batch = batch is None
+            if own_batch:
+                batch = SheetsBatch(self.spreadsheet)
+            worksheet = batch.worksheet('📊 Dashboard Principal', rows=2000, cols=30)
             
             self._setup_dashboard_headers(worksheet)
             self._setup_dashboard_formulas(worksheet)
             self._setup_dashboard_formatting(worksheet)
             
+            if own_batch:
+                batch.flush()
+            
             self.logger.info("✅ Dashboard principal configuré")
             
         except Exception as e:
@@ -377,12 +394,15 @@ class AdvancedAnalysisSheets:
         self.logger.info("🚀 Création de toutes les feuilles d'analyse...")
         
         try:
-            self.create_my_team_analysis()
-            self.create_roto_optimization()
-            self.create_bench_analysis()
-            self.create_dashboard()
+            # Toutes les valeurs, formules et formats partent en un seul batchUpdate
+            batch = SheetsBatch(self.spreadsheet)
+            self.create_my_team_analysis(batch)
+            self.create_roto_optimization(batch)
+            self.create_bench_analysis(batch)
+            self.create_dashboard(batch)
+            sent = batch.flush()
             
-            self.logger.info("✅ Toutes les feuilles d'analyse créées avec succès")
+            self.logger.info(f"✅ Toutes les feuilles d'analyse créées avec succès ({sent} opérations, 1 requête)")
             
         except Exception as e:
             self.logger.error(f"❌ Erreur création feuilles d'analyse: {e}")
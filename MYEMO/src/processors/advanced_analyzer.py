@@ -6,6 +6,7 @@ Collecte quotidienne structurée pour analyses IA et optimisations
 """
 
 import json
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -13,9 +14,24 @@ import requests
 import time
 import logging
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from espn_api.basketball import League
-from espn_api.basketball import ESPN
+
+try:
+    from processors.category_matrix import CategoryMatrix
+    from processors.lineup_optimizer import LineupOptimizer, LineupPlan, slot_counts_from_rosters, teams_playing_on
+    from processors.league_snapshot import ColumnTable, LeagueSnapshot, PlayerStats
+    from processors.snapshot_history import DEFAULT_HISTORY_DIR, SnapshotHistory
+except ImportError:  # Exécution directe depuis src/processors
+    from category_matrix import CategoryMatrix
+    from lineup_optimizer import LineupOptimizer, LineupPlan, slot_counts_from_rosters, teams_playing_on
+    from league_snapshot import ColumnTable, LeagueSnapshot, PlayerStats
+    from snapshot_history import DEFAULT_HISTORY_DIR, SnapshotHistory
+
+try:
+    from collectors.league_replay import open_league
+    from utils.instrumentation import PipelineMetrics
+except ImportError:  # Exécution depuis la racine MYEMO
+    from src.collectors.league_replay import open_league
+    from src.utils.instrumentation import PipelineMetrics
 
 # Configuration du logging
 logging.basicConfig(
@@ -28,76 +44,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class PlayerStats:
-    """Structure pour les stats d'un joueur"""
-    player_id: str
-    name: str
-    position: str
-    team: str
-    status: str  # active/bench/injured
-    injury_status: str
-    points: float
-    rebounds: float
-    assists: float
-    steals: float
-    blocks: float
-    fg_percentage: float
-    ft_percentage: float
-    three_pointers: int
-    turnovers: int
-    plus_minus: float
-    minutes: float
-    games_played: int
-    date: str
-    is_bench: bool
-    efficiency: float
-    usage_rate: float
-
-@dataclass
-class TeamData:
-    """Structure pour les données d'une équipe"""
-    team_id: str
-    team_name: str
-    manager: str
-    is_my_team: bool
-    roster: List[PlayerStats]
-    total_stats: Dict[str, float]
-    bench_stats: Dict[str, float]
-    active_stats: Dict[str, float]
-    ranking: int
-    category_rankings: Dict[str, int]
-
-@dataclass
-class LeagueSnapshot:
-    """Snapshot complet de la ligue à un moment donné"""
-    date: str
-    league_id: str
-    season: int
-    scoring_type: str
-    teams: List[TeamData]
-    free_agents: List[Dict]
-    transactions: List[Dict]
-    injuries: List[Dict]
-    nba_schedule: List[Dict]
-    hot_cold_analysis: Dict
-    ai_recommendations: List[Dict]
-
 class ESPNNBAAdvancedAnalyzer:
     """Analyseur avancé pour ESPN Fantasy NBA"""
     
-    def __init__(self, league_id: int, season: int, my_team_name: str = "Neon Cobras 99"):
+    TEAM_STAT_CATEGORIES = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'fg_percentage', 'ft_percentage', 'three_pointers', 'turnovers']
+    PERCENTAGE_CATEGORIES = ['fg_percentage', 'ft_percentage']  # Moyenne des valeurs > 0 au lieu de la somme
+    LOWER_IS_BETTER_CATEGORIES = ['turnovers']  # Rang 1 = plus petite valeur
+    LINEUP_GAIN_THRESHOLD = 0.5  # Gain de valeur (écarts-types de catégorie) justifiant une alerte lineup
+    HOT_COLD_DAYS = 7  # Période récente comparée à la saison
+    HOT_COLD_MIN_GAMES = 2  # Matchs joués sur la période pour juger une tendance
+    HOT_COLD_THRESHOLD = 0.2  # Écart relatif (moyenne récente / saison) d'un joueur hot ou cold
+    HOT_COLD_TOP = 10
+    
+    def __init__(self, league_id: int, season: int, my_team_name: str = "Neon Cobras 99", league=None,
+                 history_dir: str = None, history_size: int = 7):
         self.league_id = league_id
         self.season = season
         self.my_team_name = my_team_name
-        self.league = None
-        self.data_history = []
-        self.setup_league()
+        self.league = league  # Ligue déjà construite (synthétique, rejeu) : pas de connexion
+        # Historique persistant : history_size snapshots en mémoire, les autres relus depuis le disque
+        self.data_history = SnapshotHistory(
+            history_dir or os.path.join(DEFAULT_HISTORY_DIR, str(league_id)),
+            max_in_memory=history_size
+        )
+        if self.league is None:
+            self.setup_league()
     
     def setup_league(self):
         """Initialise la connexion à la ligue ESPN"""
         try:
-            self.league = League(league_id=self.league_id, year=self.season)
+            # ESPN_LEAGUE_MODE=record|replay pour enregistrer / rejouer la ligue hors ligne
+            self.league = open_league(league_id=self.league_id, year=self.season)
             logger.info(f"✅ Connexion établie à la ligue {self.league_id} - {self.season}")
             logger.info(f"🏀 Ligue: {self.league.settings.name}")
             logger.info(f"👥 {len(self.league.teams)} équipes")
@@ -110,37 +87,48 @@ class ESPNNBAAdvancedAnalyzer:
         logger.info("🚀 Début de la collecte quotidienne des données")
         
         current_date = datetime.now().strftime("%Y-%m-%d")
+        # Chemin absolu : les mesures vont dans logs/ du projet quel que soit le dossier courant
+        metrics = PipelineMetrics('advanced_analyzer',
+                                  os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs')))
         
         # 1. Infos générales ligue
-        league_info = self._get_league_info()
+        with metrics.stage('league_info'):
+            league_info = self._get_league_info()
         
         # 2. Données des équipes
-        teams_data = self._get_teams_data()
+        with metrics.stage('teams_data'):
+            teams_data = self._get_teams_data()
         
         # 3. Free agents
-        free_agents = self._get_free_agents()
+        with metrics.stage('free_agents'):
+            free_agents = self._get_free_agents()
         
         # 4. Transactions
-        transactions = self._get_transactions()
+        with metrics.stage('transactions'):
+            transactions = self._get_transactions()
         
         # 5. Blessures
-        injuries = self._get_injuries()
+        with metrics.stage('injuries'):
+            injuries = self._get_injuries()
         
         # 6. Planning NBA
-        nba_schedule = self._get_nba_schedule()
+        with metrics.stage('nba_schedule'):
+            nba_schedule = self._get_nba_schedule()
         
         # 7. Analyses hot/cold
-        hot_cold = self._analyze_hot_cold_streaks()
+        with metrics.stage('hot_cold'):
+            hot_cold = self._analyze_hot_cold_streaks(teams_data['player_table'])
         
         # 8. Recommandations IA
-        ai_recs = self._generate_ai_recommendations()
+        with metrics.stage('ai_recommendations'):
+            ai_recs = self._generate_ai_recommendations(teams_data['player_table'])
         
         snapshot = LeagueSnapshot(
             date=current_date,
             league_id=str(self.league_id),
             season=self.season,
             scoring_type=league_info['scoring_type'],
-            teams=teams_data,
+            **teams_data,
             free_agents=free_agents,
             transactions=transactions,
             injuries=injuries,
@@ -150,6 +138,8 @@ class ESPNNBAAdvancedAnalyzer:
         )
         
         self.data_history.append(snapshot)
+        metrics_file = metrics.write()
+        logger.info(f"⏱️ Mesures par étape : {metrics_file}")
         logger.info("✅ Collecte quotidienne terminée")
         
         return snapshot
@@ -166,141 +156,109 @@ class ESPNNBAAdvancedAnalyzer:
             'current_week': self.league.current_week
         }
     
-    def _get_teams_data(self) -> List[TeamData]:
-        """Récupère les données complètes de toutes les équipes"""
-        teams_data = []
+    def _get_teams_data(self) -> Dict[str, Any]:
+        """Récupère les données complètes de toutes les équipes (tables colonnaires)"""
+        teams = list(self.league.teams)
+        
+        # Rosters complets avec statuts, une ligne par joueur
+        players = self._get_players_table(teams)
+        
+        # Stats totales, banc et actives de toutes les équipes en une seule matrice
+        matrix = self._category_matrix_from_table(players, len(teams))
+        team_stats = {
+            'total': self._team_stats_values(matrix, 'all'),
+            'bench': self._team_stats_values(matrix, 'bench'),
+            'active': self._team_stats_values(matrix, 'active')
+        }
         
-        for team in self.league.teams:
-            is_my_team = team.team_name == self.my_team_name
-            
-            # Roster complet avec statuts
-            roster = self._get_team_roster(team)
-            
-            # Stats totales
-            total_stats = self._calculate_team_stats(roster, bench_only=False)
-            bench_stats = self._calculate_team_stats(roster, bench_only=True)
-            active_stats = self._calculate_team_stats(roster, active_only=True)
-            
-            # Classements
-            ranking = team.standing
-            category_rankings = self._get_category_rankings(team)
-            
-            team_data = TeamData(
-                team_id=str(team.team_id),
-                team_name=team.team_name,
-                manager=team.owner,
-                is_my_team=is_my_team,
-                roster=roster,
-                total_stats=total_stats,
-                bench_stats=bench_stats,
-                active_stats=active_stats,
-                ranking=ranking,
-                category_rankings=category_rankings
-            )
-            
-            teams_data.append(team_data)
+        team_table = ColumnTable.from_lists({
+            'team_id': [str(team.team_id) for team in teams],
+            'team_name': [team.team_name for team in teams],
+            'manager': [team.owner for team in teams],
+            'is_my_team': [team.team_name == self.my_team_name for team in teams],
+            'ranking': [team.standing for team in teams]
+        })
         
-        return teams_data
+        return {
+            'player_table': players,
+            'team_table': team_table,
+            'categories': list(self.TEAM_STAT_CATEGORIES),
+            'team_stats': team_stats,
+            # Classements par catégorie sur les stats totales
+            'category_rankings': self._get_category_rankings(team_stats['total'])
+        }
     
-    def _get_team_roster(self, team) -> List[PlayerStats]:
-        """Récupère le roster d'une équipe avec statuts détaillés"""
-        roster = []
+    def _get_players_table(self, teams: List) -> ColumnTable:
+        """Table joueurs de toutes les équipes, remplie colonne par colonne"""
+        columns = {name: [] for name in PlayerStats.__dataclass_fields__}
+        columns['team_row'] = []
         current_date = datetime.now().strftime("%Y-%m-%d")
         
-        for player in team.roster:
-            # Détermine si le joueur est sur le banc
-            is_bench = player.lineupSlot in ['BE', 'IR']
-            
-            # Stats du joueur
-            stats = {
-                'points': player.total_points,
-                'rebounds': player.rebounds,
-                'assists': player.assists,
-                'steals': player.steals,
-                'blocks': player.blocks,
-                'fg_percentage': player.field_goal_percentage,
-                'ft_percentage': player.free_throw_percentage,
-                'three_pointers': player.three_pointers_made,
-                'turnovers': player.turnovers,
-                'plus_minus': getattr(player, 'plus_minus', 0),
-                'minutes': getattr(player, 'minutes', 0),
-                'games_played': getattr(player, 'games_played', 0)
-            }
-            
-            # Calculs avancés
-            efficiency = self._calculate_efficiency(stats)
-            usage_rate = getattr(player, 'usage_rate', 0)
-            
-            player_stats = PlayerStats(
-                player_id=str(player.playerId),
-                name=player.name,
-                position=player.position,
-                team=player.proTeam,
-                status='active' if not is_bench else 'bench',
-                injury_status=getattr(player, 'injuryStatus', ''),
-                points=stats['points'],
-                rebounds=stats['rebounds'],
-                assists=stats['assists'],
-                steals=stats['steals'],
-                blocks=stats['blocks'],
-                fg_percentage=stats['fg_percentage'],
-                ft_percentage=stats['ft_percentage'],
-                three_pointers=stats['three_pointers'],
-                turnovers=stats['turnovers'],
-                plus_minus=stats['plus_minus'],
-                minutes=stats['minutes'],
-                games_played=stats['games_played'],
-                date=current_date,
-                is_bench=is_bench,
-                efficiency=efficiency,
-                usage_rate=usage_rate
-            )
-            
-            roster.append(player_stats)
-        
-        return roster
+        for team_row, team in enumerate(teams):
+            for player in team.roster:
+                # Détermine si le joueur est sur le banc
+                is_bench = player.lineupSlot in ['BE', 'IR']
+                
+                # Stats du joueur
+                stats = {
+                    'points': player.total_points,
+                    'rebounds': player.rebounds,
+                    'assists': player.assists,
+                    'steals': player.steals,
+                    'blocks': player.blocks,
+                    'fg_percentage': player.field_goal_percentage,
+                    'ft_percentage': player.free_throw_percentage,
+                    'three_pointers': player.three_pointers_made,
+                    'turnovers': player.turnovers,
+                    'plus_minus': getattr(player, 'plus_minus', 0),
+                    'minutes': getattr(player, 'minutes', 0),
+                    'games_played': getattr(player, 'games_played', 0)
+                }
+                for key, value in stats.items():
+                    columns[key].append(value)
+                
+                columns['player_id'].append(str(player.playerId))
+                columns['name'].append(player.name)
+                columns['position'].append(player.position)
+                columns['team'].append(player.proTeam)
+                columns['status'].append('active' if not is_bench else 'bench')
+                columns['injury_status'].append(getattr(player, 'injuryStatus', ''))
+                columns['date'].append(current_date)
+                columns['is_bench'].append(is_bench)
+                # Calculs avancés
+                columns['efficiency'].append(self._calculate_efficiency(stats))
+                columns['usage_rate'].append(getattr(player, 'usage_rate', 0))
+                columns['team_row'].append(team_row)
+        
+        return ColumnTable.from_lists(columns)
     
-    def _calculate_team_stats(self, roster: List[PlayerStats], bench_only: bool = False, active_only: bool = False) -> Dict[str, float]:
-        """Calcule les stats d'une équipe (totales, bench, ou actives)"""
-        filtered_roster = roster
-        
-        if bench_only:
-            filtered_roster = [p for p in roster if p.is_bench]
-        elif active_only:
-            filtered_roster = [p for p in roster if not p.is_bench]
-        
-        if not filtered_roster:
-            return {key: 0.0 for key in ['points', 'rebounds', 'assists', 'steals', 'blocks', 'fg_percentage', 'ft_percentage', 'three_pointers', 'turnovers']}
-        
-        stats = {
-            'points': sum(p.points for p in filtered_roster),
-            'rebounds': sum(p.rebounds for p in filtered_roster),
-            'assists': sum(p.assists for p in filtered_roster),
-            'steals': sum(p.steals for p in filtered_roster),
-            'blocks': sum(p.blocks for p in filtered_roster),
-            'fg_percentage': np.mean([p.fg_percentage for p in filtered_roster if p.fg_percentage > 0]),
-            'ft_percentage': np.mean([p.ft_percentage for p in filtered_roster if p.ft_percentage > 0]),
-            'three_pointers': sum(p.three_pointers for p in filtered_roster),
-            'turnovers': sum(p.turnovers for p in filtered_roster)
-        }
-        
-        return stats
+    def _category_matrix_from_table(self, players: ColumnTable, n_teams: int) -> CategoryMatrix:
+        """Matrice joueurs × catégories prise directement dans les colonnes de la table"""
+        values = np.column_stack([players[c] for c in self.TEAM_STAT_CATEGORIES]) if len(players) \
+            else np.zeros((0, len(self.TEAM_STAT_CATEGORIES)))
+        return CategoryMatrix(
+            categories=self.TEAM_STAT_CATEGORIES,
+            values=values,
+            team_index=players['team_row'].astype(np.intp),
+            is_bench=players['is_bench'],
+            has_stats=np.ones(len(players), dtype=bool),
+            team_ids=list(range(n_teams)),
+            players=players
+        )
     
-    def _get_category_rankings(self, team) -> Dict[str, int]:
-        """Récupère les classements par catégorie pour une équipe"""
-        # Cette fonction nécessiterait l'accès aux classements détaillés
-        # Pour l'instant, on retourne des valeurs par défaut
-        return {
-            'points': 1,
-            'rebounds': 1,
-            'assists': 1,
-            'steals': 1,
-            'blocks': 1,
-            'fg_percentage': 1,
-            'ft_percentage': 1,
-            'three_pointers': 1,
-            'turnovers': 1
-        }
+    def _team_stats_values(self, matrix: CategoryMatrix, subset: str) -> np.ndarray:
+        """Stats par équipe (équipes × catégories) pour un sous-ensemble ('all', 'bench', 'active')"""
+        totals = matrix.team_totals(subset)
+        means = matrix.team_positive_means(subset)
+        percentage = np.isin(matrix.categories, self.PERCENTAGE_CATEGORIES)
+        return np.where(percentage, means, totals)
+    
+    def _get_category_rankings(self, team_values: np.ndarray) -> np.ndarray:
+        """Rangs par catégorie de toutes les équipes (équipes × catégories, 1 = meilleur)"""
+        lower_is_better = np.isin(self.TEAM_STAT_CATEGORIES, self.LOWER_IS_BETTER_CATEGORIES)
+        return np.where(lower_is_better,
+                        CategoryMatrix.rank(team_values, descending=False),
+                        CategoryMatrix.rank(team_values)).astype(np.int64)
     
     def _calculate_efficiency(self, stats: Dict) -> float:
         """Calcule l'efficacité d'un joueur"""
@@ -350,57 +308,105 @@ class ESPNNBAAdvancedAnalyzer:
         # Cette fonction nécessiterait l'intégration avec l'API NBA
         return schedule
     
-    def _analyze_hot_cold_streaks(self) -> Dict:
-        """Analyse les tendances hot/cold des joueurs"""
-        if len(self.data_history) < 2:
+    def _analyze_hot_cold_streaks(self, players: ColumnTable = None) -> Dict:
+        """Tendances hot/cold des joueurs : production par match depuis un snapshot de l'historique
+
+        Les colonnes de la table sont des totaux de saison : l'écart avec le
+        snapshot de référence (le plus ancien des HOT_COLD_DAYS derniers jours,
+        relu depuis le disque) donne la moyenne récente, comparée à la moyenne
+        de la saison (efficacité par match).
+        """
+        if players is None or not len(players) or not self.data_history:
             return {}
-        
-        # Compare les performances récentes
-        current_snapshot = self.data_history[-1]
-        previous_snapshot = self.data_history[-2]
-        
-        hot_cold_analysis = {
-            'hot_players': [],
-            'cold_players': [],
-            'trending_up': [],
-            'trending_down': []
+        cutoff = (datetime.now() - timedelta(days=self.HOT_COLD_DAYS)).strftime("%Y-%m-%d")
+        recent = self.data_history.since(cutoff)
+        reference = (recent[0] if recent else self.data_history[-1]).player_table
+        previous = {player_id: (reference['efficiency'][row], reference['games_played'][row])
+                    for row, player_id in enumerate(reference['player_id'].tolist())}
+
+        trends = []
+        for row, player_id in enumerate(players['player_id'].tolist()):
+            if player_id not in previous:
+                continue
+            efficiency, games = float(players['efficiency'][row]), float(players['games_played'][row])
+            previous_efficiency, previous_games = previous[player_id]
+            recent_games = games - float(previous_games)
+            if recent_games < self.HOT_COLD_MIN_GAMES:
+                continue
+            recent_avg = (efficiency - float(previous_efficiency)) / recent_games
+            season_avg = efficiency / games
+            trends.append({
+                'player_id': player_id,
+                'name': players.value('name', row),
+                'team': players.value('team', row),
+                'games': int(recent_games),
+                'recent_avg': round(recent_avg, 2),
+                'season_avg': round(season_avg, 2),
+                'delta': round(recent_avg - season_avg, 2)
+            })
+        trends.sort(key=lambda trend: trend['delta'], reverse=True)
+
+        threshold = self.HOT_COLD_THRESHOLD
+        return {
+            'reference_date': (recent[0] if recent else self.data_history[-1]).date,
+            'hot_players': [t for t in trends if t['recent_avg'] >= t['season_avg'] * (1 + threshold)],
+            'cold_players': [t for t in reversed(trends) if t['recent_avg'] <= t['season_avg'] * (1 - threshold)],
+            'trending_up': [t for t in trends if t['delta'] > 0][:self.HOT_COLD_TOP],
+            'trending_down': [t for t in reversed(trends) if t['delta'] < 0][:self.HOT_COLD_TOP]
         }
-        
-        # Analyse des tendances (simplifiée)
-        for team in current_snapshot.teams:
-            for player in team.roster:
-                # Logique d'analyse des tendances
-                pass
-        
-        return hot_cold_analysis
     
-    def _generate_ai_recommendations(self) -> List[Dict]:
+    def _generate_ai_recommendations(self, players: ColumnTable = None) -> List[Dict]:
         """Génère des recommandations IA basées sur les données"""
         recommendations = []
         
-        # Analyse des points perdus sur le banc
-        my_team = None
-        for team in self.data_history[-1].teams if self.data_history else []:
-            if team.is_my_team:
-                my_team = team
-                break
-        
-        if my_team:
-            # Recommandations basées sur les stats du banc
-            bench_points = my_team.bench_stats.get('points', 0)
-            if bench_points > 20:  # Seuil arbitraire
+        # Production récupérable sur le banc : lineup optimal du jour de mon équipe
+        if players is not None:
+            plan = self._optimize_lineups(players).get(self.my_team_name.strip())
+            if plan and plan.gain > self.LINEUP_GAIN_THRESHOLD:
+                moves = ", ".join([f"titulariser {name}" for name in plan.start] +
+                                  [f"mettre {name} sur le banc" for name in plan.bench])
                 recommendations.append({
-                    'type': 'bench_optimization',
-                    'message': f"Points perdus sur le banc: {bench_points:.1f}",
-                    'priority': 'high'
+                    'type': 'lineup_optimization',
+                    'message': f"Lineup non optimal (+{plan.gain:.1f}) : {moves}",
+                    'priority': 'high',
+                    'start': plan.start,
+                    'bench': plan.bench,
+                    'gain': round(plan.gain, 2)
                 })
         
         return recommendations
     
+    def _optimize_lineups(self, players: ColumnTable) -> Dict[str, LineupPlan]:
+        """Lineups optimaux du jour de toutes les équipes (projections : moyennes par match de la table joueurs)"""
+        rosters = [(team.team_name.strip(), list(team.roster)) for team in self.league.teams]
+        if not len(players):
+            return {}
+        optimizer = LineupOptimizer(
+            self.TEAM_STAT_CATEGORIES,
+            slot_counts_from_rosters(roster for _, roster in rosters),
+            lower_is_better=self.LOWER_IS_BETTER_CATEGORIES,
+            percentage=self.PERCENTAGE_CATEGORIES
+        )
+        # Lignes de la table dans l'ordre des rosters (voir _get_players_table)
+        projections = self._per_game_projections(players)
+        teams_playing = teams_playing_on(player for _, roster in rosters for player in roster)
+        return optimizer.optimize_league(rosters, projections, teams_playing)
+
+    def _per_game_projections(self, players: ColumnTable) -> np.ndarray:
+        """Production attendue sur un match : totaux de saison / matchs joués (pourcentages inchangés)
+
+        Un joueur sans match joué est projeté à 0 dans les catégories de comptage.
+        """
+        totals = np.column_stack([players[c] for c in self.TEAM_STAT_CATEGORIES]).astype(float)
+        games = np.asarray(players['games_played'], dtype=float)[:, None]
+        per_game = np.divide(totals, games, out=np.zeros_like(totals), where=games > 0)
+        percentage = np.isin(self.TEAM_STAT_CATEGORIES, self.PERCENTAGE_CATEGORIES)
+        return np.where(percentage, totals, per_game)
+    
     def export_to_google_sheets_format(self, snapshot: LeagueSnapshot) -> Dict:
-        """Exporte les données au format Google Sheets"""
+        """Exporte les données au format Google Sheets (lu directement dans les tables)"""
         export_data = {
-            'league_info': asdict(snapshot),
+            'league_info': snapshot.to_dict(),
             'teams_summary': [],
             'players_detailed': [],
             'transactions': snapshot.transactions,
@@ -410,36 +416,37 @@ class ESPNNBAAdvancedAnalyzer:
         }
         
         # Résumé des équipes
-        for team in snapshot.teams:
-            export_data['teams_summary'].append({
-                'team_name': team.team_name,
-                'manager': team.manager,
-                'is_my_team': team.is_my_team,
-                'ranking': team.ranking,
-                'total_points': team.total_stats.get('points', 0),
-                'bench_points': team.bench_stats.get('points', 0),
-                'active_points': team.active_stats.get('points', 0)
-            })
+        points = snapshot.categories.index('points')
+        teams = snapshot.team_table
+        export_data['teams_summary'] = ColumnTable({
+            'team_name': teams['team_name'],
+            'manager': teams['manager'],
+            'is_my_team': teams['is_my_team'],
+            'ranking': teams['ranking'],
+            'total_points': snapshot.team_stats['total'][:, points],
+            'bench_points': snapshot.team_stats['bench'][:, points],
+            'active_points': snapshot.team_stats['active'][:, points]
+        }).to_records()
         
         # Détails des joueurs
-        for team in snapshot.teams:
-            for player in team.roster:
-                export_data['players_detailed'].append({
-                    'date': player.date,
-                    'team': team.team_name,
-                    'is_my_team': team.is_my_team,
-                    'player_name': player.name,
-                    'position': player.position,
-                    'status': player.status,
-                    'is_bench': player.is_bench,
-                    'points': player.points,
-                    'rebounds': player.rebounds,
-                    'assists': player.assists,
-                    'steals': player.steals,
-                    'blocks': player.blocks,
-                    'efficiency': player.efficiency,
-                    'injury_status': player.injury_status
-                })
+        players = snapshot.player_table
+        team_rows = players['team_row']
+        export_data['players_detailed'] = ColumnTable({
+            'date': players['date'],
+            'team': teams['team_name'][team_rows],
+            'is_my_team': teams['is_my_team'][team_rows],
+            'player_name': players['name'],
+            'position': players['position'],
+            'status': players['status'],
+            'is_bench': players['is_bench'],
+            'points': players['points'],
+            'rebounds': players['rebounds'],
+            'assists': players['assists'],
+            'steals': players['steals'],
+            'blocks': players['blocks'],
+            'efficiency': players['efficiency'],
+            'injury_status': players['injury_status']
+        }).to_records()
         
         return export_data
     
@@ -473,10 +480,10 @@ class ESPNNBAAdvancedAnalyzer:
             print(f"🪑 Points sur le banc: {my_team.bench_stats.get('points', 0):.1f}")
             print(f"⚡ Points actifs: {my_team.active_stats.get('points', 0):.1f}")
             
-            # Analyse des points perdus
-            bench_points = my_team.bench_stats.get('points', 0)
-            if bench_points > 15:
-                print(f"⚠️  ATTENTION: {bench_points:.1f} points perdus sur le banc!")
+            # Lineup non optimal (production récupérable sur le banc, voir lineup_optimizer)
+            for recommendation in snapshot.ai_recommendations:
+                if recommendation.get('type') == 'lineup_optimization':
+                    print(f"⚠️  ATTENTION: {recommendation['message']}")
         
         # Classement général
         print(f"\n🏆 CLASSEMENT GÉNÉRAL")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Moteur d'agrégation vectorisé des catégories
+Matrice dense joueurs × catégories + index d'équipe et de slot (banc/actif)
+"""
+
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class CategoryMatrix:
+    """Stats de tous les joueurs de la ligue sous forme de matrice NumPy"""
+
+    def __init__(self, categories: List[str], values: np.ndarray, team_index: np.ndarray,
+                 is_bench: np.ndarray, has_stats: np.ndarray, team_ids: List, players: List):
+        self.categories = list(categories)
+        self.values = values          # (joueurs × catégories)
+        self.team_index = team_index  # équipe de chaque joueur (position dans team_ids)
+        self.is_bench = is_bench      # slot BE/IR
+        self.has_stats = has_stats    # le joueur a des stats exploitables
+        self.team_ids = list(team_ids)
+        self.players = players
+        self._team_rows = {team_id: i for i, team_id in enumerate(self.team_ids)}
+
+    @classmethod
+    def from_rosters(cls, categories: List[str], team_rosters: Iterable[Tuple],
+                     stats_getter: Callable[[object], Optional[Dict]],
+                     bench_getter: Callable[[object], bool] = None) -> 'CategoryMatrix':
+        """Construit la matrice en un seul passage sur les rosters.
+
+        team_rosters : (team_id, joueurs) pour chaque équipe
+        stats_getter : dict catégorie -> valeur pour un joueur (None si pas de stats)
+        """
+        team_ids, players, team_index, rows, is_bench, has_stats = [], [], [], [], [], []
+        for position, (team_id, roster) in enumerate(team_rosters):
+            team_ids.append(team_id)
+            for player in roster:
+                stats = stats_getter(player)
+                players.append(player)
+                team_index.append(position)
+                has_stats.append(stats is not None)
+                is_bench.append(bool(bench_getter(player)) if bench_getter else False)
+                rows.append([float(stats.get(c, 0) or 0) for c in categories] if stats else [0.0] * len(categories))
+
+        return cls(
+            categories=categories,
+            values=np.array(rows, dtype=float).reshape(len(rows), len(categories)),
+            team_index=np.array(team_index, dtype=np.intp),
+            is_bench=np.array(is_bench, dtype=bool),
+            has_stats=np.array(has_stats, dtype=bool),
+            team_ids=team_ids,
+            players=players
+        )
+
+    @property
+    def n_teams(self) -> int:
+        return len(self.team_ids)
+
+    def team_row(self, team_id) -> int:
+        return self._team_rows[team_id]
+
+    def player_rows(self, team_id) -> np.ndarray:
+        return np.flatnonzero(self.team_index == self._team_rows[team_id])
+
+    def _mask(self, subset: str) -> np.ndarray:
+        """'all', 'bench' (BE/IR) ou 'active'"""
+        if subset == 'bench':
+            return self.is_bench
+        if subset == 'active':
+            return ~self.is_bench
+        return np.ones(len(self.team_index), dtype=bool)
+
+    def team_totals(self, subset: str = 'all') -> np.ndarray:
+        """Totaux par équipe (équipes × catégories)"""
+        mask = self._mask(subset)
+        totals = np.zeros((self.n_teams, len(self.categories)))
+        np.add.at(totals, self.team_index[mask], self.values[mask])
+        return totals
+
+    def team_counts(self, subset: str = 'all', with_stats_only: bool = True) -> np.ndarray:
+        """Nombre de joueurs par équipe (avec stats uniquement par défaut)"""
+        mask = self._mask(subset)
+        if with_stats_only:
+            mask = mask & self.has_stats
+        return np.bincount(self.team_index[mask], minlength=self.n_teams)
+
+    def team_averages(self, subset: str = 'all') -> np.ndarray:
+        """Moyenne par joueur avec stats (0 si aucun joueur)"""
+        counts = self.team_counts(subset)[:, None]
+        return np.divide(self.team_totals(subset), counts,
+                         out=np.zeros((self.n_teams, len(self.categories))), where=counts > 0)
+
+    def team_positive_means(self, subset: str = 'all') -> np.ndarray:
+        """Moyenne des valeurs > 0 par équipe (pourcentages FG%/FT%)"""
+        mask = self._mask(subset)
+        positive = (self.values[mask] > 0)
+        sums = np.zeros((self.n_teams, len(self.categories)))
+        counts = np.zeros((self.n_teams, len(self.categories)))
+        np.add.at(sums, self.team_index[mask], np.where(positive, self.values[mask], 0.0))
+        np.add.at(counts, self.team_index[mask], positive)
+        return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    @staticmethod
+    def rank(values: np.ndarray, descending: bool = True) -> np.ndarray:
+        """Rangs (1 = meilleur) par colonne ; les égalités gardent l'ordre des lignes"""
+        values = np.asarray(values, dtype=float)
+        order = np.argsort(-values if descending else values, axis=0, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, values.shape[0] + 1)[:, None], axis=0)
+        return ranks
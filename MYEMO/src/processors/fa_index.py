@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Index en mémoire des agents libres et classement top-K
+- z-scores par catégorie calculés une fois à la construction
+- Index des lignes par position éligible et par équipe NBA
+- top() : score pondéré (z-scores × poids) sur les seuls candidats filtrés,
+  sélection par argpartition puis tri des K meilleurs
+
+Usage :
+    PYTHONPATH=src python src/processors/fa_index.py --weights stl=1 blk=1 --position C --top 10
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from collectors.data_models import FA_STAT_KEYS
+except ImportError:  # Exécution directe depuis src/processors
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from collectors.data_models import FA_STAT_KEYS
+
+# Emplacements de lineup qui ne sont pas des positions
+NON_POSITION_SLOTS = {'BE', 'IR', 'UT', 'Util', 'FA'}
+
+
+def stat_key(name: str) -> str:
+    """Nom de catégorie normalisé ('FG%' -> 'fg_pct', 'STL' -> 'stl')"""
+    return name.strip().lower().replace('%', '_pct')
+
+
+def player_positions(player) -> List[str]:
+    """Positions éligibles d'un joueur ESPN (eligibleSlots, sinon position)"""
+    slots = [slot for slot in getattr(player, 'eligibleSlots', None) or [] if slot not in NON_POSITION_SLOTS]
+    return slots or [getattr(player, 'position', 'N/A')]
+
+
+class FreeAgentIndex:
+    """Agents libres indexés par position, équipe NBA et z-score par catégorie"""
+
+    def __init__(self, players: Sequence[str], positions: Sequence[Iterable[str]], nba_teams: Sequence[str],
+                 values: np.ndarray, stat_keys: Sequence[str] = FA_STAT_KEYS, negative_keys: Sequence[str] = ()):
+        self.players = list(players)
+        self.positions = [tuple(dict.fromkeys(p)) for p in positions]
+        self.nba_teams = list(nba_teams)
+        self.stat_keys = tuple(stat_keys)
+        self.values = np.asarray(values, dtype=float).reshape(len(self.players), len(self.stat_keys))
+        self._key_index = {key: j for j, key in enumerate(self.stat_keys)}
+
+        # z-scores : valeur manquante = moyenne (z = 0), catégorie constante = 0
+        present = ~np.isnan(self.values)
+        counts = present.sum(axis=0)
+        means = np.divide(np.where(present, self.values, 0.0).sum(axis=0), counts,
+                          out=np.zeros(len(self.stat_keys)), where=counts > 0)
+        filled = np.where(present, self.values, means)
+        stds = np.sqrt(np.divide(((filled - means) ** 2).sum(axis=0), counts,
+                                 out=np.zeros(len(self.stat_keys)), where=counts > 0))
+        self.zscores = np.divide(filled - means, stds, out=np.zeros_like(filled), where=stds > 0)
+        for key in negative_keys:  # Catégories où moins = mieux (TO)
+            self.zscores[:, self._key_index[stat_key(key)]] *= -1
+
+        self.by_position = self._group(self.positions)
+        self.by_team = self._group([(team,) for team in self.nba_teams])
+
+    @staticmethod
+    def _group(keys: Sequence[Iterable[str]]) -> Dict[str, np.ndarray]:
+        groups: Dict[str, List[int]] = {}
+        for row, row_keys in enumerate(keys):
+            for key in row_keys:
+                groups.setdefault(key, []).append(row)
+        return {key: np.array(rows, dtype=np.intp) for key, rows in groups.items()}
+
+    @classmethod
+    def from_players(cls, players: Sequence, values: np.ndarray, stat_keys: Sequence[str] = FA_STAT_KEYS,
+                     negative_keys: Sequence[str] = ()) -> 'FreeAgentIndex':
+        """Index à partir des joueurs ESPN et de leur matrice de stats (joueurs × stat_keys)"""
+        return cls(
+            players=[player.name for player in players],
+            positions=[player_positions(player) for player in players],
+            nba_teams=[getattr(player, 'proTeam', 'Unknown') for player in players],
+            values=values,
+            stat_keys=stat_keys,
+            negative_keys=negative_keys
+        )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def weight_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        vector = np.zeros(len(self.stat_keys))
+        for name, weight in weights.items():
+            key = stat_key(name)
+            if key not in self._key_index:
+                raise ValueError(f"Catégorie inconnue : {name} (disponibles : {', '.join(self.stat_keys)})")
+            vector[self._key_index[key]] = weight
+        return vector
+
+    def candidates(self, position: str = None, nba_team: str = None) -> np.ndarray:
+        """Lignes satisfaisant les filtres (toutes les lignes sans filtre)"""
+        rows = None
+        if position is not None:
+            rows = self.by_position.get(position, np.zeros(0, dtype=np.intp))
+        if nba_team is not None:
+            team_rows = self.by_team.get(nba_team, np.zeros(0, dtype=np.intp))
+            rows = team_rows if rows is None else np.intersect1d(rows, team_rows, assume_unique=True)
+        return np.arange(len(self.players)) if rows is None else rows
+
+    def top(self, weights: Dict[str, float], k: int = 10, position: str = None, nba_team: str = None,
+            exclude: Iterable[str] = ()) -> List[Dict]:
+        """K meilleurs agents libres pour les poids donnés ({'stl': 1, 'blk': 1})"""
+        rows = self.candidates(position, nba_team)
+        excluded = set(exclude)
+        if excluded:
+            rows = rows[[self.players[row] not in excluded for row in rows.tolist()]]
+        if not len(rows) or k <= 0:
+            return []
+
+        scores = self.zscores[rows] @ self.weight_vector(weights)
+        if k < len(rows):
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(rows))
+        best = best[np.argsort(-scores[best], kind='stable')]
+
+        return [{
+            'player': self.players[row],
+            'positions': list(self.positions[row]),
+            'nba_team': self.nba_teams[row],
+            'score': float(scores[i]),
+            **{key: float(value) for key, value in zip(self.stat_keys, self.values[row].tolist())}
+        } for i, row in zip(best.tolist(), rows[best].tolist())]
+
+
+def parse_weights(items: Sequence[str]) -> Dict[str, float]:
+    """['stl=1', 'blk=0.5', '3pm'] -> {'stl': 1.0, 'blk': 0.5, '3pm': 1.0}"""
+    weights = {}
+    for item in items:
+        name, _, weight = item.partition('=')
+        weights[stat_key(name)] = float(weight) if weight else 1.0
+    return weights
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Top-K des agents libres de la ligue (ESPN_LEAGUE_MODE=replay pour travailler hors ligne)"""
+    parser = argparse.ArgumentParser(description="Meilleurs agents libres pour des catégories pondérées")
+    parser.add_argument('--weights', nargs='+', default=list(FA_STAT_KEYS),
+                        help="Catégories et poids : stl=1 blk=1 (défaut : toutes à 1)")
+    parser.add_argument('--position', help="Position éligible (PG, SG, SF, PF, C, G, F)")
+    parser.add_argument('--team', help="Équipe NBA (abréviation ESPN)")
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--window', default='rolling_14d',
+                        choices=['daily', 'last_week', 'rolling_14d', 'rolling_30d'])
+    args = parser.parse_args(argv)
+
+    from collectors.collect_data import DataCollector
+
+    collector = DataCollector()
+    index = collector.free_agent_index(args.window)
+    weights = parse_weights(args.weights)
+    results = index.top(weights, k=args.top, position=args.position, nba_team=args.team)
+
+    print(f"\n🔎 TOP {args.top} AGENTS LIBRES ({', '.join(f'{k}×{v:g}' for k, v in weights.items())})")
+    print("=" * 70)
+    if not results:
+        print("Aucun agent libre ne correspond aux filtres")
+    for rank, hit in enumerate(results, 1):
+        stats = ' '.join(f"{key}={hit[key]:.1f}" for key in weights)
+        print(f"{rank:2d}. {hit['player']:<28} {'/'.join(hit['positions']):<10} {hit['nba_team']:<5} "
+              f"score={hit['score']:+.2f}  {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Snapshot de ligue en représentation colonnaire
+- Une table joueurs et une table équipes (un tableau NumPy par colonne)
+- Stats par équipe (total / banc / actif) et rangs par catégorie en matrices
+- Vues paresseuses TeamView / PlayerView avec les attributs de TeamData /
+  PlayerStats pour les appelants existants (snapshot.teams, team.roster...)
+La sérialisation (JSON, CSV, Parquet) lit directement les colonnes, sans
+copie profonde d'objets.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+@dataclass
+class PlayerStats:
+    """Structure pour les stats d'un joueur"""
+    player_id: str
+    name: str
+    position: str
+    team: str
+    status: str  # active/bench/injured
+    injury_status: str
+    points: float
+    rebounds: float
+    assists: float
+    steals: float
+    blocks: float
+    fg_percentage: float
+    ft_percentage: float
+    three_pointers: int
+    turnovers: int
+    plus_minus: float
+    minutes: float
+    games_played: int
+    date: str
+    is_bench: bool
+    efficiency: float
+    usage_rate: float
+
+
+@dataclass
+class TeamData:
+    """Structure pour les données d'une équipe"""
+    team_id: str
+    team_name: str
+    manager: str
+    is_my_team: bool
+    roster: List[PlayerStats]
+    total_stats: Dict[str, float]
+    bench_stats: Dict[str, float]
+    active_stats: Dict[str, float]
+    ranking: int
+    category_rankings: Dict[str, int]
+
+
+PLAYER_FIELDS = [f.name for f in fields(PlayerStats)]
+PLAYER_TEXT_FIELDS = {'player_id', 'name', 'position', 'team', 'status', 'injury_status', 'date'}
+TEAM_FIELDS = ['team_id', 'team_name', 'manager', 'is_my_team', 'ranking']
+TEAM_STAT_SUBSETS = ('total', 'bench', 'active')
+
+
+def _python(value):
+    """Scalaire NumPy -> scalaire Python (attributs des vues, JSON)"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _column_dtype(name: str):
+    if name in PLAYER_TEXT_FIELDS or name in ('team_id', 'team_name', 'manager'):
+        return object
+    if name in ('is_bench', 'is_my_team'):
+        return bool
+    if name in ('team_row', 'ranking'):
+        return np.int64
+    return float
+
+
+class ColumnTable:
+    """Table colonnaire : un tableau NumPy par colonne, toutes de même longueur"""
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+        self.names = list(columns)
+
+    @classmethod
+    def from_lists(cls, columns: Dict[str, list]) -> 'ColumnTable':
+        return cls({name: np.asarray(values, dtype=_column_dtype(name)) for name, values in columns.items()})
+
+    def __len__(self) -> int:
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def value(self, name: str, row: int):
+        return _python(self.columns[name][row])
+
+    def to_frame(self, columns: Sequence[str] = None) -> pd.DataFrame:
+        """DataFrame sur les mêmes tableaux (pas de copie des colonnes)"""
+        names = list(columns) if columns is not None else self.names
+        return pd.DataFrame({name: self.columns[name] for name in names}, copy=False)
+
+    def to_records(self, columns: Sequence[str] = None) -> List[Dict]:
+        """Lignes en dicts de scalaires Python (format JSON)"""
+        names = list(columns) if columns is not None else self.names
+        values = [self.columns[name].tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_arrow(self):
+        if pa is None:
+            raise ImportError("pyarrow est requis pour to_arrow() (pip install pyarrow)")
+        return pa.table({name: pa.array(self.columns[name], from_pandas=True) for name in self.names})
+
+
+class PlayerView:
+    """Ligne de la table joueurs vue comme un PlayerStats (lecture seule)"""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: ColumnTable, row: int):
+        self._table = table
+        self._row = row
+
+    def __getattr__(self, name):
+        if name not in self._table:
+            raise AttributeError(name)
+        return self._table.value(name, self._row)
+
+    def to_record(self) -> PlayerStats:
+        return PlayerStats(**{name: self._table.value(name, self._row) for name in PLAYER_FIELDS})
+
+    def __repr__(self) -> str:
+        return f"PlayerView({self.name!r})"
+
+
+class TeamView:
+    """Ligne de la table équipes vue comme un TeamData ; le roster est construit à la demande"""
+
+    __slots__ = ('_snapshot', '_row')
+
+    def __init__(self, snapshot: 'LeagueSnapshot', row: int):
+        self._snapshot = snapshot
+        self._row = row
+
+    def __getattr__(self, name):
+        if name not in self._snapshot.team_table:
+            raise AttributeError(name)
+        return self._snapshot.team_table.value(name, self._row)
+
+    @property
+    def roster(self) -> List[PlayerView]:
+        players = self._snapshot.player_table
+        return [PlayerView(players, row) for row in self._snapshot.player_rows(self._row).tolist()]
+
+    @property
+    def total_stats(self) -> Dict[str, float]:
+        return self._snapshot.team_stats_dict('total', self._row)
+
+    @property
+    def bench_stats(self) -> Dict[str, float]:
+        return self._snapshot.team_stats_dict('bench', self._row)
+
+    @property
+    def active_stats(self) -> Dict[str, float]:
+        return self._snapshot.team_stats_dict('active', self._row)
+
+    @property
+    def category_rankings(self) -> Dict[str, int]:
+        return dict(zip(self._snapshot.categories, self._snapshot.category_rankings[self._row].tolist()))
+
+    def to_record(self) -> TeamData:
+        return TeamData(
+            team_id=self.team_id,
+            team_name=self.team_name,
+            manager=self.manager,
+            is_my_team=self.is_my_team,
+            roster=[player.to_record() for player in self.roster],
+            total_stats=self.total_stats,
+            bench_stats=self.bench_stats,
+            active_stats=self.active_stats,
+            ranking=self.ranking,
+            category_rankings=self.category_rankings
+        )
+
+    def __repr__(self) -> str:
+        return f"TeamView({self.team_name!r})"
+
+
+@dataclass(eq=False)
+class LeagueSnapshot:
+    """Snapshot complet de la ligue à un moment donné (tables joueurs / équipes)"""
+    date: str
+    league_id: str
+    season: int
+    scoring_type: str
+    player_table: ColumnTable          # une ligne par joueur, colonne team_row = ligne de l'équipe
+    team_table: ColumnTable            # une ligne par équipe
+    categories: List[str]
+    team_stats: Dict[str, np.ndarray]  # 'total' / 'bench' / 'active' -> (équipes × catégories)
+    category_rankings: np.ndarray      # (équipes × catégories)
+    free_agents: List[Dict] = field(default_factory=list)
+    transactions: List[Dict] = field(default_factory=list)
+    injuries: List[Dict] = field(default_factory=list)
+    nba_schedule: List[Dict] = field(default_factory=list)
+    hot_cold_analysis: Dict = field(default_factory=dict)
+    ai_recommendations: List[Dict] = field(default_factory=list)
+
+    def __post_init__(self):
+        # Index joueurs par équipe : un tri stable, puis des bornes par équipe
+        team_rows = self.player_table['team_row'] if len(self.player_table) else np.zeros(0, dtype=np.int64)
+        self._player_order = np.argsort(team_rows, kind='stable')
+        self._team_bounds = np.searchsorted(team_rows[self._player_order], np.arange(len(self.team_table) + 1))
+
+    @property
+    def teams(self) -> List[TeamView]:
+        return [TeamView(self, row) for row in range(len(self.team_table))]
+
+    @property
+    def my_team(self) -> Optional[TeamView]:
+        rows = np.flatnonzero(self.team_table['is_my_team']) if len(self.team_table) else []
+        return TeamView(self, int(rows[0])) if len(rows) else None
+
+    @property
+    def n_players(self) -> int:
+        return len(self.player_table)
+
+    def player_rows(self, team_row: int) -> np.ndarray:
+        return self._player_order[self._team_bounds[team_row]:self._team_bounds[team_row + 1]]
+
+    def team_stats_dict(self, subset: str, team_row: int) -> Dict[str, float]:
+        return dict(zip(self.categories, self.team_stats[subset][team_row].tolist()))
+
+    @classmethod
+    def from_teams(cls, date: str, league_id: str, season: int, scoring_type: str, teams: List[TeamData],
+                   categories: Sequence[str], **extras) -> 'LeagueSnapshot':
+        """Construit le snapshot colonnaire à partir de TeamData imbriqués (ancien format)"""
+        players = {name: [] for name in PLAYER_FIELDS + ['team_row']}
+        for row, team in enumerate(teams):
+            for player in team.roster:
+                for name in PLAYER_FIELDS:
+                    players[name].append(getattr(player, name))
+                players['team_row'].append(row)
+        team_columns = {name: [getattr(team, name) for team in teams] for name in TEAM_FIELDS}
+        stats = {subset: np.array([[getattr(team, f'{subset}_stats').get(c, 0) for c in categories] for team in teams],
+                                  dtype=float).reshape(len(teams), len(categories))
+                 for subset in TEAM_STAT_SUBSETS}
+        rankings = np.array([[team.category_rankings.get(c, 0) for c in categories] for team in teams],
+                            dtype=np.int64).reshape(len(teams), len(categories))
+        return cls(date=date, league_id=league_id, season=season, scoring_type=scoring_type,
+                   player_table=ColumnTable.from_lists(players), team_table=ColumnTable.from_lists(team_columns),
+                   categories=list(categories), team_stats=stats, category_rankings=rankings, **extras)
+
+    def info(self) -> Dict:
+        """Champs scalaires et listes légères du snapshot"""
+        return {
+            'date': self.date,
+            'league_id': self.league_id,
+            'season': self.season,
+            'scoring_type': self.scoring_type,
+            'categories': list(self.categories),
+            'free_agents': self.free_agents,
+            'transactions': self.transactions,
+            'injuries': self.injuries,
+            'nba_schedule': self.nba_schedule,
+            'hot_cold_analysis': self.hot_cold_analysis,
+            'ai_recommendations': self.ai_recommendations
+        }
+
+    def team_frame(self) -> pd.DataFrame:
+        """Table équipes + colonnes <total|bench|active>_<catégorie> et rank_<catégorie>"""
+        frame = self.team_table.to_frame()
+        for subset in TEAM_STAT_SUBSETS:
+            for j, category in enumerate(self.categories):
+                frame[f'{subset}_{category}'] = self.team_stats[subset][:, j]
+        for j, category in enumerate(self.categories):
+            frame[f'rank_{category}'] = self.category_rankings[:, j]
+        return frame
+
+    def player_frame(self) -> pd.DataFrame:
+        return self.player_table.to_frame()
+
+    def to_dict(self) -> Dict:
+        """Snapshot complet en structures JSON (tables en listes de lignes)"""
+        data = self.info()
+        data['teams'] = self.team_frame().to_dict(orient='records')
+        data['players'] = self.player_table.to_records()
+        return data
+
+    def save(self, directory: str, fmt: str = 'json') -> List[str]:
+        """Écrit le snapshot ('json', 'csv' ou 'parquet') ; retourne les fichiers créés"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"snapshot_{self.date}")
+        if fmt == 'json':
+            path = f"{base}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, default=str)
+            return [path]
+        if fmt == 'csv':
+            paths = [f"{base}_players.csv", f"{base}_teams.csv"]
+            self.player_frame().to_csv(paths[0], index=False)
+            self.team_frame().to_csv(paths[1], index=False)
+            return paths
+        if fmt == 'parquet':
+            if pq is None:
+                raise ImportError("pyarrow est requis pour l'export Parquet (pip install pyarrow)")
+            paths = [f"{base}_players.parquet", f"{base}_teams.parquet"]
+            pq.write_table(self.player_table.to_arrow(), paths[0])
+            pq.write_table(pa.Table.from_pandas(self.team_frame(), preserve_index=False), paths[1])
+            return paths
+        raise ValueError(f"Format inconnu : {fmt}")
+
+    def save_compressed(self, path: str) -> str:
+        """Archive .npz compressée : colonnes numériques en tableaux, texte et listes en JSON"""
+        arrays, text = {}, {}
+        for prefix, table in (('player', self.player_table), ('team', self.team_table)):
+            for name in table.names:
+                column = table[name]
+                if column.dtype == object:
+                    text[f'{prefix}.{name}'] = column.tolist()
+                else:
+                    arrays[f'{prefix}.{name}'] = column
+        for subset in TEAM_STAT_SUBSETS:
+            arrays[f'stats.{subset}'] = self.team_stats[subset]
+        arrays['category_rankings'] = self.category_rankings
+        meta = dict(self.info(), text=text, columns={'player': self.player_table.names, 'team': self.team_table.names})
+        arrays['meta'] = np.array(json.dumps(meta, ensure_ascii=False, default=str))
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load_compressed(cls, path: str) -> 'LeagueSnapshot':
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(str(archive['meta']))
+            text = meta.pop('text')
+            tables = {}
+            for prefix, names in meta.pop('columns').items():
+                tables[prefix] = ColumnTable({
+                    name: np.asarray(text[f'{prefix}.{name}'], dtype=object) if f'{prefix}.{name}' in text
+                    else archive[f'{prefix}.{name}']
+                    for name in names
+                })
+            team_stats = {subset: archive[f'stats.{subset}'] for subset in TEAM_STAT_SUBSETS}
+            category_rankings = archive['category_rankings']
+        return cls(player_table=tables['player'], team_table=tables['team'], team_stats=team_stats,
+                   category_rankings=category_rankings, **meta)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Optimisation du lineup du jour (affectation joueurs -> emplacements)
+- Valeur attendue d'un joueur = P(joue aujourd'hui) × projection par
+  catégorie pondérée (catégories mises à l'échelle par leur écart-type
+  dans la ligue ; TO négatif ; FG% / FT% centrés sur la moyenne)
+- P(joue) : 0 sans match NBA ce jour ou si OUT, réduite si incertain
+- Emplacements actifs (PG, SG, SF, PF, C, G, F, UT...) déduits des lineups
+  actuels ; affectation optimale par l'algorithme hongrois
+  (scipy.optimize.linear_sum_assignment) sur la matrice joueurs × emplacements
+- Valeurs de toute la ligue calculées en une opération matricielle, puis
+  une petite affectation par équipe : quelques millisecondes par ligue
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+# Emplacements qui ne comptent pas dans les stats du jour
+NON_STARTING_SLOTS = ('BE', 'IR')
+# Lineup ESPN standard, utilisé si les lineups actuels ne permettent pas de le déduire
+DEFAULT_SLOT_COUNTS = {'PG': 1, 'SG': 1, 'SF': 1, 'PF': 1, 'C': 1, 'G': 1, 'F': 1, 'UT': 3}
+# Probabilité de jouer selon le statut de blessure ESPN
+PLAY_PROBABILITY = {
+    'ACTIVE': 1.0, 'NORMAL': 1.0, '': 1.0, None: 1.0,
+    'DAY_TO_DAY': 0.5, 'QUESTIONABLE': 0.5, 'DOUBTFUL': 0.25,
+    'OUT': 0.0, 'INJURY_RESERVE': 0.0, 'SUSPENSION': 0.0,
+}
+# Affectation interdite (joueur non éligible à l'emplacement)
+FORBIDDEN = -1e9
+# Départage des égalités en faveur du lineup actuel (pas de changement sans gain)
+KEEP_BONUS = 1e-6
+
+
+def slot_counts_from_rosters(rosters: Iterable[Sequence]) -> Dict[str, int]:
+    """Nombre d'emplacements actifs par type, d'après les lineups actuels (maximum sur les équipes)"""
+    counts: Dict[str, int] = {}
+    largest_lineup = 0
+    for roster in rosters:
+        team_counts: Dict[str, int] = {}
+        for player in roster:
+            slot = getattr(player, 'lineupSlot', '') or ''
+            if slot and slot not in NON_STARTING_SLOTS:
+                team_counts[slot] = team_counts.get(slot, 0) + 1
+        for slot, count in team_counts.items():
+            counts[slot] = max(counts.get(slot, 0), count)
+        largest_lineup = max(largest_lineup, sum(team_counts.values()))
+    # Lineups sans gabarit commun (plus d'emplacements qu'aucune équipe n'en a) : lineup standard
+    if not counts or sum(counts.values()) > largest_lineup:
+        return dict(DEFAULT_SLOT_COUNTS)
+    return counts
+
+
+def teams_playing_on(players: Iterable, day: date = None) -> Optional[Set[str]]:
+    """Équipes NBA qui jouent ce jour-là, d'après le calendrier des joueurs ESPN (player.schedule)
+
+    None si aucun joueur n'a de calendrier (calendrier inconnu).
+    """
+    day = day or date.today()
+    playing = set()
+    known = False
+    for player in players:
+        schedule = getattr(player, 'schedule', None) or {}
+        known = known or bool(schedule)
+        for game in schedule.values():
+            game_date = game.get('date')
+            if isinstance(game_date, datetime) and game_date.date() == day:
+                playing.add(getattr(player, 'proTeam', None))
+                break
+    return playing if known else None
+
+
+def play_probability(player, teams_playing: Optional[Set[str]]) -> float:
+    """P(le joueur joue aujourd'hui) ; teams_playing=None : calendrier inconnu (tout le monde joue)"""
+    if teams_playing is not None and getattr(player, 'proTeam', None) not in teams_playing:
+        return 0.0
+    return PLAY_PROBABILITY.get(getattr(player, 'injuryStatus', None), 1.0)
+
+
+@dataclass
+class LineupPlan:
+    """Lineup optimal d'une équipe et écart avec le lineup actuel"""
+    team: str
+    assignments: List[Tuple[str, str]]       # (emplacement, joueur)
+    optimal_value: float
+    current_value: float
+    start: List[str] = field(default_factory=list)   # à titulariser (actuellement sur le banc)
+    bench: List[str] = field(default_factory=list)   # à mettre sur le banc
+
+    @property
+    def gain(self) -> float:
+        return self.optimal_value - self.current_value
+
+    def to_dict(self) -> Dict:
+        return {'team': self.team, 'assignments': self.assignments, 'optimal_value': self.optimal_value,
+                'current_value': self.current_value, 'gain': self.gain, 'start': self.start, 'bench': self.bench}
+
+
+class LineupOptimizer:
+    """Affectation optimale des joueurs aux emplacements actifs du jour"""
+
+    def __init__(self, categories: Sequence[str], slot_counts: Dict[str, int] = None,
+                 weights: Dict[str, float] = None, lower_is_better: Sequence[str] = (),
+                 percentage: Sequence[str] = ()):
+        self.categories = list(categories)
+        self.slot_counts = dict(slot_counts or DEFAULT_SLOT_COUNTS)
+        # Un emplacement par instance : ['PG', 'SG', ..., 'UT', 'UT', 'UT']
+        self.slots = [slot for slot, count in self.slot_counts.items() for _ in range(count)]
+        weights = weights or {}
+        self.weights = np.array([weights.get(c, -1.0 if c in lower_is_better else 1.0) for c in self.categories])
+        self.percentage = np.isin(self.categories, list(percentage))
+
+    def player_values(self, projections: np.ndarray, probabilities: np.ndarray) -> np.ndarray:
+        """Valeur attendue de chaque joueur (vecteur), projections joueurs × catégories"""
+        projections = np.nan_to_num(np.asarray(projections, dtype=float).reshape(-1, len(self.categories)))
+        stds = projections.std(axis=0)
+        means = projections.mean(axis=0)
+        # Volumes : apport brut ; pourcentages : écart à la moyenne de la ligue
+        centered = np.where(self.percentage, projections - means, projections)
+        scaled = np.divide(centered, stds, out=np.zeros_like(centered), where=stds > 0)
+        return np.asarray(probabilities, dtype=float) * (scaled @ self.weights)
+
+    def eligibility(self, eligible_slots: Sequence[Iterable[str]]) -> np.ndarray:
+        """Matrice booléenne joueurs × emplacements"""
+        slot_index: Dict[str, List[int]] = {}
+        for j, slot in enumerate(self.slots):
+            slot_index.setdefault(slot, []).append(j)
+        mask = np.zeros((len(eligible_slots), len(self.slots)), dtype=bool)
+        for i, slots in enumerate(eligible_slots):
+            for slot in slots:
+                mask[i, slot_index.get(slot, [])] = True
+        return mask
+
+    def optimize_team(self, names: Sequence[str], values: np.ndarray, eligible: np.ndarray,
+                      current_slots: Sequence[str], team: str = '') -> LineupPlan:
+        """Lineup optimal d'une équipe (joueurs IR exclus par l'appelant)"""
+        values = np.asarray(values, dtype=float)
+        currently_active = np.array([slot not in NON_STARTING_SLOTS and slot != '' for slot in current_slots],
+                                    dtype=bool)
+        gains = np.where(eligible, (values + KEEP_BONUS * currently_active)[:, None], FORBIDDEN)
+        rows, columns = linear_sum_assignment(gains, maximize=True)
+        valid = eligible[rows, columns]
+        rows, columns = rows[valid], columns[valid]
+
+        starters = set(rows.tolist())
+        return LineupPlan(
+            team=team,
+            assignments=[(self.slots[j], names[i]) for i, j in sorted(zip(rows.tolist(), columns.tolist()),
+                                                                      key=lambda pair: pair[1])],
+            optimal_value=float(values[rows].sum()),
+            current_value=float(values[currently_active].sum()),
+            start=[names[i] for i in sorted(starters) if not currently_active[i]],
+            bench=[names[i] for i in range(len(names)) if currently_active[i] and i not in starters]
+        )
+
+    def optimize_league(self, team_rosters: Sequence[Tuple[str, Sequence]], projections: np.ndarray,
+                        teams_playing: Optional[Set[str]] = None) -> Dict[str, LineupPlan]:
+        """Lineups optimaux de toutes les équipes.
+
+        team_rosters : (nom d'équipe, joueurs ESPN) ; projections : joueurs × catégories,
+        lignes dans l'ordre des rosters concaténés.
+        """
+        players = [player for _, roster in team_rosters for player in roster]
+        probabilities = np.array([play_probability(player, teams_playing) for player in players])
+        values = self.player_values(projections, probabilities)
+        eligible = self.eligibility([getattr(player, 'eligibleSlots', None) or [] for player in players])
+        slots = [getattr(player, 'lineupSlot', '') or '' for player in players]
+
+        plans = {}
+        start = 0
+        for team, roster in team_rosters:
+            rows = np.arange(start, start + len(roster))
+            start += len(roster)
+            rows = rows[[slots[i] != 'IR' for i in rows.tolist()]]  # IR : hors lineup
+            plans[team] = self.optimize_team([players[i].name for i in rows.tolist()], values[rows],
+                                             eligible[rows], [slots[i] for i in rows.tolist()], team)
+        return plans
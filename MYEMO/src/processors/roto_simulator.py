@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Projection Monte Carlo du classement roto de fin de saison
+- Chaque joueur des rosters a une moyenne et un écart-type par match et par
+  catégorie (historique glissant) et un nombre de matchs restants
+- Une simulation tire le total de chaque joueur sur les matchs restants
+  (somme de G matchs ~ loi normale G·µ, √G·σ), l'agrège par équipe et
+  l'ajoute au classement actuel ; FG% / FT% : moyenne des joueurs pondérée
+  par l'avancement de la saison
+- Rangs par catégorie et points roto calculés pour un bloc de simulations
+  à la fois (simulations × équipes × catégories), sans boucle par simulation
+- run(workers=N) répartit les simulations sur N processus
+
+Usage :
+    PYTHONPATH=src python src/processors/roto_simulator.py --sims 10000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    from processors.category_matrix import CategoryMatrix
+except ImportError:  # Exécution directe depuis src/processors
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from processors.category_matrix import CategoryMatrix
+
+# Taille d'un bloc de simulations (simulations × joueurs × catégories en mémoire)
+CHUNK_SIZE = 1000
+# Plancher d'écart-type par match : Poisson pour les volumes, ±8 points pour les %
+PERCENTAGE_MIN_STD = 0.08
+
+
+class SimulationResult:
+    """Distribution des rangs par catégorie et des points roto de chaque équipe"""
+
+    def __init__(self, teams: Sequence, categories: Sequence[str], rank_counts: np.ndarray,
+                 total_points: np.ndarray):
+        self.teams = list(teams)
+        self.categories = list(categories)
+        self.rank_counts = rank_counts      # équipes × catégories × rangs (rang 1 en colonne 0)
+        self.total_points = total_points    # simulations × équipes
+
+    @property
+    def n_sims(self) -> int:
+        return len(self.total_points)
+
+    @classmethod
+    def merge(cls, results: Sequence['SimulationResult']) -> 'SimulationResult':
+        first = results[0]
+        return cls(first.teams, first.categories,
+                   sum(result.rank_counts for result in results),
+                   np.concatenate([result.total_points for result in results]))
+
+    def rank_probabilities(self) -> np.ndarray:
+        """P(rang r) par équipe et catégorie (équipes × catégories × rangs)"""
+        return self.rank_counts / max(self.n_sims, 1)
+
+    def expected_ranks(self) -> np.ndarray:
+        """Rang moyen par catégorie (équipes × catégories)"""
+        ranks = np.arange(1, len(self.teams) + 1)
+        return self.rank_probabilities() @ ranks
+
+    def final_rank_probabilities(self) -> np.ndarray:
+        """P(rang r au classement général) par équipe (équipes × rangs)
+
+        Égalité de points : les équipes concernées se partagent les places.
+        """
+        n_teams = len(self.teams)
+        points = self.total_points[:, :, None]
+        others = self.total_points[:, None, :]
+        best_rank = (others > points).sum(axis=2)    # simulations × équipes (0 = 1er)
+        tied = (others == points).sum(axis=2)        # soi-même compris
+        counts = np.zeros((n_teams, n_teams))
+        team_rows = np.broadcast_to(np.arange(n_teams), best_rank.shape)
+        for offset in range(n_teams):
+            shared = tied > offset
+            np.add.at(counts, (team_rows[shared], best_rank[shared] + offset), 1.0 / tied[shared])
+        return counts / max(self.n_sims, 1)
+
+    def summary(self) -> pd.DataFrame:
+        """Une ligne par équipe, triée par points roto moyens"""
+        final = self.final_rank_probabilities()
+        frame = pd.DataFrame({
+            'team': self.teams,
+            'mean_points': self.total_points.mean(axis=0),
+            'p10_points': np.percentile(self.total_points, 10, axis=0),
+            'p90_points': np.percentile(self.total_points, 90, axis=0),
+            'p_first': final[:, 0],
+            'p_top3': final[:, :3].sum(axis=1),
+        })
+        for j, category in enumerate(self.categories):
+            frame[f'rank_{category}'] = self.expected_ranks()[:, j]
+        return frame.sort_values('mean_points', ascending=False, kind='stable').reset_index(drop=True)
+
+
+class RotoSimulator:
+    """Simulations vectorisées de la fin de saison d'une ligue roto"""
+
+    def __init__(self, teams: Sequence, categories: Sequence[str], current: np.ndarray,
+                 team_index: np.ndarray, means: np.ndarray, stds: np.ndarray, games_remaining,
+                 percentage: Sequence[bool], lower_is_better: Sequence[bool] = None,
+                 season_progress: float = 0.5):
+        self.teams = list(teams)
+        self.categories = list(categories)
+        n_players, n_categories = len(team_index), len(self.categories)
+        self.current = np.asarray(current, dtype=float).reshape(len(self.teams), n_categories)
+        self.team_index = np.asarray(team_index, dtype=np.intp)
+        self.percentage = np.asarray(percentage, dtype=bool)
+        self.lower_is_better = np.zeros(n_categories, dtype=bool) if lower_is_better is None \
+            else np.asarray(lower_is_better, dtype=bool)
+        self.season_progress = float(np.clip(season_progress, 0.0, 1.0))
+
+        means = np.asarray(means, dtype=float).reshape(n_players, n_categories)
+        stds = np.asarray(stds, dtype=float).reshape(n_players, n_categories)
+        # Joueur sans historique : ne contribue pas (0 en volume, exclu des moyennes %)
+        self.contributes = ~np.isnan(means) & (means > 0)
+        means = np.where(self.contributes, means, 0.0)
+        # Plancher : Poisson (√µ) pour les volumes, PERCENTAGE_MIN_STD pour les %
+        floor = np.where(self.percentage, PERCENTAGE_MIN_STD, np.sqrt(means))
+        stds = np.where(np.isnan(stds), floor, np.maximum(stds, floor))
+        games = np.broadcast_to(np.asarray(games_remaining, dtype=float), (n_players,))[:, None]
+        games = np.maximum(games, 0.0)
+
+        # Paramètres de la loi du joueur sur les matchs restants :
+        # volumes -> total (G·µ, √G·σ) ; pourcentages -> moyenne (µ, σ/√G)
+        self.loc = np.where(self.percentage, means, games * means)
+        self.scale = np.where(self.percentage,
+                              np.divide(stds, np.sqrt(games), out=np.zeros_like(stds), where=games > 0),
+                              np.sqrt(games) * stds)
+        self.scale = np.where(self.contributes, self.scale, 0.0)
+
+        # Agrégation joueurs -> équipes par produit matriciel (joueurs × équipes)
+        self.membership = np.zeros((n_players, len(self.teams)))
+        self.membership[np.arange(n_players), self.team_index] = 1.0
+        self.pct_counts = self.membership.T @ self.contributes  # équipes × catégories
+
+    @classmethod
+    def from_category_matrix(cls, matrix: CategoryMatrix, current: np.ndarray, means: np.ndarray,
+                             stds: np.ndarray, games_remaining, percentage_categories: Sequence[str],
+                             lower_is_better: Sequence[str] = (), season_progress: float = 0.5,
+                             teams: Sequence = None) -> 'RotoSimulator':
+        """Simulateur à partir des rosters de la matrice joueurs × catégories"""
+        return cls(
+            teams=teams if teams is not None else matrix.team_ids,
+            categories=matrix.categories,
+            current=current,
+            team_index=matrix.team_index,
+            means=means,
+            stds=stds,
+            games_remaining=games_remaining,
+            percentage=np.isin(matrix.categories, list(percentage_categories)),
+            lower_is_better=np.isin(matrix.categories, list(lower_is_better)),
+            season_progress=season_progress
+        )
+
+    # --- Simulation ----------------------------------------------------------
+
+    def final_values(self, rng: np.random.Generator, n_sims: int) -> np.ndarray:
+        """Valeurs de fin de saison simulées (simulations × équipes × catégories)"""
+        draws = rng.standard_normal((n_sims,) + self.loc.shape) * self.scale + self.loc
+        draws = np.where(self.percentage, np.clip(draws, 0.0, 1.0), np.maximum(draws, 0.0))
+        draws *= self.contributes
+        # (simulations × joueurs × catégories) · (joueurs × équipes) -> simulations × équipes × catégories
+        totals = np.matmul(self.membership.T, draws)
+        pct = np.divide(totals, self.pct_counts, out=np.broadcast_to(self.current, totals.shape).copy(),
+                        where=self.pct_counts > 0)
+        pct = self.season_progress * self.current + (1.0 - self.season_progress) * pct
+        return np.where(self.percentage, pct, self.current + totals)
+
+    def ranks(self, values: np.ndarray):
+        """Rangs par catégorie de valeurs simulations × équipes × catégories
+
+        Retourne (rang, points roto) : rang 1 = meilleur, ex aequo au meilleur rang
+        commun ; points = n_équipes pour le 1er, égalités partagées (0,5 par équipe à égalité).
+        """
+        oriented = np.where(self.lower_is_better, -values, values)
+        mine = oriented[:, :, None, :]
+        others = oriented[:, None, :, :]
+        better = (others > mine).sum(axis=2)          # équipes devant
+        tied = (others == mine).sum(axis=2) - 1       # autres équipes à égalité
+        return better + 1, len(self.teams) - better - 0.5 * tied
+
+    def _simulate(self, n_sims: int, seed) -> SimulationResult:
+        rng = np.random.default_rng(seed)
+        n_teams, n_categories = len(self.teams), len(self.categories)
+        rank_counts = np.zeros((n_teams, n_categories, n_teams), dtype=np.int64)
+        total_points = np.empty((n_sims, n_teams))
+        # Case (équipe, catégorie, rang) aplatie pour un comptage par bincount
+        cell = (np.arange(n_teams)[:, None] * n_categories + np.arange(n_categories)[None, :]) * n_teams
+        for start in range(0, n_sims, CHUNK_SIZE):
+            size = min(CHUNK_SIZE, n_sims - start)
+            ranks, points = self.ranks(self.final_values(rng, size))
+            total_points[start:start + size] = points.sum(axis=2)
+            rank_counts += np.bincount((cell + ranks - 1).ravel(),
+                                       minlength=rank_counts.size).reshape(rank_counts.shape)
+        return SimulationResult(self.teams, self.categories, rank_counts, total_points)
+
+    def run(self, n_sims: int = 10000, workers: Optional[int] = None, seed=None) -> SimulationResult:
+        """n_sims simulations ; workers > 1 : processus parallèles (workers=0 : tous les cœurs)"""
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if not workers or workers <= 1 or n_sims < 2 * CHUNK_SIZE:
+            return self._simulate(n_sims, seed)
+
+        # Une graine indépendante par processus
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        sizes = [n_sims // workers + (i < n_sims % workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_part, [self] * workers, sizes, seeds))
+        return SimulationResult.merge(results)
+
+
+def _simulate_part(simulator: RotoSimulator, n_sims: int, seed) -> SimulationResult:
+    """Point d'entrée des processus de run(workers=...)"""
+    return simulator._simulate(n_sims, seed)
+
+
+def print_summary(result: SimulationResult, highlight: str = None) -> None:
+    summary = result.summary()
+    print(f"\n🎲 PROJECTION ROTO ({result.n_sims} simulations)")
+    print("=" * 70)
+    for position, row in enumerate(summary.itertuples(index=False), 1):
+        marker = '⭐' if highlight and str(row.team).strip() == highlight else '  '
+        print(f"{position:2d}. {marker}{str(row.team):<26} {row.mean_points:6.1f} pts "
+              f"[{row.p10_points:5.1f} - {row.p90_points:5.1f}]  "
+              f"1er {row.p_first:6.1%}  top 3 {row.p_top3:6.1%}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Projection du classement de la ligue (ESPN_LEAGUE_MODE=replay pour travailler hors ligne)"""
+    parser = argparse.ArgumentParser(description="Projection Monte Carlo du classement roto de fin de saison")
+    parser.add_argument('--sims', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=None, help="Processus parallèles (0 : tous les cœurs)")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    from collectors.collect_data import DataCollector
+
+    collector = DataCollector()
+    result = collector.roto_projection(args.sims, workers=args.workers, seed=args.seed)
+    print_summary(result, collector.my_team_name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Historique borné des snapshots de ligue
+- Chaque snapshot ajouté est écrit dans un store disque compressé (.npz)
+- Seuls les max_in_memory derniers snapshots utilisés restent en mémoire
+- Les plus anciens sont rechargés à la demande (history[i], since(date))
+L'historique survit donc aux redémarrages sans croître en mémoire.
+Plusieurs instances (ou processus) peuvent partager le même dossier :
+l'ajout se fait sous verrou fichier et le numéro suivant est lu sur le disque.
+"""
+
+import os
+import re
+from collections import OrderedDict
+from typing import Iterator, List, Tuple, Union
+
+try:
+    from processors.league_snapshot import LeagueSnapshot
+except ImportError:  # Exécution directe depuis src/processors
+    from league_snapshot import LeagueSnapshot
+
+try:
+    from utils.file_lock import file_lock
+except ImportError:  # Exécution depuis la racine du projet
+    from src.utils.file_lock import file_lock
+
+DEFAULT_HISTORY_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data/cache/snapshot_history'))
+_FILE_PATTERN = re.compile(r'^(\d{6})_(\d{4}-\d{2}-\d{2})\.npz$')
+
+
+class SnapshotHistory:
+    """Séquence de LeagueSnapshot (du plus ancien au plus récent) adossée au disque"""
+
+    def __init__(self, store_dir: str = DEFAULT_HISTORY_DIR, max_in_memory: int = 7, max_on_disk: int = None):
+        self.store_dir = store_dir
+        self.max_in_memory = max_in_memory
+        self.max_on_disk = max_on_disk
+        self._cache: 'OrderedDict[int, LeagueSnapshot]' = OrderedDict()
+        self.loads = 0  # Rechargements depuis le disque
+        os.makedirs(store_dir, exist_ok=True)
+        self._index: List[Tuple[int, str]] = []
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Relit l'index (numéro, date) sur le disque : ajouts et purges des autres instances"""
+        self._index = sorted(
+            (int(match.group(1)), match.group(2))
+            for match in map(_FILE_PATTERN.match, os.listdir(self.store_dir)) if match
+        )
+        present = {seq for seq, _ in self._index}
+        for seq in [seq for seq in self._cache if seq not in present]:
+            del self._cache[seq]
+
+    def _path(self, seq: int, date: str) -> str:
+        return os.path.join(self.store_dir, f"{seq:06d}_{date}.npz")
+
+    def append(self, snapshot: LeagueSnapshot) -> None:
+        # Verrou à côté du dossier (<store_dir>.lock) : numéro unique même entre processus
+        store_dir = os.path.abspath(self.store_dir)
+        with file_lock(os.path.basename(store_dir), os.path.dirname(store_dir)):
+            self.refresh()
+            seq = self._index[-1][0] + 1 if self._index else 0
+            snapshot.save_compressed(self._path(seq, snapshot.date))
+            self._index.append((seq, snapshot.date))
+            self._remember(seq, snapshot)
+            self._prune_disk()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._index)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, item: Union[int, slice]):
+        self.refresh()
+        if isinstance(item, slice):
+            return [self._load(position) for position in range(len(self._index))[item]]
+        if item < 0:
+            item += len(self._index)
+        if not 0 <= item < len(self._index):
+            raise IndexError("index d'historique hors limites")
+        return self._load(item)
+
+    def __iter__(self) -> Iterator[LeagueSnapshot]:
+        self.refresh()
+        for position in range(len(self._index)):
+            yield self._load(position)
+
+    @property
+    def dates(self) -> List[str]:
+        self.refresh()
+        return [date for _, date in self._index]
+
+    @property
+    def in_memory(self) -> int:
+        return len(self._cache)
+
+    def since(self, date: str) -> List[LeagueSnapshot]:
+        """Snapshots datés à partir de date (YYYY-MM-DD) ; seuls ceux-là sont chargés"""
+        self.refresh()
+        return [self._load(position) for position, (_, day) in enumerate(self._index) if day >= date]
+
+    def clear_memory(self) -> None:
+        self._cache.clear()
+
+    def _load(self, position: int) -> LeagueSnapshot:
+        seq, date = self._index[position]
+        snapshot = self._cache.get(seq)
+        if snapshot is None:
+            snapshot = LeagueSnapshot.load_compressed(self._path(seq, date))
+            self.loads += 1
+        self._remember(seq, snapshot)
+        return snapshot
+
+    def _remember(self, seq: int, snapshot: LeagueSnapshot) -> None:
+        """Garde le snapshot en mémoire (LRU), évince le moins récemment utilisé"""
+        self._cache[seq] = snapshot
+        self._cache.move_to_end(seq)
+        while len(self._cache) > self.max_in_memory:
+            self._cache.popitem(last=False)
+
+    def _prune_disk(self) -> None:
+        if self.max_on_disk is None:
+            return
+        while len(self._index) > self.max_on_disk:
+            seq, date = self._index.pop(0)
+            self._cache.pop(seq, None)
+            try:
+                os.remove(self._path(seq, date))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Score d'adéquation des agents libres avec mon équipe (team_fit_score)
+Gain marginal de points roto si l'agent libre rejoint mon roster :
+- profil par catégorie de chaque équipe (somme des moyennes des joueurs,
+  moyenne des valeurs > 0 pour FG% / FT%)
+- profil de mon équipe avec chaque agent libre (matrice agents × catégories)
+- points roto de ce profil face aux autres équipes, pour tous les agents
+  libres à la fois (comparaison agents × équipes × catégories)
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from processors.category_matrix import CategoryMatrix
+except ImportError:  # Exécution directe depuis src/processors
+    from category_matrix import CategoryMatrix
+
+
+def roto_points(mine: np.ndarray, others: np.ndarray, lower_is_better: np.ndarray = None) -> np.ndarray:
+    """Points roto de profils (... × catégories) face aux autres équipes (équipes × catégories).
+
+    1 point par équipe battue + 1 pour soi, 0,5 par égalité (barème roto classique).
+    """
+    mine = np.asarray(mine, dtype=float)[..., None, :]
+    beaten = mine > others
+    tied = mine == others
+    if lower_is_better is not None:
+        beaten = np.where(lower_is_better, mine < others, beaten)
+    return 1.0 + beaten.sum(axis=-2) + 0.5 * tied.sum(axis=-2)
+
+
+class TeamFitScorer:
+    """Gain roto marginal de chaque agent libre pour mon équipe"""
+
+    def __init__(self, team_values: np.ndarray, my_row: int, roster_counts: np.ndarray,
+                 percentage: Sequence[bool], lower_is_better: Sequence[bool] = None):
+        self.team_values = np.asarray(team_values, dtype=float)  # équipes × catégories
+        self.my_row = my_row
+        self.percentage = np.asarray(percentage, dtype=bool)
+        self.lower_is_better = None if lower_is_better is None else np.asarray(lower_is_better, dtype=bool)
+        self.roster_counts = np.asarray(roster_counts, dtype=float)  # joueurs comptés dans les moyennes %
+        self.mine = self.team_values[my_row]
+        self.others = np.delete(self.team_values, my_row, axis=0)
+        self.current_points = roto_points(self.mine, self.others, self.lower_is_better)
+
+    @classmethod
+    def from_category_matrix(cls, matrix: CategoryMatrix, my_team_id, percentage_categories: Sequence[str],
+                             lower_is_better: Sequence[str] = ()) -> 'TeamFitScorer':
+        """Profils des équipes à partir de la matrice joueurs × catégories des rosters"""
+        percentage = np.isin(matrix.categories, list(percentage_categories))
+        values = np.where(percentage, matrix.team_positive_means(), matrix.team_totals())
+        row = matrix.team_row(my_team_id)
+        # Nombre de joueurs avec une valeur > 0 par catégorie % (pondération de la nouvelle moyenne)
+        positive = np.zeros((matrix.n_teams, len(matrix.categories)))
+        np.add.at(positive, matrix.team_index, matrix.values > 0)
+        return cls(values, row, positive[row], percentage,
+                   np.isin(matrix.categories, list(lower_is_better)) if lower_is_better else None)
+
+    def profiles_with(self, fa_values: np.ndarray) -> np.ndarray:
+        """Profil de mon équipe avec chaque agent libre (agents × catégories)"""
+        fa_values = np.asarray(fa_values, dtype=float)
+        missing = np.isnan(fa_values)
+        # Catégories de volume : on ajoute ; pourcentages : nouvelle moyenne des valeurs > 0
+        counting = self.mine + np.where(missing, 0.0, fa_values)
+        contributes = ~missing & (fa_values > 0)
+        pct = np.divide(self.mine * self.roster_counts + np.where(contributes, fa_values, 0.0),
+                        self.roster_counts + contributes,
+                        out=np.broadcast_to(self.mine, fa_values.shape).copy(),
+                        where=(self.roster_counts + contributes) > 0)
+        return np.where(self.percentage, pct, counting)
+
+    def category_gains(self, fa_values: np.ndarray) -> np.ndarray:
+        """Gain de points roto par catégorie (agents × catégories)"""
+        return roto_points(self.profiles_with(fa_values), self.others, self.lower_is_better) - self.current_points
+
+    def score(self, fa_values: np.ndarray) -> np.ndarray:
+        """Gain total de points roto de chaque agent libre (vecteur agents)"""
+        return self.category_gains(fa_values).sum(axis=-1)
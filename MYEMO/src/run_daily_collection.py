@@ -12,7 +12,7 @@ import logging
 # Ajouter le répertoire courant au path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from espn_nba_advanced_analyzer import ESPNNBAAdvancedAnalyzer
+from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
 
 def setup_logging():
     """Configure le logging pour le script quotidien"""
@@ -10,10 +10,18 @@ import pandas as pd
 from datetime import datetime, timedelta
 import json
 import logging
+import os
+import sys
 from typing import Dict, List, Any
 import numpy as np
-from espn_nba_advanced_analyzer import ESPNNBAAdvancedAnalyzer
+try:
+    from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
+except ImportError:  # Exécution directe depuis src/utils
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
 from advanced_analysis_sheets import AdvancedAnalysisSheets
+from sheets_sync import SheetTable, SheetsSyncEngine
+from rate_limiter import RetryScheduler, client_session, is_retryable, mount_rate_limiting
 
 class CompleteGoogleSheetsSystem:
     """Système complet de transfert et analyse Google Sheets"""
@@ -29,6 +37,7 @@ class CompleteGoogleSheetsSystem:
         # Initialisation des composants
         self.setup_logging()
         self.setup_google_sheets()
+        self.sheets_sync = SheetsSyncEngine(self.spreadsheet)
         self.setup_analyzer()
         self.setup_analysis_sheets()
     
@@ -54,6 +63,8 @@ class CompleteGoogleSheetsSystem:
             )
             
             self.gc = gspread.authorize(creds)
+            # Quota Sheets : budget par hôte ; les reprises passent par RetryScheduler
+            mount_rate_limiting(client_session(self.gc), retries=False)
             
             if self.spreadsheet_id:
                 self.spreadsheet = self.gc.open_by_key(self.spreadsheet_id)
@@ -112,44 +123,40 @@ class CompleteGoogleSheetsSystem:
             self.logger.error(f"❌ Erreur dans le système complet: {e}")
             raise
     
-    def transfer_all_data(self, snapshot):
-        """Transfert toutes les données vers Google Sheets"""
+    def transfer_all_data(self, snapshot, force: bool = False):
+        """Transfert toutes les données vers Google Sheets (seules les cellules modifiées sont envoyées)"""
         try:
-            # Données quotidiennes
-            self._transfer_daily_data(snapshot)
-            
-            # Résumé des équipes
-            self._transfer_teams_summary(snapshot)
-            
-            # Joueurs détaillés
-            self._transfer_players_detailed(snapshot)
-            
-            # Transactions
-            self._transfer_transactions(snapshot)
-            
-            # Agents libres
-            self._transfer_free_agents(snapshot)
-            
-            # Blessures
-            self._transfer_injuries(snapshot)
+            builders = [
+                self._daily_data_table,       # Données quotidiennes
+                self._teams_summary_table,    # Résumé des équipes
+                self._players_detailed_table, # Joueurs détaillés
+                self._transactions_table,     # Transactions
+                self._free_agents_table,      # Agents libres
+                self._injuries_table          # Blessures
+            ]
+            tables = [table for table in (build(snapshot) for build in builders) if table is not None]
             
-            self.logger.info("✅ Toutes les données transférées")
+            report = self.sheets_sync.sync(tables, force=force)
+            if report.is_noop:
+                self.logger.info("✅ Google Sheets déjà à jour, aucune requête envoyée")
+            else:
+                self.logger.info(f"✅ Données transférées : {len(report.ranges)} plages, "
+                                 f"{report.cells} cellules, {report.requests} requête(s)")
+            return report
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert données: {e}")
     
-    def _transfer_daily_data(self, snapshot):
-        """Transfert les données quotidiennes"""
+    def _daily_data_table(self, snapshot):
+        """Table des données quotidiennes"""
         try:
-            worksheet = self.spreadsheet.worksheet('📊 Données Quotidiennes')
-            worksheet.clear()
+            title = '📊 Données Quotidiennes'
             
             # En-têtes
             headers = [
                 'Date', 'Ligue', 'Saison', 'Type Scoring', 'Équipes Total',
                 'Semaine Actuelle', 'Mon Équipe', 'Mon Rang'
             ]
-            worksheet.update('A1:H1', [headers])
             
             # Données
             current_date = datetime.now().strftime('%Y-%m-%d')
@@ -166,16 +173,15 @@ class CompleteGoogleSheetsSystem:
                 my_team.ranking if my_team else 'N/A'
             ]
             
-            worksheet.update('A2', [row])
+            return SheetTable(title, headers, [row], key_columns=(1,))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert données quotidiennes: {e}")
     
-    def _transfer_teams_summary(self, snapshot):
-        """Transfert le résumé des équipes"""
+    def _teams_summary_table(self, snapshot):
+        """Table du résumé des équipes"""
         try:
-            worksheet = self.spreadsheet.worksheet('🏀 Résumé Équipes')
-            worksheet.clear()
+            title = '🏀 Résumé Équipes'
             
             # En-têtes
             headers = [
@@ -183,7 +189,6 @@ class CompleteGoogleSheetsSystem:
                 'Points Totaux', 'Points Banc', 'Points Actifs',
                 'Rebonds', 'Assists', 'Steals', 'Blocks', 'FG%', 'FT%', '3PM', 'TO'
             ]
-            worksheet.update('A1:P1', [headers])
             
             # Données
             rows = []
@@ -210,16 +215,15 @@ class CompleteGoogleSheetsSystem:
                 ]
                 rows.append(row)
             
-            worksheet.update('A2', rows)
+            return SheetTable(title, headers, rows, key_columns=(1,))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert résumé équipes: {e}")
     
-    def _transfer_players_detailed(self, snapshot):
-        """Transfert les détails des joueurs"""
+    def _players_detailed_table(self, snapshot):
+        """Table des détails des joueurs"""
         try:
-            worksheet = self.spreadsheet.worksheet('👥 Joueurs Détaillés')
-            worksheet.clear()
+            title = '👥 Joueurs Détaillés'
             
             # En-têtes
             headers = [
@@ -228,7 +232,6 @@ class CompleteGoogleSheetsSystem:
                 'Steals', 'Blocks', 'FG%', 'FT%', '3PM', 'TO',
                 'Efficacité', 'Usage%', 'Blessure', 'Minutes'
             ]
-            worksheet.update('A1:T1', [headers])
             
             # Données
             rows = []
@@ -260,24 +263,21 @@ class CompleteGoogleSheetsSystem:
                     ]
                     rows.append(row)
             
-            worksheet.update('A2', rows)
+            return SheetTable(title, headers, rows, key_columns=(1, 3))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert joueurs détaillés: {e}")
     
-    def _transfer_transactions(self, snapshot):
-        """Transfert les transactions"""
+    def _transactions_table(self, snapshot):
+        """Table des transactions"""
         try:
-            worksheet = self.spreadsheet.worksheet('🔄 Transactions')
-            worksheet.clear()
+            title = '🔄 Transactions'
             
             if not snapshot.transactions:
-                worksheet.update('A1', [['Aucune transaction récente']])
-                return
+                return SheetTable(title, ['Aucune transaction récente'])
             
             # En-têtes
             headers = ['Date', 'Type', 'Description', 'Équipe']
-            worksheet.update('A1:D1', [headers])
             
             # Données
             rows = []
@@ -290,27 +290,24 @@ class CompleteGoogleSheetsSystem:
                 ]
                 rows.append(row)
             
-            worksheet.update('A2', rows)
+            return SheetTable(title, headers, rows, key_columns=(0, 1, 2, 3))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert transactions: {e}")
     
-    def _transfer_free_agents(self, snapshot):
-        """Transfert les agents libres"""
+    def _free_agents_table(self, snapshot):
+        """Table des agents libres"""
         try:
-            worksheet = self.spreadsheet.worksheet('🆓 Agents Libres')
-            worksheet.clear()
+            title = '🆓 Agents Libres'
             
             if not snapshot.free_agents:
-                worksheet.update('A1', [['Aucun agent libre disponible']])
-                return
+                return SheetTable(title, ['Aucun agent libre disponible'])
             
             # En-têtes
             headers = [
                 'Joueur', 'Position', 'Équipe NBA', 'Points', 'Rebonds',
                 'Assists', 'Steals', 'Blocks', 'Disponibilité', 'Popularité'
             ]
-            worksheet.update('A1:J1', [headers])
             
             # Données
             rows = []
@@ -329,27 +326,24 @@ class CompleteGoogleSheetsSystem:
                 ]
                 rows.append(row)
             
-            worksheet.update('A2', rows)
+            return SheetTable(title, headers, rows, key_columns=(0,))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert agents libres: {e}")
     
-    def _transfer_injuries(self, snapshot):
-        """Transfert les blessures"""
+    def _injuries_table(self, snapshot):
+        """Table des blessures"""
         try:
-            worksheet = self.spreadsheet.worksheet('🏥 Blessures')
-            worksheet.clear()
+            title = '🏥 Blessures'
             
             if not snapshot.injuries:
-                worksheet.update('A1', [['Aucune information de blessure']])
-                return
+                return SheetTable(title, ['Aucune information de blessure'])
             
             # En-têtes
             headers = [
                 'Joueur', 'Équipe', 'Statut', 'Date', 'Description',
                 'Durée Estimée', 'Impact', 'Recommandation'
             ]
-            worksheet.update('A1:H1', [headers])
             
             # Données
             rows = []
@@ -366,27 +360,25 @@ class CompleteGoogleSheetsSystem:
                 ]
                 rows.append(row)
             
-            worksheet.update('A2', rows)
+            return SheetTable(title, headers, rows, key_columns=(0,))
             
         except Exception as e:
             self.logger.error(f"❌ Erreur transfert blessures: {e}")
     
     def update_all_analyses(self, snapshot):
-        """Met à jour toutes les analyses"""
+        """Met à jour toutes les analyses (une mise à jour limitée par le quota est remise en file)"""
         try:
-            # Mise à jour de l'analyse mon équipe
-            self._update_my_team_analysis(snapshot)
-            
-            # Mise à jour de l'optimisation ROTO
-            self._update_roto_optimization(snapshot)
-            
-            # Mise à jour de l'analyse du banc
-            self._update_bench_analysis(snapshot)
-            
-            # Mise à jour du dashboard
-            self._update_dashboard(snapshot)
-            
-            self.logger.info("✅ Toutes les analyses mises à jour")
+            scheduler = RetryScheduler()
+            scheduler.submit('mon équipe', lambda: self._update_my_team_analysis(snapshot))
+            scheduler.submit('optimisation ROTO', lambda: self._update_roto_optimization(snapshot))
+            scheduler.submit('analyse banc', lambda: self._update_bench_analysis(snapshot))
+            scheduler.submit('dashboard', lambda: self._update_dashboard(snapshot))
+            _, failures = scheduler.run()
+            
+            for name, error in failures.items():
+                self.logger.error(f"❌ Erreur mise à jour {name} (abandonnée après reprises): {error}")
+            if not failures:
+                self.logger.info("✅ Toutes les analyses mises à jour")
             
         except Exception as e:
             self.logger.error(f"❌ Erreur mise à jour analyses: {e}")
@@ -443,6 +435,8 @@ class CompleteGoogleSheetsSystem:
             worksheet.update('A9', player_rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remise en file par update_all_analyses
             self.logger.error(f"❌ Erreur mise à jour analyse mon équipe: {e}")
     
     def _update_roto_optimization(self, snapshot):
@@ -477,6 +471,8 @@ class CompleteGoogleSheetsSystem:
                 worksheet.update(f'A{i}:H{i}', [row])
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remise en file par update_all_analyses
             self.logger.error(f"❌ Erreur mise à jour optimisation ROTO: {e}")
     
     def _update_bench_analysis(self, snapshot):
@@ -510,6 +506,8 @@ class CompleteGoogleSheetsSystem:
             worksheet.update('A5:H5', [bench_data])
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remise en file par update_all_analyses
             self.logger.error(f"❌ Erreur mise à jour analyse banc: {e}")
     
     def _update_dashboard(self, snapshot):
@@ -540,6 +538,8 @@ class CompleteGoogleSheetsSystem:
             worksheet.update('A5:J5', [daily_summary])
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remise en file par update_all_analyses
             self.logger.error(f"❌ Erreur mise à jour dashboard: {e}")
     
     def generate_final_report(self, snapshot):
@@ -0,0 +1,153 @@
+"""
+Faux backend Google Sheets (hors ligne)
+Reproduit la partie de l'API gspread utilisée par le projet (worksheet,
+add_worksheet, update, clear, values_batch_update, values_batch_clear,
+batch_update) en mémoire, et journalise chaque appel qui coûterait une
+requête HTTP. Sert aux tests et aux essais sans credentials.
+"""
+
+from typing import Dict, List, Tuple
+
+from gspread.exceptions import WorksheetNotFound
+
+try:
+    from utils.sheets_sync import cell_position, parse_a1
+except ImportError:
+    from sheets_sync import cell_position, parse_a1
+
+
+class FakeWorksheet:
+    """Feuille en mémoire : cellules {(ligne, colonne): valeur}"""
+
+    def __init__(self, spreadsheet, title: str, sheet_id: int, rows: int = 1000, cols: int = 26):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self.cells: Dict[Tuple[int, int], object] = {}
+        self.formats: List[Tuple[str, dict]] = []
+
+    def update(self, *args, **kwargs):
+        """Accepte update('A1', valeurs) et update(valeurs, 'A1') comme gspread"""
+        values = kwargs.get('values')
+        range_name = kwargs.get('range_name')
+        for arg in args:
+            if isinstance(arg, str):
+                range_name = arg
+            else:
+                values = arg
+        self.spreadsheet._log('update', {'range': f"{self.title}!{range_name or 'A1'}", 'values': values})
+        self._write(range_name or 'A1', values)
+
+    def format(self, ranges, fmt: dict):
+        self.spreadsheet._log('format', {'sheet': self.title, 'ranges': ranges, 'format': fmt})
+        for range_name in ([ranges] if isinstance(ranges, str) else ranges):
+            self.formats.append((range_name, fmt))
+
+    def clear(self):
+        self.spreadsheet._log('clear', {'sheet': self.title})
+        self.cells.clear()
+
+    def get_all_values(self) -> List[List]:
+        if not self.cells:
+            return []
+        height = max(row for row, _ in self.cells)
+        width = max(col for _, col in self.cells)
+        return [[self.cells.get((row, col), '') for col in range(1, width + 1)] for row in range(1, height + 1)]
+
+    def acell(self, label: str):
+        row, col = cell_position(label)
+        return self.cells.get((row, col), '')
+
+    def _write(self, range_name: str, values: List[List]):
+        _, first_row, first_col, _, _ = parse_a1(range_name)
+        for i, row in enumerate(values):
+            for j, value in enumerate(row):
+                if value == '':
+                    self.cells.pop((first_row + i, first_col + j), None)
+                else:
+                    self.cells[(first_row + i, first_col + j)] = value
+
+    def _clear_range(self, range_name: str):
+        _, first_row, first_col, last_row, last_col = parse_a1(range_name)
+        if last_row is None and range_name.startswith("'") and '!' not in range_name:
+            self.cells.clear()
+            return
+        last_row, last_col = last_row or first_row, last_col or first_col
+        for row, col in list(self.cells):
+            if first_row <= row <= last_row and first_col <= col <= last_col:
+                del self.cells[(row, col)]
+
+
+class FakeSpreadsheet:
+    """Spreadsheet en mémoire ; calls liste les appels (un appel = une requête HTTP)"""
+
+    def __init__(self, spreadsheet_id: str = 'fake-spreadsheet', titles: List[str] = ()):
+        self.id = spreadsheet_id
+        self.url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+        self.calls: List[Tuple[str, object]] = []
+        self._sheets: Dict[str, FakeWorksheet] = {}
+        for title in titles:
+            self._add(title)
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self._log('worksheet', {'title': title})
+        if title not in self._sheets:
+            raise WorksheetNotFound(title)
+        return self._sheets[title]
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self._log('worksheets', {})
+        return list(self._sheets.values())
+
+    def add_worksheet(self, title: str, rows: int, cols: int, index: int = None) -> FakeWorksheet:
+        self._log('add_worksheet', {'title': title, 'rows': rows, 'cols': cols})
+        return self._add(title, rows, cols)
+
+    def values_batch_update(self, body: dict = None):
+        self._log('values_batch_update', body)
+        for entry in body['data']:
+            title = parse_a1(entry['range'])[0]
+            self._sheets[title]._write(entry['range'].rsplit('!', 1)[1], entry['values'])
+        return {'totalUpdatedCells': sum(len(row) for entry in body['data'] for row in entry['values'])}
+
+    def values_batch_clear(self, params: dict = None, body: dict = None):
+        self._log('values_batch_clear', body)
+        for range_name in body['ranges']:
+            title = parse_a1(range_name)[0]
+            self._sheets[title]._clear_range(range_name)
+        return {'clearedRanges': body['ranges']}
+
+    def batch_update(self, body: dict):
+        """Applique les requêtes updateCells (valeurs) et repeatCell (formats)"""
+        self._log('batch_update', body)
+        sheets = {worksheet.id: worksheet for worksheet in self._sheets.values()}
+        for request in body.get('requests', []):
+            if 'updateCells' in request:
+                update = request['updateCells']
+                worksheet = sheets[update['start']['sheetId']]
+                for i, row in enumerate(update['rows']):
+                    for j, cell in enumerate(row['values']):
+                        value = next(iter(cell.get('userEnteredValue', {'stringValue': ''}).values()))
+                        worksheet.cells[(update['start']['rowIndex'] + i + 1, update['start']['columnIndex'] + j + 1)] = value
+            elif 'repeatCell' in request:
+                repeat = request['repeatCell']
+                worksheet = sheets[repeat['range']['sheetId']]
+                worksheet.formats.append((repeat['range'], repeat['cell']['userEnteredFormat']))
+        return {'replies': [{} for _ in body.get('requests', [])]}
+
+    def sheet(self, title: str) -> FakeWorksheet:
+        """Accès direct pour les assertions des tests (non journalisé)"""
+        return self._sheets[title]
+
+    def request_count(self, method: str = None) -> int:
+        return sum(1 for name, _ in self.calls if method is None or name == method)
+
+    def _add(self, title: str, rows: int = 1000, cols: int = 26) -> FakeWorksheet:
+        worksheet = FakeWorksheet(self, title, len(self._sheets), rows, cols)
+        self._sheets[title] = worksheet
+        return worksheet
+
+    def _log(self, method: str, payload):
+        self.calls.append((method, payload))
@@ -0,0 +1,58 @@
+"""
+Verrous fichiers (fcntl.flock) partagés entre processus et threads
+- Un fichier de verrou par jeu de données dans data/locks/ : deux écritures
+  sur le même historique (data/raw/...) sont sérialisées, même depuis deux
+  scripts différents
+- Mode non bloquant pour sauter un travail déjà en cours ailleurs
+- Le verrou est libéré par le système si le processus meurt
+"""
+
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou entre processus
+    fcntl = None
+
+LOCK_DIR = os.path.join('data', 'locks')
+POLL_INTERVAL = 0.05
+
+
+class LockTimeout(Exception):
+    """Verrou détenu par un autre processus (ou thread) au-delà du délai accordé"""
+
+
+def lock_path(name: str, lock_dir: str = LOCK_DIR) -> str:
+    """Fichier de verrou d'un jeu de données ou d'un travail ('data/raw/teams_stats.csv' -> data_raw_teams_stats.csv.lock)"""
+    return os.path.join(lock_dir, re.sub(r'[^\w.-]+', '_', name.strip('/\\')) + '.lock')
+
+
+@contextmanager
+def file_lock(name: str, lock_dir: str = LOCK_DIR, blocking: bool = True, timeout: float = None) -> Iterator[str]:
+    """Verrou exclusif sur `name` pendant le bloc with
+
+    blocking=False (ou timeout dépassé) : LockTimeout si le verrou est déjà pris.
+    """
+    path = lock_path(name, lock_dir)
+    if fcntl is None:
+        yield path
+        return
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(path, 'a') as f:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking and deadline is None else fcntl.LOCK_NB))
+                break
+            except BlockingIOError:
+                if not blocking or time.monotonic() >= deadline:
+                    raise LockTimeout(f"Verrou déjà pris : {path}")
+                time.sleep(POLL_INTERVAL)
+        try:
+            yield path
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -13,6 +13,7 @@ import json
 import os
 from datetime import datetime
 from espn_api.basketball import League
+from rate_limiter import client_session, mount_rate_limiting
 
 # Configuration
 LEAGUE_ID = 1557635339
@@ -157,8 +158,9 @@ def main():
         if not creds:
             return
         
-        # Connexion Google Sheets
+        # Connexion Google Sheets (budget par hôte + reprises sur 429/5xx, session gspread seulement)
         gc = gspread.authorize(creds)
+        mount_rate_limiting(client_session(gc))
         print("✅ Connexion Google Sheets établie")
         
         # Connexion ESPN
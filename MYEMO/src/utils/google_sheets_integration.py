@@ -13,6 +13,7 @@ import json
 import logging
 from typing import Dict, List, Any
 import numpy as np
+from rate_limiter import RetryScheduler, client_session, is_retryable, mount_rate_limiting
 
 class GoogleSheetsNBAExporter:
     """Exportateur vers Google Sheets pour les données NBA Fantasy avec analyses avancées"""
@@ -38,8 +39,9 @@ class GoogleSheetsNBAExporter:
                 scopes=scopes
             )
             
-            # Initialisation de gspread
+            # Initialisation de gspread (budget par hôte ; les reprises passent par RetryScheduler)
             self.gc = gspread.authorize(creds)
+            mount_rate_limiting(client_session(self.gc), retries=False)
             
             # Création ou ouverture du spreadsheet
             if self.spreadsheet_id:
@@ -198,28 +200,35 @@ class GoogleSheetsNBAExporter:
             worksheet.update(cell, [[formula]])
     
     def export_daily_snapshot(self, snapshot_data: Dict):
-        """Exporte les données quotidiennes vers Google Sheets"""
+        """Exporte les données quotidiennes vers Google Sheets
+        Une feuille limitée par le quota est remise en file au lieu d'être abandonnée"""
         try:
+            scheduler = RetryScheduler()
+            
             # Feuille: Données Quotidiennes
-            self._export_to_sheet('Données Quotidiennes', snapshot_data['league_info'])
+            scheduler.submit('Données Quotidiennes', lambda: self._export_to_sheet('Données Quotidiennes', snapshot_data['league_info']))
             
             # Feuille: Résumé Équipes
-            self._export_teams_summary(snapshot_data['teams_summary'])
+            scheduler.submit('Résumé Équipes', lambda: self._export_teams_summary(snapshot_data['teams_summary']))
             
             # Feuille: Joueurs Détaillés
-            self._export_players_detailed(snapshot_data['players_detailed'])
+            scheduler.submit('Joueurs Détaillés', lambda: self._export_players_detailed(snapshot_data['players_detailed']))
             
             # Feuille: Transactions
-            self._export_transactions(snapshot_data['transactions'])
+            scheduler.submit('Transactions', lambda: self._export_transactions(snapshot_data['transactions']))
             
             # Feuille: Agents Libres
-            self._export_free_agents(snapshot_data['free_agents'])
+            scheduler.submit('Agents Libres', lambda: self._export_free_agents(snapshot_data['free_agents']))
             
             # Feuille: Blessures
-            self._export_injuries(snapshot_data['injuries'])
+            scheduler.submit('Blessures', lambda: self._export_injuries(snapshot_data['injuries']))
             
             # Feuille: Insights IA
-            self._export_ai_insights(snapshot_data['ai_insights'])
+            scheduler.submit('Insights IA', lambda: self._export_ai_insights(snapshot_data['ai_insights']))
+            
+            _, failures = scheduler.run()
+            for name, error in failures.items():
+                self.logger.error(f"❌ Erreur export '{name}' (abandonné après reprises): {error}")
             
             self.logger.info("✅ Export quotidien vers Google Sheets terminé")
             
@@ -248,6 +257,8 @@ class GoogleSheetsNBAExporter:
                 worksheet.update('A1', [[str(data)]])
                 
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export vers '{sheet_name}': {e}")
     
     def _export_teams_summary(self, teams_data: List[Dict]):
@@ -287,6 +298,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export résumé équipes: {e}")
     
     def _export_players_detailed(self, players_data: List[Dict]):
@@ -328,6 +341,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export joueurs détaillés: {e}")
     
     def _export_transactions(self, transactions_data: List[Dict]):
@@ -358,6 +373,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export transactions: {e}")
     
     def _export_free_agents(self, free_agents_data: List[Dict]):
@@ -391,6 +408,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export agents libres: {e}")
     
     def _export_injuries(self, injuries_data: List[Dict]):
@@ -422,6 +441,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export blessures: {e}")
     
     def _export_ai_insights(self, ai_insights: List[Dict]):
@@ -455,6 +476,8 @@ class GoogleSheetsNBAExporter:
             worksheet.update('A2', rows)
             
         except Exception as e:
+            if is_retryable(e):
+                raise  # Remis en file par export_daily_snapshot
             self.logger.error(f"❌ Erreur export insights IA: {e}")
     
     def create_bench_analysis_sheet(self, snapshot_data: Dict):
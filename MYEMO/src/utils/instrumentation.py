@@ -0,0 +1,179 @@
+"""
+Instrumentation des étapes de collecte
+Temps réel, temps CPU, temps réseau (envois des sessions montées par
+mount_rate_limiting : ESPN, cache HTTP, gspread), temps limité (attente du
+limiteur de débit et des reprises), lignes écrites et octets lus/écrits par étape, enregistrés par exécution dans logs/metrics/ (JSON + CSV).
+Une étape ne compte que le travail de son propre thread : plusieurs
+collectes en parallèle (multi-ligues, processus des travaux) ne se
+mélangent pas.
+
+Profilage optionnel d'une étape :
+    MYEMO_PROFILE_STAGE=<nom de l'étape>
+    MYEMO_PROFILE_MODE=cprofile|tracemalloc   (défaut : cprofile)
+"""
+
+import cProfile
+import csv
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    from utils.rate_limiter import thread_network_seconds, thread_throttled_seconds
+except ImportError:
+    from rate_limiter import thread_network_seconds, thread_throttled_seconds
+
+# Par thread : pile des étapes en cours (imbrication possible)
+_local = threading.local()
+
+
+def _thread_active_stages() -> list:
+    if not hasattr(_local, 'active_stages'):
+        _local.active_stages = []
+    return _local.active_stages
+
+
+@dataclass
+class StageMetrics:
+    """Mesures d'une étape"""
+    stage: str
+    started_at: str
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    network_s: float = 0.0
+    throttled_s: float = 0.0
+    rows_written: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+
+
+def _io_counters() -> tuple:
+    """(octets lus, octets écrits) du thread courant, fichiers et sockets (Linux, sinon 0)"""
+    for path in ('/proc/thread-self/io', '/proc/self/io'):
+        try:
+            with open(path, 'r') as f:
+                counters = dict(line.split(': ') for line in f.read().splitlines())
+            return int(counters['rchar']), int(counters['wchar'])
+        except (OSError, KeyError, ValueError):
+            continue
+    return 0, 0
+
+
+def add_rows(count: int) -> None:
+    """Ajoute des lignes écrites aux étapes en cours du thread courant (sans effet hors étape)"""
+    for stage in _thread_active_stages():
+        stage.rows_written += int(count)
+
+
+class PipelineMetrics:
+    """Mesures d'une exécution complète (une entrée par étape)"""
+
+    def __init__(self, run_name: str, log_dir: str = 'logs'):
+        self.run_name = run_name
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.metrics_dir = os.path.join(log_dir, 'metrics')
+        self.stages: List[StageMetrics] = []
+        self.profile_stage = os.getenv('MYEMO_PROFILE_STAGE')
+        self.profile_mode = os.getenv('MYEMO_PROFILE_MODE', 'cprofile').lower()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Mesure le bloc ; le StageMetrics retourné peut être complété (rows_written...)"""
+        metrics = StageMetrics(stage=name, started_at=datetime.now().isoformat())
+        profiler = self._start_profiler(name)
+        io_start = _io_counters()
+        network_start = thread_network_seconds()
+        throttled_start = thread_throttled_seconds()
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        active_stages = _thread_active_stages()
+        active_stages.append(metrics)
+        try:
+            yield metrics
+        except Exception as e:
+            metrics.error = str(e)
+            raise
+        finally:
+            metrics.wall_s = round(time.perf_counter() - wall_start, 6)
+            metrics.cpu_s = round(time.thread_time() - cpu_start, 6)
+            metrics.network_s = round(thread_network_seconds() - network_start, 6)
+            metrics.throttled_s = round(thread_throttled_seconds() - throttled_start, 6)
+            io_end = _io_counters()
+            metrics.bytes_read = io_end[0] - io_start[0]
+            metrics.bytes_written = io_end[1] - io_start[1]
+            active_stages.remove(metrics)
+            self._stop_profiler(name, profiler)
+            self.stages.append(metrics)
+
+    def write(self) -> str:
+        """Écrit <run>_<horodatage>.json et ajoute les étapes à <run>_metrics.csv"""
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        rows = [{'run_id': self.run_id, **asdict(stage)} for stage in self.stages]
+
+        json_path = os.path.join(self.metrics_dir, f"{self.run_name}_{self.run_id}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'run': self.run_name, 'run_id': self.run_id, 'stages': rows,
+                       'total_wall_s': round(sum(s.wall_s for s in self.stages), 6)}, f, indent=2, ensure_ascii=False)
+
+        csv_path = os.path.join(self.metrics_dir, f"{self.run_name}_metrics.csv")
+        fieldnames = ['run_id'] + list(StageMetrics.__dataclass_fields__)
+        previous_rows = self._rows_with_other_header(csv_path, fieldnames)
+        is_new = previous_rows is not None or not os.path.exists(csv_path)
+        with open(csv_path, 'w' if previous_rows is not None else 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            if is_new:
+                writer.writeheader()
+            writer.writerows((previous_rows or []) + rows)
+        return json_path
+
+    @staticmethod
+    def _rows_with_other_header(csv_path: str, fieldnames: List[str]):
+        """Lignes d'un CSV écrit avec d'anciennes colonnes (à réécrire), sinon None"""
+        if not os.path.exists(csv_path):
+            return None
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames == fieldnames:
+                return None
+            return [{key: row.get(key, '') for key in fieldnames} for row in reader]
+
+    def summary(self) -> str:
+        lines = [f"{'Étape':<28} {'Temps':>8} {'CPU':>8} {'Réseau':>8} {'Limité':>8} {'Lignes':>8}"]
+        for s in self.stages:
+            lines.append(f"{s.stage:<28} {s.wall_s:>7.2f}s {s.cpu_s:>7.2f}s {s.network_s:>7.2f}s "
+                         f"{s.throttled_s:>7.2f}s {s.rows_written:>8}")
+        return "\n".join(lines)
+
+    def _start_profiler(self, name: str):
+        if name != self.profile_stage:
+            return None
+        if self.profile_mode == 'tracemalloc':
+            tracemalloc.start()
+            return 'tracemalloc'
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_profiler(self, name: str, profiler) -> None:
+        if profiler is None:
+            return
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        base = os.path.join(self.metrics_dir, f"{self.run_name}_{self.run_id}_{name}")
+        if profiler == 'tracemalloc':
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(base + '.tracemalloc.txt', 'w', encoding='utf-8') as f:
+                f.write(f"Mémoire courante : {current} o, pic : {peak} o\n\n")
+                for stat in snapshot.statistics('lineno')[:50]:
+                    f.write(f"{stat}\n")
+        else:
+            profiler.disable()
+            profiler.dump_stats(base + '.prof')
@@ -0,0 +1,345 @@
+"""
+Limitation de débit et reprises des appels sortants (ESPN, Google Sheets...)
+- Un seau à jetons par hôte (budget en requêtes/seconde + rafale)
+- Reprises avec attente exponentielle aléatoire (jitter) sur 429 / 5xx /
+  délais dépassés, en respectant Retry-After (un hôte injoignable n'est pas
+  réessayé : l'erreur remonte tout de suite)
+- RetryScheduler : file de tâches où un appel en échec est remis en file
+  (avec son délai) au lieu d'être abandonné, pendant que les autres avancent
+
+RateLimitedAdapter applique budget et reprises aux sessions requests que
+le projet possède (mount_rate_limiting : session partagée ESPN, cache HTTP,
+session gspread) ; les autres utilisateurs de requests ne sont pas touchés.
+Une seule couche de reprises par appel : l'adaptateur, ou bien la file
+RetryScheduler (adaptateur monté avec retries=False).
+Le temps passé à attendre est cumulé (throttled_seconds) pour les mesures,
+ainsi que le temps réseau des envois de l'adaptateur (thread_network_seconds).
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Budgets par hôte : (requêtes par seconde, rafale) ; None = pas de limite
+DEFAULT_BUDGETS = {
+    'fantasy.espn.com': (5.0, 10),
+    'lm-api-reads.fantasy.espn.com': (5.0, 10),
+    'sheets.googleapis.com': (1.0, 5),  # Quota Sheets : 60 requêtes / minute / utilisateur
+    'www.googleapis.com': (2.0, 5),     # API Drive (ouverture / création des spreadsheets)
+    'oauth2.googleapis.com': None,
+}
+DEFAULT_BUDGET = (10.0, 20)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+SAFE_RETRY_STATUSES = {429, 503}  # Requête refusée avant traitement : rejouable même en POST
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+_lock = threading.Lock()
+_throttled_seconds = 0.0
+_local = threading.local()
+
+
+def _add_throttled(seconds: float) -> None:
+    global _throttled_seconds
+    with _lock:
+        _throttled_seconds += seconds
+    _local.throttled = getattr(_local, 'throttled', 0.0) + seconds
+
+
+def throttled_seconds() -> float:
+    """Temps total passé à attendre (jetons + reprises), tous threads confondus"""
+    return _throttled_seconds
+
+
+def thread_network_seconds() -> float:
+    """Temps réseau cumulé du thread courant (envois des sessions limitées, hors attentes)"""
+    return getattr(_local, 'network', 0.0)
+
+
+def thread_throttled_seconds() -> float:
+    """Temps d'attente cumulé du thread courant (pour le déduire du temps réseau)"""
+    return getattr(_local, 'throttled', 0.0)
+
+
+class TokenBucket:
+    """Seau à jetons ; acquire() réserve un jeton et attend si le seau est vide"""
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Réserve les jetons et retourne l'attente nécessaire (sans dormir)"""
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+@dataclass
+class HostStats:
+    """Compteurs d'un hôte"""
+    requests: int = 0
+    throttled_s: float = 0.0
+    retries: int = 0
+    backoff_s: float = 0.0
+
+
+class RateLimiter:
+    """Seaux à jetons par hôte + statistiques d'attente"""
+
+    def __init__(self, budgets: Dict[str, Optional[Tuple[float, int]]] = None,
+                 default_budget: Optional[Tuple[float, int]] = DEFAULT_BUDGET,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self.budgets = dict(DEFAULT_BUDGETS if budgets is None else budgets)
+        self.default_budget = default_budget
+        self.sleep = sleep
+        self.clock = clock
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def set_budget(self, host: str, rate: Optional[float], burst: int = 1) -> None:
+        with self._lock:
+            self.budgets[host] = None if rate is None else (rate, burst)
+            self.buckets.pop(host, None)
+
+    def reserve(self, host: str) -> float:
+        """Réserve un jeton pour l'hôte ; retourne l'attente à observer (usage asynchrone)"""
+        with self._lock:
+            stats = self.stats.setdefault(host, HostStats())
+            stats.requests += 1
+            if host not in self.buckets:
+                budget = self.budgets.get(host, self.default_budget)
+                self.buckets[host] = None if budget is None else TokenBucket(budget[0], budget[1], self.clock)
+            bucket = self.buckets[host]
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        if wait > 0:
+            with self._lock:
+                stats.throttled_s += wait
+            _add_throttled(wait)
+        return wait
+
+    def acquire(self, host: str) -> float:
+        """Réserve un jeton et dort le temps nécessaire"""
+        wait = self.reserve(host)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def record_backoff(self, host: str, seconds: float) -> None:
+        """Compte une reprise et son attente (sans dormir : usage asynchrone)"""
+        with self._lock:
+            stats = self.stats.setdefault(host, HostStats())
+            stats.retries += 1
+            stats.backoff_s += seconds
+        _add_throttled(seconds)
+
+    def backoff(self, host: str, seconds: float) -> None:
+        """Attente avant une reprise (comptée comme temps limité)"""
+        self.record_backoff(host, seconds)
+        self.sleep(seconds)
+
+    def summary(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {host: vars(stats).copy() for host, stats in self.stats.items()}
+
+
+@dataclass
+class BackoffPolicy:
+    """Attente exponentielle avec jitter : moitié fixe + moitié aléatoire, plafonnée"""
+    base: float = 1.0
+    cap: float = 60.0
+    max_retries: int = 5
+    rng: random.Random = field(default_factory=random.Random)
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        ceiling = min(self.cap, self.base * (2 ** attempt))
+        delay = ceiling / 2 + self.rng.uniform(0, ceiling / 2)
+        return max(delay, retry_after or 0.0)
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Valeur de l'en-tête Retry-After en secondes (format numérique uniquement)"""
+    value = getattr(response, 'headers', {}).get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def status_of(error: Exception) -> Optional[int]:
+    """Code HTTP porté par une exception (requests.HTTPError, gspread APIError...)"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is None:
+        status = getattr(error, 'code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Erreur transitoire : quota (429), serveur (5xx) ou délai dépassé"""
+    if isinstance(error, requests.Timeout):
+        return True
+    return status_of(error) in RETRY_STATUSES
+
+
+def _timed_send(send: Callable, request, **kwargs):
+    start = time.perf_counter()
+    try:
+        return send(request, **kwargs)
+    finally:
+        _local.network = thread_network_seconds() + time.perf_counter() - start
+
+
+def send_with_retry(send: Callable, request, limiter: RateLimiter, policy: BackoffPolicy, **kwargs):
+    """Envoie une requête préparée sous le budget de son hôte, avec reprises"""
+    host = urlsplit(request.url).hostname or ''
+    idempotent = (request.method or 'GET').upper() in IDEMPOTENT_METHODS
+    retryable_statuses = RETRY_STATUSES if idempotent else SAFE_RETRY_STATUSES
+    attempt = 0
+    while True:
+        limiter.acquire(host)
+        try:
+            response = _timed_send(send, request, **kwargs)
+        except requests.Timeout:
+            if not idempotent or attempt >= policy.max_retries:
+                raise
+            wait = policy.delay(attempt)
+        else:
+            if response.status_code not in retryable_statuses or attempt >= policy.max_retries:
+                return response
+            wait = policy.delay(attempt, retry_after_seconds(response))
+            response.close()
+        limiter.backoff(host, wait)
+        attempt += 1
+
+
+_shared = {'limiter': None, 'policy': None}
+
+
+def configure_rate_limiting(limiter: RateLimiter = None, policy: BackoffPolicy = None) -> RateLimiter:
+    """Remplace le limiteur / la politique de reprise partagés par les adaptateurs créés ensuite"""
+    with _lock:
+        if limiter is not None:
+            _shared['limiter'] = limiter
+        if policy is not None:
+            _shared['policy'] = policy
+    return get_rate_limiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Limiteur partagé du processus (un budget par hôte pour toutes les sessions limitées)"""
+    with _lock:
+        if _shared['limiter'] is None:
+            _shared['limiter'] = RateLimiter()
+        return _shared['limiter']
+
+
+def get_backoff_policy() -> BackoffPolicy:
+    with _lock:
+        if _shared['policy'] is None:
+            _shared['policy'] = BackoffPolicy()
+        return _shared['policy']
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Adaptateur requests : budget de l'hôte, et reprises sur 429 / 5xx si retries=True"""
+
+    def __init__(self, limiter: RateLimiter = None, policy: BackoffPolicy = None, retries: bool = True,
+                 **adapter_kwargs):
+        self.limiter = limiter or get_rate_limiter()
+        self.policy = (policy or get_backoff_policy()) if retries else BackoffPolicy(max_retries=0)
+        super().__init__(**adapter_kwargs)
+
+    def send(self, request, **kwargs):
+        return send_with_retry(super().send, request, self.limiter, self.policy, **kwargs)
+
+
+def mount_rate_limiting(session: requests.Session, retries: bool = True, **adapter_kwargs) -> requests.Session:
+    """Monte un RateLimitedAdapter sur http:// et https:// de la session (sans effet s'il l'est déjà)"""
+    if not isinstance(session.get_adapter('https://'), RateLimitedAdapter):
+        adapter = RateLimitedAdapter(retries=retries, **adapter_kwargs)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return session
+
+
+def client_session(client) -> Optional[requests.Session]:
+    """Session HTTP d'un client gspread (gspread 6 : client.http_client.session, 5 : client.session)"""
+    http_client = getattr(client, 'http_client', None)
+    return getattr(http_client, 'session', None) or getattr(client, 'session', None)
+
+
+@dataclass
+class RetryJob:
+    """Tâche de la file : appel, tentatives et heure à partir de laquelle la relancer"""
+    name: str
+    func: Callable
+    attempts: int = 0
+    not_before: float = 0.0
+    error: Optional[str] = None
+
+
+class RetryScheduler:
+    """File de tâches : une tâche en échec transitoire est remise en file avec un délai
+    (attente exponentielle) pendant que les suivantes s'exécutent"""
+
+    def __init__(self, policy: BackoffPolicy = None, retryable: Callable[[Exception], bool] = is_retryable,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self.policy = policy or BackoffPolicy()
+        self.retryable = retryable
+        self.sleep = sleep
+        self.clock = clock
+        self.queue = deque()
+        self.waited_s = 0.0
+
+    def submit(self, name: str, func: Callable) -> None:
+        self.queue.append(RetryJob(name, func))
+
+    def run(self) -> Tuple[Dict[str, object], Dict[str, str]]:
+        """Exécute la file ; retourne (résultats par tâche, erreurs des tâches abandonnées)"""
+        results, failures = {}, {}
+        while self.queue:
+            job = self._next_job()
+            try:
+                results[job.name] = job.func()
+            except Exception as e:
+                job.attempts += 1
+                job.error = str(e)
+                if not self.retryable(e) or job.attempts > self.policy.max_retries:
+                    failures[job.name] = job.error
+                    continue
+                job.not_before = self.clock() + self.policy.delay(job.attempts - 1, retry_after_seconds(getattr(e, 'response', None)))
+                self.queue.append(job)
+        return results, failures
+
+    def _next_job(self) -> RetryJob:
+        """Première tâche prête ; sinon attend la plus proche"""
+        now = self.clock()
+        for _ in range(len(self.queue)):
+            job = self.queue.popleft()
+            if job.not_before <= now:
+                return job
+            self.queue.append(job)
+        job = min(self.queue, key=lambda j: j.not_before)
+        self.queue.remove(job)
+        wait = job.not_before - now
+        self.waited_s += wait
+        _add_throttled(wait)
+        self.sleep(wait)
+        return job
@@ -0,0 +1,99 @@
+"""
+Regroupement des requêtes Google Sheets
+Les valeurs, formules et formats écrits via les feuilles d'un SheetsBatch sont
+mis en file puis envoyés en un seul spreadsheets.batchUpdate (updateCells +
+repeatCell) au lieu d'un aller-retour HTTP par cellule ou par plage.
+"""
+
+from typing import Dict, List
+
+try:
+    from utils.sheets_sync import cell_value, parse_a1
+except ImportError:
+    from sheets_sync import cell_value, parse_a1
+
+
+def _user_entered_value(value) -> dict:
+    """Valeur au format CellData : les chaînes commençant par '=' sont des formules"""
+    value = cell_value(value)
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, (int, float)):
+        return {'numberValue': value}
+    if value.startswith('='):
+        return {'formulaValue': value}
+    return {'stringValue': value}
+
+
+class BatchedWorksheet:
+    """Feuille dont update() et format() sont mis en file dans le SheetsBatch"""
+
+    def __init__(self, batch, worksheet):
+        self._batch = batch
+        self._worksheet = worksheet
+        self.title = worksheet.title
+        self.id = worksheet.id
+
+    def update(self, *args, **kwargs):
+        """Même signature que gspread : update('A1', valeurs) ou update(valeurs, 'A1')"""
+        values = kwargs.get('values')
+        range_name = kwargs.get('range_name')
+        for arg in args:
+            if isinstance(arg, str):
+                range_name = arg
+            else:
+                values = arg
+        self._batch.add_values(self, range_name or 'A1', values)
+
+    def format(self, ranges, fmt: dict):
+        for range_name in ([ranges] if isinstance(ranges, str) else ranges):
+            self._batch.add_format(self, range_name, fmt)
+
+    def __getattr__(self, name):
+        # Les autres appels (lecture, clear...) partent directement
+        return getattr(self._worksheet, name)
+
+
+class SheetsBatch:
+    """File de requêtes pour un spreadsheet, vidée par flush()"""
+
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.requests: List[dict] = []
+        self._worksheets: Dict[str, object] = None
+
+    def worksheet(self, title: str, rows: int = 1000, cols: int = 26) -> BatchedWorksheet:
+        """Feuille existante ou créée ; la liste des feuilles n'est lue qu'une fois"""
+        if self._worksheets is None:
+            self._worksheets = {worksheet.title: worksheet for worksheet in self.spreadsheet.worksheets()}
+        if title not in self._worksheets:
+            self._worksheets[title] = self.spreadsheet.add_worksheet(title, rows=rows, cols=cols)
+        return BatchedWorksheet(self, self._worksheets[title])
+
+    def add_values(self, worksheet: BatchedWorksheet, range_name: str, values: List[List]) -> None:
+        _, first_row, first_col, _, _ = parse_a1(range_name)
+        self.requests.append({'updateCells': {
+            'start': {'sheetId': worksheet.id, 'rowIndex': first_row - 1, 'columnIndex': first_col - 1},
+            'rows': [{'values': [{'userEnteredValue': _user_entered_value(v)} for v in row]} for row in values],
+            'fields': 'userEnteredValue'
+        }})
+
+    def add_format(self, worksheet: BatchedWorksheet, range_name: str, fmt: dict) -> None:
+        _, first_row, first_col, last_row, last_col = parse_a1(range_name)
+        self.requests.append({'repeatCell': {
+            'range': {
+                'sheetId': worksheet.id,
+                'startRowIndex': first_row - 1, 'endRowIndex': last_row or first_row,
+                'startColumnIndex': first_col - 1, 'endColumnIndex': last_col or first_col
+            },
+            'cell': {'userEnteredFormat': fmt},
+            'fields': 'userEnteredFormat(' + ','.join(fmt.keys()) + ')'
+        }})
+
+    def flush(self) -> int:
+        """Envoie toutes les requêtes en attente en un batchUpdate ; retourne leur nombre"""
+        if not self.requests:
+            return 0
+        pending, self.requests = self.requests, []
+        self.spreadsheet.batch_update({'requests': pending})
+        return len(pending)
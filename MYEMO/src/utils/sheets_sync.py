@@ -0,0 +1,271 @@
+"""
+Synchronisation incrémentale Google Sheets
+Conserve localement l'empreinte (hash) de chaque cellule poussée, par feuille
+et par clé de ligne, et n'envoie que les plages modifiées : une seule requête
+values_batch_update par spreadsheet et par synchronisation.
+
+Les lignes gardent leur position d'une synchronisation à l'autre (repérées par
+leur clé) : un changement de quelques joueurs ne réécrit que leurs lignes.
+Les lignes disparues sont vidées dans la même requête.
+"""
+
+import json
+import math
+import os
+import re
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_STATE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'cache', 'sheets_sync')
+HEADER_KEY = '__header__'
+_A1_CELL = re.compile(r'^([A-Z]+)(\d+)$')
+
+
+@dataclass
+class SheetTable:
+    """Contenu complet d'une feuille : en-têtes + lignes, identifiées par key_columns"""
+    worksheet: str
+    headers: List
+    rows: List[List] = field(default_factory=list)
+    key_columns: Sequence[int] = (0,)
+
+    def row_key(self, row: List) -> str:
+        return '|'.join(str(row[i]) if i < len(row) else '' for i in self.key_columns)
+
+
+@dataclass
+class SyncReport:
+    """Résultat d'une synchronisation"""
+    ranges: List[str] = field(default_factory=list)
+    cells: int = 0
+    rows_changed: Dict[str, int] = field(default_factory=dict)
+    requests: int = 0
+
+    @property
+    def is_noop(self) -> bool:
+        return not self.ranges
+
+
+def cell_value(value):
+    """Valeur sérialisable en JSON pour l'API (numpy, NaN, None, dates)"""
+    if value is None:
+        return ''
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return ''
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _cell_hash(value) -> int:
+    return zlib.crc32(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+def column_letter(col: int) -> str:
+    """1 -> A, 27 -> AA"""
+    letters = ''
+    while col:
+        col, rest = divmod(col - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def sheet_range(worksheet: str) -> str:
+    """Nom de feuille entre apostrophes (toute la feuille en notation A1)"""
+    return "'" + worksheet.replace("'", "''") + "'"
+
+
+def a1_range(worksheet: str, first_row: int, first_col: int, last_row: int, last_col: int) -> str:
+    return f"{sheet_range(worksheet)}!{column_letter(first_col)}{first_row}:{column_letter(last_col)}{last_row}"
+
+
+def parse_a1(range_name: str) -> Tuple[str, int, int, int, int]:
+    """"'Feuille'!B2:D5" -> (feuille, 2, 2, 5, 4) ; la fin est None pour une simple cellule"""
+    title = None
+    if '!' in range_name:
+        title, range_name = range_name.rsplit('!', 1)
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+    elif range_name.startswith("'"):
+        return range_name[1:-1].replace("''", "'"), 1, 1, None, None
+
+    start, _, end = range_name.partition(':')
+    first_row, first_col = cell_position(start)
+    last_row, last_col = cell_position(end) if end else (None, None)
+    return title, first_row, first_col, last_row, last_col
+
+
+def cell_position(cell: str) -> Tuple[int, int]:
+    match = _A1_CELL.match(cell.upper())
+    if not match:
+        raise ValueError(f"Plage A1 non supportée : {cell}")
+    col = 0
+    for letter in match.group(1):
+        col = col * 26 + ord(letter) - 64
+    return int(match.group(2)), col
+
+
+class SheetsSyncEngine:
+    """Pousse des SheetTable vers un spreadsheet gspread en ne transmettant que le diff"""
+
+    def __init__(self, spreadsheet, state_dir: str = DEFAULT_STATE_DIR,
+                 value_input_option: str = 'USER_ENTERED'):
+        self.spreadsheet = spreadsheet
+        self.value_input_option = value_input_option
+        self.state_path = os.path.join(state_dir, f"{spreadsheet.id}.json")
+        self.state = self._load_state()
+
+    def sync(self, tables: List[SheetTable], force: bool = False) -> SyncReport:
+        """Calcule le diff de toutes les feuilles puis l'envoie en une requête"""
+        report = SyncReport()
+        if force:
+            for table in tables:
+                self.state.pop(table.worksheet, None)
+
+        cold = [table.worksheet for table in tables if table.worksheet not in self.state]
+        if cold:
+            # État inconnu : on ne sait pas ce que contient la feuille, on repart d'une feuille vide
+            self._ensure_worksheets(cold, tables)
+            self.spreadsheet.values_batch_clear(body={'ranges': [sheet_range(name) for name in cold]})
+            report.requests += 1
+
+        new_state = {}
+        data = []
+        for table in tables:
+            updates, layout, changed = self._diff(table, self.state.get(table.worksheet, {}))
+            new_state[table.worksheet] = layout
+            report.rows_changed[table.worksheet] = changed
+            for range_name, values in updates:
+                data.append({'range': range_name, 'values': values})
+                report.ranges.append(range_name)
+                report.cells += sum(len(row) for row in values)
+
+        if data:
+            self.spreadsheet.values_batch_update(body={'valueInputOption': self.value_input_option, 'data': data})
+            report.requests += 1
+
+        # L'état n'est mis à jour qu'une fois l'envoi réussi
+        self.state.update(new_state)
+        self._save_state()
+        return report
+
+    def reset(self, worksheet: Optional[str] = None) -> None:
+        """Oublie l'état (d'une feuille ou de toutes) : la prochaine synchro réécrit tout"""
+        if worksheet is None:
+            self.state = {}
+        else:
+            self.state.pop(worksheet, None)
+        self._save_state()
+
+    # --- Diff ----------------------------------------------------------------
+
+    def _layout(self, table: SheetTable, previous: Dict) -> List:
+        """Position des lignes : les clés connues gardent leur ligne, les nouvelles comblent les trous"""
+        keyed = [(HEADER_KEY, [cell_value(v) for v in table.headers])]
+        seen = {}
+        for row in table.rows:
+            key = table.row_key(row)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > 1:
+                key = f"{key}#{seen[key]}"  # Clés en double : suffixe d'occurrence
+            keyed.append((key, [cell_value(v) for v in row]))
+
+        old_rows = previous.get('rows', [])
+        old_positions = {entry['key']: i for i, entry in enumerate(old_rows) if entry}
+        slots = [None] * len(old_rows)
+        pending = []
+        for key, cells in keyed:
+            position = old_positions.get(key)
+            if position is not None:
+                slots[position] = (key, cells)
+            else:
+                pending.append((key, cells))
+
+        free = (i for i, slot in enumerate(slots) if slot is None)
+        for entry in pending:
+            position = next(free, None)
+            if position is None:
+                slots.append(entry)
+            else:
+                slots[position] = entry
+        while slots and slots[-1] is None:
+            slots.pop()
+        return slots
+
+    def _diff(self, table: SheetTable, previous: Dict):
+        """(plages à écrire, nouvel état, lignes modifiées) pour une feuille"""
+        slots = self._layout(table, previous)
+        old_rows = previous.get('rows', [])
+
+        spans = []  # (ligne, première colonne, dernière colonne) modifiées, indices à partir de 0
+        state_rows = []
+        for i in range(max(len(slots), len(old_rows))):
+            slot = slots[i] if i < len(slots) else None
+            key, cells = slot if slot else (None, [])
+            hashes = [_cell_hash(v) for v in cells]
+            old_hashes = old_rows[i]['cells'] if i < len(old_rows) and old_rows[i] else []
+            width = max(len(hashes), len(old_hashes))
+            empty = _cell_hash('')
+            changed = [c for c in range(width)
+                       if (hashes[c] if c < len(hashes) else empty) != (old_hashes[c] if c < len(old_hashes) else empty)]
+            if changed:
+                spans.append((i, changed[0], changed[-1]))
+            if i < len(slots):
+                state_rows.append({'key': key, 'cells': hashes} if slot else None)
+
+        updates = []
+        for block in self._blocks(spans):
+            first_row, last_row = block[0][0], block[-1][0]
+            first_col = min(span[1] for span in block)
+            last_col = max(span[2] for span in block)
+            values = []
+            for i in range(first_row, last_row + 1):
+                cells = slots[i][1] if i < len(slots) and slots[i] else []
+                values.append([cells[c] if c < len(cells) else '' for c in range(first_col, last_col + 1)])
+            updates.append((a1_range(table.worksheet, first_row + 1, first_col + 1, last_row + 1, last_col + 1), values))
+
+        layout = {'rows': state_rows, 'synced_at': datetime.now().isoformat()}
+        return updates, layout, len(spans)
+
+    @staticmethod
+    def _blocks(spans: List) -> List[List]:
+        """Regroupe les lignes modifiées consécutives en rectangles"""
+        blocks = []
+        for span in spans:
+            if blocks and blocks[-1][-1][0] == span[0] - 1:
+                blocks[-1].append(span)
+            else:
+                blocks.append([span])
+        return blocks
+
+    # --- Feuilles et état ----------------------------------------------------
+
+    def _ensure_worksheets(self, names: List[str], tables: List[SheetTable]) -> None:
+        existing = {worksheet.title for worksheet in self.spreadsheet.worksheets()}
+        sizes = {table.worksheet: (len(table.rows) + 1, len(table.headers)) for table in tables}
+        for name in names:
+            if name not in existing:
+                rows, cols = sizes.get(name, (1, 1))
+                self.spreadsheet.add_worksheet(name, rows=max(1000, rows + 100), cols=max(26, cols))
+
+    def _load_state(self) -> Dict:
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
@@ -16,14 +16,16 @@ source "$VENV_DIR/bin/activate"
 # Définir PYTHONPATH
 export PYTHONPATH="$BASE_DIR/src"
 
-# Lancer l'automatisation
+# Lancer tous les travaux planifiés (collecte, temps réel, analyses, Google Sheets) dans un seul processus
+LOG_FILE="$LOG_DIR/automation_$(date +%Y%m%d_%H%M%S).log"
 echo "🚀 Démarrage de la collecte automatique..."
-python "$BASE_DIR/src/daily_automation.py" > "$LOG_DIR/automation_$(date +%Y%m%d_%H%M%S).log" 2>&1 &
+python "$BASE_DIR/src/job_runner.py" > "$LOG_FILE" 2>&1 &
 
 # Récupérer le PID du processus
 PID=$!
-echo $PID > "$BASE_DIR/.automation.pid"
+echo $PID > "$BASE_DIR/.job_runner.pid"
 
 echo "✅ Collecte automatique démarrée (PID: $PID)"
-echo "📝 Logs disponibles dans: $LOG_DIR/automation_$(date +%Y%m%d_%H%M%S).log"
+echo "📝 Logs disponibles dans: $LOG_FILE"
+echo "📋 État des travaux : python src/job_runner.py --status"
 echo "💡 Pour arrêter : ./stop_collection.sh"
@@ -2,21 +2,31 @@
 
 # Définir le chemin de base
 BASE_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-PID_FILE="$BASE_DIR/.automation.pid"
+# Processus des travaux planifiés, et ancienne automatisation (daily_automation.py) éventuelle
+PID_FILES=("$BASE_DIR/.job_runner.pid" "$BASE_DIR/.automation.pid")
+FOUND=0
 
-if [ -f "$PID_FILE" ]; then
+for PID_FILE in "${PID_FILES[@]}"; do
+    [ -f "$PID_FILE" ] || continue
+    FOUND=1
     PID=$(cat "$PID_FILE")
     
     # Vérifier si le processus existe toujours
     if ps -p $PID > /dev/null; then
         echo "🛑 Arrêt de la collecte automatique (PID: $PID)..."
+        # SIGTERM : plus de nouveau lancement, les travaux en cours se terminent
         kill $PID
+        while ps -p $PID > /dev/null; do
+            sleep 1
+        done
         rm "$PID_FILE"
         echo "✅ Collecte automatique arrêtée"
     else
         echo "⚠️ Le processus n'est plus en cours d'exécution"
         rm "$PID_FILE"
     fi
-else
+done
+
+if [ $FOUND -eq 0 ]; then
     echo "❌ Aucune collecte automatique en cours"
 fi
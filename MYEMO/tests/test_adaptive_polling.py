@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests de la fréquence de collecte adaptée aux matchs NBA
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from collectors.adaptive_polling import GAME_DURATION, AdaptivePoller, game_windows
+from daily_automation import post_game_time
+from src.collectors import realtime_collector
+
+NOW = datetime(2026, 1, 15, 12, 0)
+
+
+def _player(*tip_offs):
+    return SimpleNamespace(schedule={str(i): {'team': 'BOS', 'date': tip_off} for i, tip_off in enumerate(tip_offs)})
+
+
+def test_game_windows_are_merged():
+    windows = game_windows([_player(NOW.replace(hour=19), NOW.replace(hour=10)),
+                            _player(NOW.replace(hour=20, minute=30)),
+                            _player(NOW.replace(hour=8), NOW + timedelta(days=5))], NOW)
+    # Match de 8h terminé, match dans 5 jours hors horizon ; 19h et 20h30 se chevauchent
+    assert windows == [(NOW.replace(hour=10), NOW.replace(hour=10) + GAME_DURATION),
+                       (NOW.replace(hour=19), NOW.replace(hour=20, minute=30) + GAME_DURATION)]
+    assert game_windows([SimpleNamespace()], NOW) == []
+
+
+def test_fast_during_games_backoff_and_wake_before_tip_off():
+    windows = [(NOW.replace(hour=19), NOW.replace(hour=22))]
+    poller = AdaptivePoller()
+    policy = poller.policy
+
+    # Hors match : intervalle de base qui double sans changement, plafonné au tip-off (- pre_game)
+    delays = [poller.next_delay(NOW, False, windows) for _ in range(6)]
+    assert delays[:3] == [policy.idle_interval, 2 * policy.idle_interval, 4 * policy.idle_interval]
+    assert max(delays) == 7 * 3600 - policy.pre_game
+    assert poller.next_delay(NOW, True, windows) == policy.idle_interval
+
+    # Pendant le match : rapide, ralenti sans changement jusqu'à live_max
+    live = NOW.replace(hour=20)
+    delays = [poller.next_delay(live, False, windows) for _ in range(6)]
+    assert delays[0] == policy.live_interval and delays[-1] == policy.live_max
+    assert poller.next_delay(live, True, windows) == policy.live_interval
+
+    # Aucun match connu : plafond idle_max
+    idle = AdaptivePoller()
+    assert max(idle.next_delay(NOW, False, []) for _ in range(10)) == policy.idle_max
+
+
+def test_post_game_collection_time():
+    tonight = [(NOW.replace(hour=19), NOW.replace(hour=22))]
+    assert post_game_time(tonight, NOW) == NOW.replace(hour=22, minute=30)
+    assert post_game_time([], NOW) is None
+    # Fin des matchs à 7h : la collecte de 8h suffit
+    night = [(NOW.replace(hour=4), NOW.replace(hour=6, minute=45))]
+    assert post_game_time(night, NOW.replace(hour=1)) is None
+
+
+def test_upcoming_game_caps_delay_when_first_poll_is_not_modified(tmp_path, monkeypatch):
+    """Après un redémarrage, le cache HTTP sur disque répond « non modifié » dès la première collecte"""
+    tip_off = datetime.now() + timedelta(minutes=20)
+    league = SimpleNamespace(teams=[SimpleNamespace(roster=[_player(tip_off)])])
+    monkeypatch.setattr(realtime_collector, 'ESPNDataCollector', lambda league_id, year: SimpleNamespace(league=league))
+    monkeypatch.setattr(realtime_collector, 'CachedHTTPClient', lambda **kwargs: SimpleNamespace(
+        get=lambda url, params=None: SimpleNamespace(not_modified=True, raise_for_status=lambda: None)))
+    monkeypatch.setattr(realtime_collector.RealTimeCollector, 'setup_logger',
+                        lambda self: setattr(self, 'logger', realtime_collector.logging.getLogger('test')))
+
+    collector = realtime_collector.RealTimeCollector(str(tmp_path / 'events.jsonl'), str(tmp_path / 'state.json'))
+    policy = collector.poller.policy
+
+    # Réveil avant le tip-off (moins pre_game) au lieu de l'intervalle hors match
+    assert collector.poll_once() <= (tip_off - datetime.now()).total_seconds() - policy.pre_game + 1
+    assert collector.poll_once() < policy.idle_interval
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests du moteur d'agrégation vectorisé des catégories
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.category_matrix import CategoryMatrix
+
+
+def _matrix():
+    rosters = [
+        ('A', [SimpleNamespace(stats={'PTS': 10, 'FG%': 0.5}, bench=False),
+               SimpleNamespace(stats={'PTS': 4, 'FG%': 0.0}, bench=True),
+               SimpleNamespace(stats=None, bench=False)]),
+        ('B', [SimpleNamespace(stats={'PTS': 20, 'FG%': 0.4}, bench=False)]),
+        ('C', []),
+    ]
+    return CategoryMatrix.from_rosters(['PTS', 'FG%'], rosters, lambda p: p.stats, lambda p: p.bench)
+
+
+def test_team_totals_and_splits():
+    """Totaux par équipe, banc et actifs"""
+    matrix = _matrix()
+    assert matrix.team_totals()[:, 0].tolist() == [14.0, 20.0, 0.0]
+    assert matrix.team_totals('bench')[:, 0].tolist() == [4.0, 0.0, 0.0]
+    assert matrix.team_totals('active')[:, 0].tolist() == [10.0, 20.0, 0.0]
+
+
+def test_averages_ignore_players_without_stats():
+    """Moyennes sur les joueurs avec stats, pourcentages sur les valeurs > 0"""
+    matrix = _matrix()
+    assert matrix.team_counts().tolist() == [2, 1, 0]
+    assert matrix.team_averages()[:, 0].tolist() == [7.0, 20.0, 0.0]
+    assert matrix.team_positive_means()[:, 1].tolist() == [0.5, 0.4, 0.0]
+
+
+def test_rank_keeps_row_order_on_ties():
+    """Rang 1 = meilleure valeur, égalités départagées par l'ordre des lignes"""
+    ranks = CategoryMatrix.rank(np.array([[1.0, 3.0], [5.0, 3.0], [1.0, 0.0]]))
+    assert ranks.tolist() == [[2, 1], [1, 2], [3, 3]]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests de la détection des changements et du journal d'événements
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.change_detection import ChangeDetector, EventLog, league_entities
+
+
+def _player(player_id, slot='PG', pts=10.0, injury='ACTIVE'):
+    return SimpleNamespace(playerId=player_id, name=f"Joueur {player_id}", proTeam='BOS', injuryStatus=injury,
+                           injured=False, lineupSlot=slot, nine_cat_averages={'PTS': pts, 'REB': 5.0})
+
+
+def _league(roster, free_agents):
+    team = SimpleNamespace(team_id=1, team_name='Neon Cobras 99 ', standing=3, stats={'PTS': 900.0}, roster=roster)
+    return league_entities([team], free_agents)
+
+
+def test_only_changes_are_emitted(tmp_path):
+    state_path = str(tmp_path / 'state.json')
+    detector = ChangeDetector(state_path)
+    first = detector.detect(_league([_player(1), _player(2, 'BE')], [_player(3, 'FA')]))
+    assert sorted(event['key'] for event in first if event['type'] == 'added') == \
+        ['fa:3', 'roster:1', 'roster:2', 'team:1']
+    detector.save()
+
+    # Redémarrage : l'état persisté sert de référence, rien n'a changé
+    detector = ChangeDetector(state_path)
+    assert detector.detect(_league([_player(1), _player(2, 'BE')], [_player(3, 'FA')])) == []
+
+    # Joueur 2 titularisé et blessé, joueur 1 marque plus, agent libre 3 recruté
+    events = detector.detect(_league([_player(1, pts=12.5), _player(2, 'UT', injury='OUT'), _player(3, 'BE')], []))
+    by_key = {(event['key'], event['type']): event for event in events}
+    assert by_key[('roster:1', 'stat_delta')]['deltas'] == {'stats.PTS': 2.5}
+    assert by_key[('roster:2', 'status_change')]['changes'] == {
+        'injury_status': {'from': 'ACTIVE', 'to': 'OUT'}, 'lineup_slot': {'from': 'BE', 'to': 'UT'}}
+    assert ('fa:3', 'dropped') in by_key and ('roster:3', 'added') in by_key
+    assert len(events) == 4
+
+
+def test_event_log_append_subscribe_and_follow(tmp_path):
+    path = str(tmp_path / 'events.jsonl')
+    log = EventLog(path)
+    received = []
+    unsubscribe = log.subscribe(received.append, entities=['roster'], types=['added'])
+    log.append([{'entity': 'roster', 'key': 'roster:1', 'type': 'added'},
+                {'entity': 'fa', 'key': 'fa:2', 'type': 'added'},
+                {'entity': 'roster', 'key': 'roster:1', 'type': 'dropped'}])
+    assert [event['seq'] for event in received] == [1]
+    unsubscribe()
+    log.append([{'entity': 'roster', 'key': 'roster:3', 'type': 'added'}])
+    assert len(received) == 1
+
+    # Autre processus : numérotation reprise, lecture depuis un seq
+    reopened = EventLog(path)
+    assert reopened.last_seq == 4
+    assert [event['key'] for event in reopened.read(since_seq=2)] == ['roster:1', 'roster:3']
+    followed = list(reopened.follow(since_seq=3, poll_interval=0, stop=lambda: True))
+    assert [event['seq'] for event in followed] == [4]
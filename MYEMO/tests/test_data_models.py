@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests des modèles de données compacts (slots, lots colonnaires)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.data_models import FA_STAT_KEYS, FreeAgentMarketBatch, GeneralStanding, RecordBatch
+
+
+def test_records_have_no_instance_dict():
+    standing = GeneralStanding('2026-01-01', 'Équipe A', 1, 2, 100.0, 10.0, 0.5)
+    assert not hasattr(standing, '__dict__')
+    with pytest.raises(AttributeError):
+        standing.surnom = 'x'
+    # Valeur par défaut conservée malgré le retrait de l'attribut de classe (compatibilité Python 3.8)
+    assert standing.important_event is None and 'important_event' in GeneralStanding.__slots__
+
+
+def test_record_batch_round_trip():
+    batch = RecordBatch(GeneralStanding)
+    batch.append(date='2026-01-01', team='A', total_rank=1, average_rank=1,
+                 total_points=90.0, average_points=9.0, prev_day_diff=1.0)
+    batch.append(date='2026-01-01', team='B', total_rank=2, average_rank=2,
+                 total_points=80.0, average_points=8.0, prev_day_diff=-1.0, important_event='Échange')
+
+    df = batch.to_frame()
+    assert list(df.columns) == ['date', 'team', 'total_rank', 'average_rank', 'total_points',
+                                'average_points', 'prev_day_diff', 'important_event']
+    assert df['important_event'].isna().tolist() == [True, False]
+    assert [s.team for s in batch] == ['A', 'B']
+    assert batch[1] == GeneralStanding('2026-01-01', 'B', 2, 2, 80.0, 8.0, -1.0, 'Échange')
+
+    with pytest.raises(TypeError):
+        batch.append(date='2026-01-01', team='C')
+
+
+def test_free_agent_batch_frame_matches_flat_csv_layout():
+    batch = FreeAgentMarketBatch(FA_STAT_KEYS, capacity=1)  # Force l'agrandissement des matrices
+    stats = tuple(float(i) for i in range(len(FA_STAT_KEYS)))
+    batch.append('2026-01-01', 'Joueur 1', 'BOS', stats, stats, stats, 12.5, 3.0,
+                 pickup=stats, annotation='Devenu agent libre le 2026-01-01')
+    batch.extend('2026-01-01', ['Joueur 2', 'Joueur 3'], ['LAL', 'NYK'],
+                 np.ones((2, 8)), np.ones((2, 8)), np.full((2, 8), np.nan))
+
+    df = batch.to_frame()
+    assert len(df) == 3
+    assert list(df.columns[:7]) == ['date', 'player', 'nba_team', 'roster_percentage', 'start_percentage',
+                                    'team_fit_score', 'annotation']
+    assert 'last_week_3pm' in df.columns and 'pickup_ft_pct' in df.columns
+    assert df['pickup_pts'].isna().tolist() == [False, True, True]
+    assert df['rolling_30d_reb'].isna().tolist() == [False, True, True]
+
+    first, second = batch[0], batch[1]
+    assert first.last_week_stats['ast'] == 2.0 and first.pickup_stats is not None
+    assert second.pickup_stats is None and second.roster_percentage == 0
+
+
+def test_free_agent_batch_without_pickup_has_no_pickup_columns():
+    batch = FreeAgentMarketBatch()
+    batch.extend('2026-01-01', ['Joueur'], ['MIA'], np.zeros((1, 8)), np.zeros((1, 8)), np.zeros((1, 8)))
+    df = batch.to_frame()
+    assert not any(col.startswith('pickup_') for col in df.columns)
+    assert batch.to_arrow().num_rows == 1
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests de la récupération parallèle du classement et des rosters (aiohttp / requests)
+contre un faux serveur ESPN local
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors import extract_players_data as extract
+from collectors.http_cache import CachedHTTPClient
+from utils.rate_limiter import BackoffPolicy, RateLimiter, mount_rate_limiting
+
+web = pytest.importorskip('aiohttp.web')
+
+TEAM_IDS = list(range(1, 9))
+
+
+class FakeESPN:
+    """Classement + rosters ; failures : réponses en erreur avant la première réponse valide, par chemin"""
+
+    def __init__(self):
+        self.failures = {}
+        self.delay = 0.0
+        self.requests = Counter()
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, request):
+        path = request.path
+        self.requests[path] += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.requests[path] <= self.failures.get(path, (0, 0))[0]:
+                return web.Response(status=self.failures[path][1], headers={'Retry-After': '0'})
+            if path == '/league':
+                return web.json_response({'teams': [{'id': team_id, 'abbrev': f'T{team_id}'} for team_id in TEAM_IDS]})
+            team_id = int(path.rsplit('/', 1)[1])
+            return web.json_response({'id': team_id, 'roster': [{'id': team_id * 100, 'fullName': f'Joueur {team_id}'}]})
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def espn(tmp_path, monkeypatch):
+    server = FakeESPN()
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', server.handle)
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    # Pas de budget pour l'hôte local, reprises rapides ; cache propre au test (toujours revalidé)
+    limiter = RateLimiter(budgets={}, default_budget=None)
+    policy = BackoffPolicy(base=0.01)
+    session = mount_rate_limiting(requests.Session(), limiter=limiter, policy=policy)
+    monkeypatch.setattr(extract, 'LEAGUE_URL', f'http://127.0.0.1:{port}/league')
+    monkeypatch.setattr(extract, 'get_rate_limiter', lambda: limiter)
+    monkeypatch.setattr(extract, 'get_backoff_policy', lambda: policy)
+    monkeypatch.setattr(extract, '_http_client', CachedHTTPClient(str(tmp_path), default_ttl=0, timeout=5,
+                                                                  session=session))
+    yield server
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
+
+
+def test_async_and_sync_return_the_same_data(espn):
+    async_result = asyncio.run(extract.fetch_league_async())
+    sync_result = extract.fetch_league_sync()
+
+    league_data, rosters = async_result
+    assert [team['id'] for team in league_data['teams']] == TEAM_IDS
+    assert sorted(rosters) == TEAM_IDS and rosters[3]['roster'][0]['fullName'] == 'Joueur 3'
+    assert sync_result == async_result
+    assert asyncio.run(extract.fetch_league_async(team_ids=TEAM_IDS)) == async_result
+
+
+def test_concurrency_is_bounded(espn):
+    espn.delay = 0.05
+    _, rosters = asyncio.run(extract.fetch_league_async(team_ids=TEAM_IDS, max_concurrency=3))
+    assert all(rosters.values())
+    assert 1 < espn.max_active <= 3
+
+
+def test_transient_errors_are_retried(espn):
+    espn.failures = {'/league/teams/2': (2, 429), '/league/teams/5': (1, 503)}
+    _, rosters = asyncio.run(extract.fetch_league_async())
+    assert rosters[2]['id'] == 2 and rosters[5]['id'] == 5
+    assert espn.requests['/league/teams/2'] == 3 and espn.requests['/league/teams/5'] == 2
+
+    # Même reprise côté synchrone (adaptateur monté sur la session partagée)
+    espn.failures = {'/league': (espn.requests['/league'] + 1, 503)}
+    league_data, _ = extract.fetch_league_sync(team_ids=[])
+    assert league_data['teams'][0]['id'] == 1
+
+
+def test_falls_back_to_sync_without_aiohttp(espn, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise AssertionError("mode asynchrone utilisé sans aiohttp")
+
+    monkeypatch.setattr(extract, 'aiohttp', None)
+    monkeypatch.setattr(extract, 'fetch_league_async', unavailable)
+    league_data, rosters = extract.fetch_league_data()
+    assert sorted(rosters) == TEAM_IDS and all(rosters.values())
+    assert espn.requests['/league'] == 1
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests de l'index des agents libres (filtres, top-K pondéré)
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.fa_index import FreeAgentIndex, parse_weights
+
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+TEAMS = ['BOS', 'LAL', 'NYK', 'MIA']
+
+
+def _index(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    players = [SimpleNamespace(name=f"Joueur {i}", position=POSITIONS[i % 5], proTeam=TEAMS[i % 4],
+                               eligibleSlots=[POSITIONS[i % 5], 'UT', 'BE'] + (['C'] if i % 7 == 0 else []))
+               for i in range(n)]
+    values = rng.normal(10, 3, size=(n, 8))
+    values[3, 0] = np.nan
+    return FreeAgentIndex.from_players(players, values), values
+
+
+def _brute_force(index, weights, rows, k):
+    scores = index.zscores[rows] @ index.weight_vector(weights)
+    order = np.argsort(-scores, kind='stable')[:k]
+    return [index.players[rows[i]] for i in order]
+
+
+def test_top_k_matches_full_sort_with_filters():
+    index, _ = _index()
+    weights = parse_weights(['stl=1', 'BLK=0.5'])
+
+    result = index.top(weights, k=10, position='C')
+    centers = [row for row, positions in enumerate(index.positions) if 'C' in positions]
+    assert [hit['player'] for hit in result] == _brute_force(index, weights, np.array(centers), 10)
+    assert all('C' in hit['positions'] for hit in result)
+    assert result[0]['score'] >= result[-1]['score']
+
+    result = index.top(weights, k=5, position='C', nba_team='BOS')
+    assert result and all(hit['nba_team'] == 'BOS' for hit in result)
+    assert index.top(weights, k=5, position='XX') == []
+
+
+def test_missing_values_and_unknown_category():
+    index, _ = _index()
+    assert index.zscores[3, 0] == 0.0  # Valeur manquante = moyenne
+    assert 'UT' not in index.by_position
+    with pytest.raises(ValueError):
+        index.top({'dunks': 1.0})
+    excluded = index.top({'pts': 1.0}, k=1)[0]['player']
+    assert index.top({'pts': 1.0}, k=1, exclude=[excluded])[0]['player'] != excluded
+
+
+def test_query_is_sub_millisecond():
+    index, _ = _index(n=1000)
+    weights = {'stl': 1.0, 'blk': 1.0}
+    index.top(weights, k=10, position='C')
+    start = time.perf_counter()
+    for _ in range(200):
+        index.top(weights, k=10, position='C')
+    assert (time.perf_counter() - start) / 200 < 1e-3
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests du FileManager
+Écriture en mode append de l'historique et remplacement des lignes de la dernière date
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.file_manager import FileManager
+
+
+def _standings(date, teams, points=0.0):
+    return pd.DataFrame([{'date': date, 'team': team, 'total_points': points} for team in teams])
+
+
+def test_append_writes_only_new_rows(tmp_path):
+    """Les nouvelles dates sont ajoutées en fin de fichier"""
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251024', ['A', 'B']), 'data/history.csv')
+    manager.append_or_create(_standings('20251025', ['A', 'B'], 1.0), 'data/history.csv')
+
+    df = pd.read_csv(tmp_path / 'data/history.csv', dtype={'date': str})
+    assert len(df) == 4
+    assert list(df['date']) == ['20251024', '20251024', '20251025', '20251025']
+    assert os.path.exists(tmp_path / 'data/history.csv.idx.json')
+
+
+def test_same_day_rerun_replaces_last_date_rows(tmp_path):
+    """Une clé (date, équipe) n'est pas dupliquée ; une nouvelle collecte du jour remplace ses lignes"""
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251023', ['A', 'B'], 1.0), 'history.csv')
+    manager.append_or_create(_standings('20251024', ['A', 'B']), 'history.csv')
+    # Collecte d'après-match le même jour
+    manager.append_or_create(_standings('20251024', ['B', 'C'], 5.0), 'history.csv')
+    manager.append_or_create(_standings('20251024', ['C'], 7.0), 'history.csv')
+
+    df = pd.read_csv(tmp_path / 'history.csv', dtype={'date': str})
+    assert list(zip(df['date'], df['team'], df['total_points'])) == [
+        ('20251023', 'A', 1.0), ('20251023', 'B', 1.0),
+        ('20251024', 'A', 0.0), ('20251024', 'B', 5.0), ('20251024', 'C', 7.0)]
+    latest = pd.read_csv(tmp_path / 'history.latest.csv')
+    assert dict(zip(latest['team'], latest['total_points'])) == {'A': 0.0, 'B': 5.0, 'C': 7.0}
+
+    # Jour suivant : ajout en fin de fichier, le 24 n'est plus réécrit
+    manager.append_or_create(_standings('20251025', ['A'], 2.0), 'history.csv')
+    manager.append_or_create(_standings('20251025', ['A'], 3.0), 'history.csv')
+    df = pd.read_csv(tmp_path / 'history.csv', dtype={'date': str})
+    assert len(df) == 6 and df.iloc[-1].tolist() == ['20251025', 'A', 3.0]
+
+
+def test_roster_keys_include_player(tmp_path):
+    """Plusieurs joueurs d'une même équipe sont conservés pour une date"""
+    manager = FileManager(str(tmp_path))
+    roster = pd.DataFrame([
+        {'date': '20251024', 'team': 'A', 'player': 'P1'},
+        {'date': '20251024', 'team': 'A', 'player': 'P2'},
+    ])
+    manager.append_or_create(roster, 'roster.csv')
+    manager.append_or_create(roster, 'roster.csv')
+
+    assert len(pd.read_csv(tmp_path / 'roster.csv')) == 2
+
+
+def test_existing_file_without_index(tmp_path):
+    """Un historique créé avant l'index est indexé une seule fois"""
+    _standings('20251024', ['A']).to_csv(tmp_path / 'legacy.csv', index=False)
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251024', ['A', 'B'], 1.0), 'legacy.csv')
+    manager.append_or_create(_standings('20251024', ['B'], 2.0), 'legacy.csv')
+
+    df = pd.read_csv(tmp_path / 'legacy.csv')
+    assert dict(zip(df['team'], df['total_points'])) == {'A': 1.0, 'B': 2.0}
+
+
+def test_new_columns_and_backfill_rewrite(tmp_path):
+    """Nouvelles colonnes ou dates antérieures : le fichier est réécrit"""
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251025', ['A']), 'history.csv')
+
+    extra = _standings('20251026', ['A'])
+    extra['annotation'] = 'note'
+    manager.append_or_create(extra, 'history.csv')
+    manager.append_or_create(_standings('20251024', ['A']), 'history.csv')
+
+    df = pd.read_csv(tmp_path / 'history.csv', dtype={'date': str})
+    assert 'annotation' in df.columns
+    assert sorted(df['date']) == ['20251024', '20251025', '20251026']
+
+
+def test_parquet_backend_roundtrip(tmp_path):
+    """Backend Parquet : partitions par date, clés du jour remplacées, projection"""
+    pytest.importorskip('pyarrow')
+
+    manager = FileManager(str(tmp_path), backend='parquet')
+    manager.append_or_create(_standings('20251024', ['A', 'B']), 'stats/history.csv')
+    manager.append_or_create(_standings('20251025', ['A', 'B'], 2.0), 'stats/history.csv')
+    manager.append_or_create(_standings('20251025', ['B'], 9.0), 'stats/history.csv')
+
+    assert sorted(os.listdir(tmp_path / 'stats/history')) == ['date=20251024', 'date=20251025']
+    history = manager.read_history('stats/history.csv', columns=['team', 'total_points'],
+                                   filters=[('date', '>=', '20251025')])
+    assert list(history.columns) == ['team', 'total_points']
+    assert sorted(history['total_points']) == [2.0, 9.0]
+    assert len(os.listdir(tmp_path / 'stats/history/date=20251025')) == 1
+
+    latest = manager.load_latest('stats/history.csv', ['team'], columns=['total_points'], partitions=1)
+    assert set(latest['date']) == {'20251025'}
+
+
+def test_migrate_csv_to_parquet(tmp_path):
+    """Migration unique des CSV data/raw vers Parquet"""
+    pytest.importorskip('pyarrow')
+    from collectors.storage import migrate_csv_to_parquet
+
+    csv_manager = FileManager(str(tmp_path))
+    csv_manager.append_or_create(_standings('20251024', ['A', 'B']), 'data/raw/general/standings_history.csv')
+
+    migrated = migrate_csv_to_parquet(str(tmp_path))
+    assert migrated == [os.path.join('data', 'raw', 'general', 'standings_history.csv')]
+
+    parquet_manager = FileManager(str(tmp_path), backend='parquet')
+    assert len(parquet_manager.read_history('data/raw/general/standings_history.csv')) == 2
+
+
+def test_latest_snapshot_updated_on_write(tmp_path):
+    """La table "dernier état" est tenue à jour à l'écriture"""
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251024', ['A', 'B']), 'history.csv')
+    manager.append_or_create(_standings('20251025', ['A'], 3.0), 'history.csv')
+
+    latest = pd.read_csv(tmp_path / 'history.latest.csv', dtype={'date': str})
+    assert dict(zip(latest['team'], latest['date'])) == {'A': '20251025', 'B': '20251024'}
+
+    previous = manager.load_latest('history.csv', ['team'], columns=['total_points'])
+    assert list(previous.columns) == ['team', 'date', 'total_points']
+    assert previous.set_index('team').loc['A', 'total_points'] == 3.0
+
+
+def test_latest_snapshot_built_for_existing_history(tmp_path):
+    """Un historique sans table matérialisée est parcouru une seule fois"""
+    pd.concat([_standings('20251024', ['A', 'B']), _standings('20251025', ['A'], 1.0)]) \
+        .to_csv(tmp_path / 'legacy.csv', index=False)
+    manager = FileManager(str(tmp_path))
+    manager.append_or_create(_standings('20251026', ['B'], 2.0), 'legacy.csv')
+
+    latest = pd.read_csv(tmp_path / 'legacy.latest.csv', dtype={'date': str})
+    assert dict(zip(latest['team'], latest['date'])) == {'A': '20251025', 'B': '20251026'}
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests du cache HTTP disque (TTL, ETag, 304)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.http_cache import CachedHTTPClient
+
+
+class FakeSession:
+    """Session minimale : renvoie les réponses préparées et garde les en-têtes envoyés"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        status, body, response_headers = self.responses.pop(0)
+        return SimpleNamespace(status_code=status, content=body, headers=response_headers)
+
+
+def test_ttl_serves_from_disk(tmp_path):
+    """Une entrée encore valide est servie sans requête réseau"""
+    session = FakeSession([(200, b'{"a": 1}', {})])
+    client = CachedHTTPClient(str(tmp_path), default_ttl=60, session=session)
+
+    first = client.get('https://espn/league')
+    second = client.get('https://espn/league')
+
+    assert not first.from_cache and not first.not_modified
+    assert second.from_cache and second.json() == {'a': 1}
+    assert len(session.sent_headers) == 1
+
+
+def test_conditional_request_and_304(tmp_path):
+    """ETag renvoyé en If-None-Match ; sur un 304 le corps en cache est réutilisé"""
+    session = FakeSession([(200, b'{"a": 1}', {'ETag': '"v1"'}), (304, b'', {})])
+    client = CachedHTTPClient(str(tmp_path), default_ttl=0, session=session)
+
+    client.get('https://espn/league')
+    response = client.get('https://espn/league')
+
+    assert session.sent_headers[1]['If-None-Match'] == '"v1"'
+    assert response.not_modified and response.json() == {'a': 1}
+
+
+def test_identical_body_without_etag_is_not_modified(tmp_path):
+    """Sans ETag, un corps identique est aussi signalé comme inchangé"""
+    session = FakeSession([(200, b'x', {}), (200, b'x', {}), (200, b'y', {})])
+    client = CachedHTTPClient(str(tmp_path), default_ttl=0, session=session)
+
+    assert not client.get('https://espn/page').not_modified
+    assert client.get('https://espn/page').not_modified
+    assert not client.get('https://espn/page').not_modified
+
+
+def test_parsing_skipped_when_unchanged(tmp_path):
+    """get_parsed ne relance pas le parseur si la réponse n'a pas changé"""
+    session = FakeSession([(200, b'page', {'ETag': '"v1"'}), (304, b'', {})])
+    client = CachedHTTPClient(str(tmp_path), default_ttl=0, session=session)
+    calls = []
+
+    def parser(response):
+        calls.append(response.text)
+        return {'text': response.text}
+
+    client.get_parsed('https://espn/page', parser)
+    parsed, response = client.get_parsed('https://espn/page', parser)
+
+    assert parsed == {'text': 'page'}
+    assert response.not_modified
+    assert calls == ['page']
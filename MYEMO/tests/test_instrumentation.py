@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests de l'instrumentation des étapes (temps, lignes écrites, fichiers de mesures)
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.file_manager import FileManager
+from utils.instrumentation import PipelineMetrics
+from utils.rate_limiter import RateLimiter, mount_rate_limiting
+
+
+def test_stage_records_rows_and_writes_files(tmp_path):
+    """Les lignes écrites par le FileManager sont attribuées à l'étape en cours"""
+    metrics = PipelineMetrics('test_run', str(tmp_path / 'logs'))
+    manager = FileManager(str(tmp_path))
+
+    with metrics.stage('standings') as stage:
+        manager.append_or_create(pd.DataFrame([{'date': '20251024', 'team': 'A'},
+                                               {'date': '20251024', 'team': 'B'}]), 'history.csv')
+    assert stage.rows_written == 2
+    assert stage.wall_s >= 0 and stage.cpu_s >= 0
+
+    json_path = metrics.write()
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f)['stages'][0]['stage'] == 'standings'
+    csv_rows = pd.read_csv(tmp_path / 'logs' / 'metrics' / 'test_run_metrics.csv')
+    assert list(csv_rows['rows_written']) == [2]
+
+
+def test_failed_stage_is_recorded(tmp_path):
+    metrics = PipelineMetrics('test_run', str(tmp_path))
+    with pytest.raises(ValueError):
+        with metrics.stage('broken'):
+            raise ValueError('boom')
+    assert metrics.stages[0].error == 'boom'
+
+
+def test_opt_in_profile_dump(tmp_path, monkeypatch):
+    """MYEMO_PROFILE_STAGE active le profilage cProfile de l'étape choisie"""
+    monkeypatch.setenv('MYEMO_PROFILE_STAGE', 'heavy')
+    metrics = PipelineMetrics('test_run', str(tmp_path))
+    with metrics.stage('heavy'):
+        sum(range(1000))
+    with metrics.stage('light'):
+        pass
+
+    dumps = os.listdir(tmp_path / 'metrics')
+    assert [name for name in dumps if name.endswith('.prof')] == [f"test_run_{metrics.run_id}_heavy.prof"]
+
+
+def test_concurrent_stages_only_count_their_own_thread(tmp_path):
+    """Deux collectes en parallèle : chaque étape ne compte que les lignes de son thread"""
+    manager = FileManager(str(tmp_path))
+    barrier = threading.Barrier(2)
+    stages = {}
+
+    def run(name, rows):
+        metrics = PipelineMetrics(name, str(tmp_path / 'logs'))
+        with metrics.stage('write') as stage:
+            barrier.wait()  # Les deux étapes sont ouvertes en même temps
+            manager.append_or_create(pd.DataFrame([{'date': '20251024', 'team': f"{name}{i}"}
+                                                   for i in range(rows)]), f"{name}.csv")
+            barrier.wait()
+        stages[name] = stage
+
+    threads = [threading.Thread(target=run, args=('a', 3)), threading.Thread(target=run, args=('b', 5))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stages['a'].rows_written == 3 and stages['b'].rows_written == 5
+
+
+def test_network_time_comes_from_mounted_sessions(tmp_path, monkeypatch):
+    """Temps réseau mesuré par l'adaptateur monté, sans patch global de requests"""
+    original_request = requests.Session.request
+
+    def slow_send(self, request, **kwargs):
+        time.sleep(0.05)
+        return SimpleNamespace(status_code=200, headers={}, close=lambda: None)
+
+    monkeypatch.setattr(HTTPAdapter, 'send', slow_send)
+    metrics = PipelineMetrics('test_run', str(tmp_path / 'logs'))
+    assert requests.Session.request is original_request
+
+    session = mount_rate_limiting(requests.Session(), limiter=RateLimiter(budgets={}, default_budget=None))
+    request = requests.Request('GET', 'https://fantasy.espn.com/x').prepare()
+    with metrics.stage('teams') as stage:
+        session.get_adapter(request.url).send(request)
+    with metrics.stage('unowned') as unowned:
+        requests.Session().get_adapter(request.url).send(request)
+
+    assert 0.05 <= stage.network_s <= stage.wall_s
+    assert unowned.network_s == 0
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests du processus unique des travaux planifiés et des verrous fichiers
+"""
+
+import importlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.file_manager import FileManager
+from job_runner import Job, JobRunner, after_result, daily_at, default_jobs
+from utils.file_lock import LockTimeout, file_lock
+
+NOW = datetime(2026, 1, 17, 12, 0)  # Samedi
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    lock_dir = str(tmp_path / 'locks')
+    with file_lock('data/raw/teams.csv', lock_dir):
+        with pytest.raises(LockTimeout):
+            with file_lock('data/raw/teams.csv', lock_dir, blocking=False):
+                pass
+        with pytest.raises(LockTimeout):
+            with file_lock('data/raw/teams.csv', lock_dir, timeout=0.1):
+                pass
+        with file_lock('data/raw/players.csv', lock_dir, blocking=False):
+            pass  # Autre jeu de données : verrou indépendant
+    with file_lock('data/raw/teams.csv', lock_dir, blocking=False):
+        pass
+
+
+def test_concurrent_appends_keep_history_intact(tmp_path):
+    manager = FileManager(str(tmp_path))
+
+    def append(day):
+        manager.append_or_create(pd.DataFrame([{'date': f"202601{day:02d}", 'team': team, 'pts': day}
+                                               for team in 'ABC']), 'data/raw/teams.csv')
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(append, range(1, 21)))
+    history = pd.read_csv(tmp_path / 'data' / 'raw' / 'teams.csv', dtype={'date': str})
+    assert len(history) == 60 and not history.duplicated(['date', 'team']).any()
+
+
+def test_schedules():
+    twice_daily = daily_at("08:00", "20:00")
+    assert twice_daily(NOW) == NOW.replace(hour=20)
+    assert twice_daily(NOW.replace(hour=21)) == NOW.replace(hour=8) + timedelta(days=1)
+    assert daily_at("09:00", weekday=6)(NOW) == NOW.replace(hour=9) + timedelta(days=1)
+
+    adaptive = after_result(daily_at("08:00"), default_seconds=300)
+    assert adaptive(NOW, 120.0) == NOW + timedelta(seconds=120)
+    assert adaptive(NOW, NOW.replace(hour=23)) == NOW.replace(hour=23)  # Après-match avant 8h00
+    assert adaptive(NOW, None) == NOW.replace(hour=8) + timedelta(days=1)
+    assert after_result(default_seconds=300)(NOW, None) == NOW + timedelta(seconds=300)
+
+
+def test_default_jobs_are_importable():
+    """Chaque travail par défaut (et ceux de JOB_RUNNER_JOBS) importe son module sans erreur"""
+    from config.settings import JOB_RUNNER_JOBS
+
+    jobs = {job.name: job for job in default_jobs()}
+    assert set(JOB_RUNNER_JOBS) <= set(jobs)
+    for job in jobs.values():
+        assert job.module, job.name
+        importlib.import_module(job.module)
+
+
+def test_runner_skips_overlaps_and_bounds_concurrency(tmp_path):
+    clock = [NOW]
+    release = threading.Event()
+    active, peak = [0], [0]
+    counter_lock = threading.Lock()
+
+    def slow_job():
+        with counter_lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        release.wait(5)
+        with counter_lock:
+            active[0] -= 1
+        return 60.0
+
+    jobs = [Job('slow', slow_job, after_result(), run_at_start=True),
+            Job('other', slow_job, daily_at("20:00"), run_at_start=True)]
+    status_path = str(tmp_path / 'status.json')
+    runner = JobRunner(jobs, workers=1, status_path=status_path, lock_dir=str(tmp_path / 'locks'),
+                       clock=lambda: clock[0])
+
+    assert runner.tick() == ['slow', 'other']
+    clock[0] += timedelta(minutes=5)  # Échéance provisoire dépassée, lancement précédent en cours
+    assert runner.tick() == []
+    with open(status_path, encoding='utf-8') as f:
+        status = json.load(f)['jobs']
+    assert status['slow']['running'] and status['slow']['last_status'] == 'skipped'
+    assert status['slow']['skipped'] == 1
+
+    release.set()
+    runner.shutdown()
+    assert peak[0] == 1
+    with open(status_path, encoding='utf-8') as f:
+        status = json.load(f)['jobs']
+    assert status['slow'] == {**status['slow'], 'running': False, 'last_status': 'ok', 'runs': 1,
+                              'next_run': (clock[0] + timedelta(seconds=60)).isoformat()}
+    assert status['other']['next_run'] == NOW.replace(hour=20).isoformat()
+
+
+def test_job_locked_by_another_process_is_skipped(tmp_path):
+    lock_dir = str(tmp_path / 'locks')
+    calls = []
+    runner = JobRunner([Job('collect_data', lambda: calls.append(1), daily_at("08:00"), run_at_start=True)],
+                       status_path=str(tmp_path / 'status.json'), lock_dir=lock_dir, clock=lambda: NOW)
+    with file_lock('job_collect_data', lock_dir):
+        runner.tick()
+        runner.shutdown()
+    job = runner.jobs['collect_data']
+    assert calls == [] and job.last_status == 'skipped' and job.runs == 0
+    assert job.next_run == NOW.replace(hour=8) + timedelta(days=1)
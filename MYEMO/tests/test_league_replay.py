@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests de l'enregistrement / rejeu des réponses ESPN
+"""
+
+import gzip
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+
+from collectors.league_replay import (RecordingRequests, ReplayMissError, ReplayRequests,
+                                      load_archive, open_league)
+
+
+def _fake_get(calls):
+    def get(session, endpoint, params=None, headers=None, cookies=None):
+        calls.append(endpoint)
+        return SimpleNamespace(status_code=200, json=lambda: {'endpoint': endpoint, 'params': params})
+    return get
+
+
+def test_record_then_replay(tmp_path, monkeypatch):
+    """Les réponses enregistrées sont rejouées à l'identique, sans réseau"""
+    calls = []
+    monkeypatch.setattr(requests.Session, 'get', _fake_get(calls))
+    archive = str(tmp_path / 'league.jsonl.gz')
+
+    recorder = RecordingRequests(EspnFantasyRequests('nba', 2026, 1), archive)
+    league_data = recorder.league_get(params={'view': ['mTeam', 'mRoster']})
+    players = recorder.get(extend='/players', params={'view': 'players_wl'}, headers={'x-fantasy-filter': '{}'})
+
+    replay = ReplayRequests(EspnFantasyRequests('nba', 2026, 1), load_archive(archive)['responses'])
+    assert replay.league_get(params={'view': ['mTeam', 'mRoster']}) == league_data
+    assert replay.get(extend='/players', params={'view': 'players_wl'}, headers={'x-fantasy-filter': '{}'}) == players
+    assert len(calls) == 2
+
+    with pytest.raises(ReplayMissError):
+        replay.league_get(params={'view': 'mMatchup'})
+
+
+def test_recording_appends_without_rewriting(tmp_path, monkeypatch):
+    """Chaque réponse ajoute un membre gzip : le début de l'archive n'est jamais réécrit"""
+    monkeypatch.setattr(requests.Session, 'get', _fake_get([]))
+    archive = tmp_path / 'league.jsonl.gz'
+    recorder = RecordingRequests(EspnFantasyRequests('nba', 2026, 1), str(archive))
+
+    recorder.league_get(params={'view': 'mTeam'})
+    head = archive.read_bytes()
+    recorder.get(extend='/players')
+    assert archive.read_bytes().startswith(head)
+
+    with open(archive, 'ab') as f:  # Collecte interrompue en pleine écriture
+        f.write(gzip.compress(b'{"key": "tronq')[:-8])
+    archive_data = load_archive(str(archive))
+    assert archive_data['league_id'] == 1 and len(archive_data['responses']) == 2
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        open_league(1, 2026, mode='offline')
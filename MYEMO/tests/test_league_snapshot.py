@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests du snapshot de ligue colonnaire et de ses vues TeamData / PlayerStats
+"""
+
+import json
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.league_snapshot import LeagueSnapshot, PlayerStats, TeamData
+
+CATEGORIES = ['points', 'rebounds']
+
+
+def _player(name, points, is_bench=False):
+    return PlayerStats(
+        player_id=name, name=name, position='PG', team='BOS', status='bench' if is_bench else 'active',
+        injury_status='', points=points, rebounds=2.0, assists=1.0, steals=0.0, blocks=0.0,
+        fg_percentage=0.5, ft_percentage=0.8, three_pointers=1, turnovers=1, plus_minus=0.0,
+        minutes=30.0, games_played=10, date='2026-01-01', is_bench=is_bench, efficiency=points, usage_rate=0.0
+    )
+
+
+def _snapshot():
+    teams = [
+        TeamData('1', 'Équipe A', 'Alice', False, [_player('a1', 10.0), _player('a2', 5.0, True)],
+                 {'points': 15.0, 'rebounds': 4.0}, {'points': 5.0, 'rebounds': 2.0},
+                 {'points': 10.0, 'rebounds': 2.0}, 2, {'points': 2, 'rebounds': 1}),
+        TeamData('2', 'Neon Cobras 99', 'Moi', True, [_player('b1', 20.0)],
+                 {'points': 20.0, 'rebounds': 2.0}, {'points': 0.0, 'rebounds': 0.0},
+                 {'points': 20.0, 'rebounds': 2.0}, 1, {'points': 1, 'rebounds': 2}),
+        TeamData('3', 'Vide', 'Bob', False, [], {}, {}, {}, 3, {}),
+    ]
+    return LeagueSnapshot.from_teams('2026-01-01', '42', 2026, 'H2H_CATEGORY', teams, CATEGORIES,
+                                     transactions=[{'type': 'ADD'}])
+
+
+def test_team_views_match_nested_records():
+    snapshot = _snapshot()
+    teams = snapshot.teams
+
+    assert [team.team_name for team in teams] == ['Équipe A', 'Neon Cobras 99', 'Vide']
+    assert snapshot.my_team.team_name == 'Neon Cobras 99'
+    assert [player.name for player in teams[0].roster] == ['a1', 'a2']
+    assert teams[0].roster[1].is_bench is True
+    assert teams[0].bench_stats == {'points': 5.0, 'rebounds': 2.0}
+    assert teams[1].category_rankings == {'points': 1, 'rebounds': 2}
+    assert teams[2].roster == []
+    assert teams[0].to_record().roster[0] == _player('a1', 10.0)
+
+
+def test_serialization_reads_columns(tmp_path):
+    snapshot = _snapshot()
+
+    data = json.loads(json.dumps(snapshot.to_dict()))
+    assert [p['name'] for p in data['players']] == ['a1', 'a2', 'b1']
+    assert data['teams'][1]['total_points'] == 20.0 and data['teams'][0]['rank_rebounds'] == 1
+    assert data['transactions'] == [{'type': 'ADD'}]
+
+    players_csv, teams_csv = snapshot.save(str(tmp_path), 'csv')
+    assert pd.read_csv(players_csv)['team_row'].tolist() == [0, 0, 1]
+    assert len(pd.read_csv(teams_csv)) == 3
+
+    players_parquet, _ = snapshot.save(str(tmp_path), 'parquet')
+    assert pd.read_parquet(players_parquet)['points'].tolist() == [10.0, 5.0, 20.0]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests de l'optimisation du lineup du jour
+"""
+
+import itertools
+import os
+import sys
+import time
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
+from processors.league_snapshot import ColumnTable, LeagueSnapshot
+from processors.lineup_optimizer import (DEFAULT_SLOT_COUNTS, LineupOptimizer, slot_counts_from_rosters,
+                                         teams_playing_on)
+
+CATEGORIES = ['PTS', 'REB', 'TO']
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+
+
+def _player(name, slots, lineup_slot, pro_team='BOS', injury='ACTIVE'):
+    return SimpleNamespace(name=name, eligibleSlots=slots + ['UT', 'BE', 'IR'], lineupSlot=lineup_slot,
+                           proTeam=pro_team, injuryStatus=injury, schedule={})
+
+
+def test_bench_starter_without_game_is_swapped():
+    roster = [
+        _player('Titulaire sans match', ['PG', 'G'], 'PG', pro_team='LAL'),
+        _player('Remplaçant', ['PG', 'G'], 'BE'),
+        _player('Pivot', ['C'], 'C'),
+        _player('Pivot blessé', ['C'], 'UT', injury='OUT'),
+        _player('Ailier', ['SF', 'F'], 'BE'),
+        _player('Sur IR', ['SF'], 'IR'),
+    ]
+    projections = np.array([[25, 5, 3], [15, 4, 2], [12, 10, 2], [20, 12, 2], [8, 6, 1], [30, 8, 3]], dtype=float)
+    optimizer = LineupOptimizer(CATEGORIES, {'PG': 1, 'C': 1, 'UT': 1}, lower_is_better=['TO'])
+    plan = optimizer.optimize_league([('Mon équipe', roster)], projections, teams_playing={'BOS'})['Mon équipe']
+
+    assert dict(plan.assignments) == {'PG': 'Remplaçant', 'C': 'Pivot', 'UT': 'Ailier'}
+    assert plan.start == ['Remplaçant', 'Ailier']
+    assert plan.bench == ['Titulaire sans match', 'Pivot blessé']
+    assert plan.gain > 0
+
+
+def test_assignment_matches_brute_force():
+    rng = np.random.default_rng(0)
+    optimizer = LineupOptimizer(CATEGORIES, {'PG': 1, 'SF': 1, 'C': 1, 'UT': 2})
+    for _ in range(20):
+        eligible_slots = [list(rng.choice(['PG', 'SF', 'C'], size=rng.integers(1, 3), replace=False)) + ['UT']
+                          for _ in range(8)]
+        values = rng.normal(1, 1, 8)
+        eligible = optimizer.eligibility(eligible_slots)
+        plan = optimizer.optimize_team([str(i) for i in range(8)], values, eligible, ['BE'] * 8)
+
+        best = max(
+            sum(values[p] for p in permutation)
+            for permutation in itertools.permutations(range(8), len(optimizer.slots))
+            if all(eligible[p, j] for j, p in enumerate(permutation))
+        )
+        assert np.isclose(plan.optimal_value, best)
+
+
+def test_slot_counts_and_schedule():
+    rosters = [[_player('a', ['PG'], 'PG'), _player('b', ['C'], 'UT'), _player('c', ['C'], 'UT')],
+               [_player('d', ['C'], 'UT'), _player('e', ['SF'], 'BE')]]  # Emplacements laissés vides
+    assert slot_counts_from_rosters(rosters) == {'PG': 1, 'UT': 2}
+    rosters[1][0].lineupSlot = 'C'  # Pas de gabarit commun : lineup standard
+    assert slot_counts_from_rosters(rosters) == DEFAULT_SLOT_COUNTS
+
+    today = date(2026, 1, 15)
+    playing = _player('f', ['PG'], 'BE', pro_team='NYK')
+    playing.schedule = {'1': {'team': 'BOS', 'date': datetime(2026, 1, 15, 19, 30)}}
+    resting = _player('g', ['PG'], 'BE', pro_team='MIA')
+    resting.schedule = {'1': {'team': 'BOS', 'date': datetime(2026, 1, 16, 19, 30)}}
+    assert teams_playing_on([playing, resting], today) == {'NYK'}
+    assert teams_playing_on([_player('h', ['PG'], 'BE')], today) is None
+
+
+def test_full_league_in_milliseconds():
+    rng = np.random.default_rng(1)
+    rosters = []
+    for team in range(12):
+        roster = []
+        for i in range(13):
+            position = POSITIONS[(team + i) % 5]
+            slot = ['PG', 'SG', 'SF', 'PF', 'C', 'UT', 'UT', 'UT', 'G', 'F'][i] if i < 10 else 'BE'
+            roster.append(_player(f"{team}-{i}", [position, 'G' if position in ('PG', 'SG') else 'F'], slot,
+                                  pro_team=['BOS', 'LAL', 'NYK'][i % 3]))
+        rosters.append((f"Équipe {team}", roster))
+    projections = rng.uniform(0, 25, size=(12 * 13, len(CATEGORIES)))
+    optimizer = LineupOptimizer(CATEGORIES, slot_counts_from_rosters(r for _, r in rosters), lower_is_better=['TO'])
+
+    optimizer.optimize_league(rosters, projections, {'BOS', 'NYK'})
+    start = time.perf_counter()
+    for _ in range(20):
+        plans = optimizer.optimize_league(rosters, projections, {'BOS', 'NYK'})
+    assert (time.perf_counter() - start) / 20 < 0.05
+    assert len(plans) == 12 and all(plan.gain >= -1e-9 for plan in plans.values())
+    assert all(len(plan.assignments) <= 10 for plan in plans.values())
+
+
+def test_analyzer_projects_per_game_values(tmp_path):
+    """Un joueur à 20 matchs n'est pas préféré à un meilleur joueur qui en a joué 10"""
+    analyzer = ESPNNBAAdvancedAnalyzer(1, 2026, league=SimpleNamespace(teams=[]), history_dir=str(tmp_path))
+    columns = {category: [0.0, 0.0, 0.0] for category in analyzer.TEAM_STAT_CATEGORIES}
+    columns.update(points=[400.0, 300.0, 0.0], turnovers=[40.0, 20.0, 0.0],
+                   fg_percentage=[0.45, 0.52, 0.0], games_played=[20, 10, 0])
+
+    projections = analyzer._per_game_projections(ColumnTable.from_lists(columns))
+    points, fg, turnovers = (analyzer.TEAM_STAT_CATEGORIES.index(c) for c in ('points', 'fg_percentage', 'turnovers'))
+
+    assert projections[:, points].tolist() == [20.0, 30.0, 0.0]
+    assert projections[:, turnovers].tolist() == [2.0, 2.0, 0.0]
+    assert projections[:, fg].tolist() == [0.45, 0.52, 0.0]
+
+
+def test_daily_report_prints_lineup_recommendation(tmp_path, capsys):
+    """Alerte du rapport : la recommandation du lineup optimal, pas un seuil de points sur le banc"""
+    analyzer = ESPNNBAAdvancedAnalyzer(1, 2026, league=SimpleNamespace(teams=[]), history_dir=str(tmp_path))
+    players = ColumnTable.from_lists({'name': ['Remplaçant'], 'points': [40.0], 'is_bench': [True], 'team_row': [0]})
+    teams = ColumnTable.from_lists({'team_id': ['1'], 'team_name': ['Neon Cobras 99'], 'manager': ['Moi'],
+                                    'is_my_team': [True], 'ranking': [1]})
+    stats = {subset: np.array([[40.0]]) for subset in ('total', 'bench', 'active')}
+    recommendation = {'type': 'lineup_optimization', 'message': "Lineup non optimal (+1.2) : titulariser Remplaçant"}
+    snapshot = LeagueSnapshot('2026-01-15', '1', 2026, 'H2H_CATEGORY', players, teams, ['points'], stats,
+                              np.array([[1]]), ai_recommendations=[recommendation])
+
+    analyzer.generate_daily_report(snapshot)
+    report = capsys.readouterr().out
+    assert "ATTENTION: Lineup non optimal (+1.2) : titulariser Remplaçant" in report
+    assert "perdus sur le banc" not in report
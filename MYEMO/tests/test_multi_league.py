@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests de la collecte multi-ligues (espaces de données par ligue, résumé des temps)
+"""
+
+import csv
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from collectors.multi_league import LeagueConfig, collect_leagues, load_league_configs, write_summary
+from synthetic_league import MY_TEAM_NAME, LeagueShape, make_league
+
+
+def _league_factory(config):
+    if config.league_id == 3:
+        raise ConnectionError("ESPN indisponible")
+    return make_league(LeagueShape(teams=4, roster_size=6, bench_size=1, free_agents=10, seed=config.league_id))
+
+
+def test_leagues_collected_in_separate_namespaces(tmp_path):
+    configs = [LeagueConfig(1, 2026, MY_TEAM_NAME), LeagueConfig(2, 2026, MY_TEAM_NAME),
+               LeagueConfig(3, 2026, MY_TEAM_NAME)]
+    results = collect_leagues(configs, base_path=str(tmp_path), workers=2, today='20260115',
+                              league_factory=_league_factory)
+
+    assert [result['league_id'] for result in results] == [1, 2, 3]
+    assert [result['status'] for result in results] == ['ok', 'ok', 'error']
+    assert 'ESPN indisponible' in results[2]['error']
+    for league_id in (1, 2):
+        raw = tmp_path / 'data' / 'raw' / str(league_id)
+        assert (raw / 'general' / 'standings_history.csv').exists()
+        assert (raw / 'stats' / 'daily_player_stats.csv').exists()
+        assert (tmp_path / 'data' / 'cache' / str(league_id) / 'rolling_stats.npz').exists()
+    assert not (tmp_path / 'data' / 'raw' / 'general').exists()
+    assert results[0]['rows_written'] > 0 and 'free_agents' in results[0]['stages']
+
+    with open(write_summary(results, str(tmp_path)), newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['status'] for row in rows] == ['ok', 'ok', 'error']
+    assert float(rows[0]['free_agents_s']) >= 0
+
+
+def test_league_configs_from_json_and_settings(tmp_path):
+    path = tmp_path / 'leagues.json'
+    path.write_text(json.dumps([{'league_id': '12', 'season': 2026, 'my_team': 'A'}, [34, 2025, 'B']]))
+    assert load_league_configs(str(path)) == [LeagueConfig(12, 2026, 'A'), LeagueConfig(34, 2025, 'B')]
+    assert load_league_configs()[0].league_id == 1557635339
+
+
+def test_rows_written_per_league_independent_of_concurrency(tmp_path):
+    """Les lignes écrites par une ligue ne sont pas attribuées aux ligues collectées en parallèle"""
+    configs = [LeagueConfig(league_id, 2026, MY_TEAM_NAME) for league_id in (4, 5, 6, 7)]
+    sequential = collect_leagues(configs, base_path=str(tmp_path / 'sequential'), workers=1, today='20260115',
+                                 league_factory=_league_factory)
+    parallel = collect_leagues(configs, base_path=str(tmp_path / 'parallel'), workers=4, today='20260115',
+                               league_factory=_league_factory)
+    assert all(result['rows_written'] > 0 for result in sequential)
+    assert [result['rows_written'] for result in parallel] == [result['rows_written'] for result in sequential]
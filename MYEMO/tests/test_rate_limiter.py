@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests du limiteur de débit, des reprises et de la file de reprise
+"""
+
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.instrumentation import PipelineMetrics
+from utils.rate_limiter import (BackoffPolicy, RateLimitedAdapter, RateLimiter, RetryScheduler, TokenBucket,
+                                mount_rate_limiting, send_with_retry)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {}, close=lambda: None)
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_send_retries_429_with_retry_after_and_counts_throttling():
+    clock = FakeClock()
+    limiter = RateLimiter(budgets={'sheets.googleapis.com': (1.0, 1)}, sleep=clock.sleep, clock=clock)
+    policy = BackoffPolicy(base=0.5, rng=random.Random(0))
+    responses = [_response(429, {'Retry-After': '3'}), _response(200)]
+    request = SimpleNamespace(url='https://sheets.googleapis.com/v4/spreadsheets/x:batchUpdate', method='POST')
+
+    response = send_with_retry(lambda req, **kw: responses.pop(0), request, limiter, policy)
+
+    assert response.status_code == 200
+    assert clock.sleeps[0] >= 3  # Retry-After respecté
+    stats = limiter.summary()['sheets.googleapis.com']
+    assert stats['requests'] == 2 and stats['retries'] == 1
+
+
+def test_post_server_error_is_not_replayed():
+    limiter = RateLimiter(sleep=lambda s: None)
+    calls = []
+
+    def send(req, **kw):
+        calls.append(req)
+        return _response(500)
+
+    request = SimpleNamespace(url='https://sheets.googleapis.com/v4/x', method='POST')
+    assert send_with_retry(send, request, limiter, BackoffPolicy()).status_code == 500
+    assert len(calls) == 1
+
+
+def test_only_mounted_sessions_are_throttled(monkeypatch):
+    """Le budget s'applique aux sessions du projet, pas aux autres utilisateurs de requests"""
+    clock = FakeClock()
+    limiter = RateLimiter(budgets={'fantasy.espn.com': (1.0, 1)}, sleep=clock.sleep, clock=clock)
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda self, request, **kwargs: _response(200))
+    request = requests.Request('GET', 'https://fantasy.espn.com/apis/v3/x').prepare()
+
+    session = mount_rate_limiting(requests.Session(), limiter=limiter)
+    adapter = session.get_adapter(request.url)
+    assert mount_rate_limiting(session).get_adapter(request.url) is adapter  # Montage idempotent
+    for _ in range(3):
+        adapter.send(request)
+    assert clock.sleeps == [1.0, 1.0]
+
+    plain = requests.Session().get_adapter(request.url)
+    assert not isinstance(plain, RateLimitedAdapter)
+    for _ in range(3):
+        plain.send(request)
+    assert clock.sleeps == [1.0, 1.0]
+
+
+def test_throttle_only_adapter_leaves_retries_to_the_caller(monkeypatch):
+    """retries=False : une seule tentative, la reprise revient à RetryScheduler"""
+    calls = []
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda self, request, **kwargs: calls.append(request) or _response(429))
+    limiter = RateLimiter(sleep=lambda s: None)
+    request = requests.Request('POST', 'https://sheets.googleapis.com/v4/x').prepare()
+
+    assert RateLimitedAdapter(limiter=limiter, retries=False).send(request).status_code == 429
+    assert len(calls) == 1
+
+    policy = BackoffPolicy(base=0.0, max_retries=2)
+    assert RateLimitedAdapter(limiter=limiter, policy=policy).send(request).status_code == 429
+    assert len(calls) == 4
+
+
+def test_scheduler_requeues_transient_failures():
+    clock = FakeClock()
+    scheduler = RetryScheduler(BackoffPolicy(base=1.0, rng=random.Random(0)), sleep=clock.sleep, clock=clock)
+    order = []
+    attempts = {'a': 0}
+
+    def flaky():
+        order.append('a')
+        attempts['a'] += 1
+        if attempts['a'] < 3:
+            raise requests.HTTPError(response=SimpleNamespace(status_code=429, headers={}))
+        return 'ok'
+
+    def broken():
+        order.append('c')
+        raise ValueError('données invalides')
+
+    scheduler.submit('a', flaky)
+    scheduler.submit('b', lambda: order.append('b') or 'b')
+    scheduler.submit('c', broken)
+    results, failures = scheduler.run()
+
+    assert order == ['a', 'b', 'c', 'a', 'a']  # 'b' et 'c' passent pendant l'attente de 'a'
+    assert results == {'a': 'ok', 'b': 'b'}
+    assert failures == {'c': 'données invalides'}
+    assert scheduler.waited_s > 0
+
+
+def test_throttled_time_is_reported_per_stage(tmp_path):
+    limiter = RateLimiter(sleep=lambda s: None)
+    metrics = PipelineMetrics('test_run', str(tmp_path))
+    with metrics.stage('sheets') as stage:
+        limiter.backoff('sheets.googleapis.com', 2.5)
+    assert stage.throttled_s == 2.5
+    assert 'Limité' in metrics.summary()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests des moyennes glissantes incrémentales (7 / 14 / 30 jours)
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.rolling_stats import RollingStatsEngine, load_or_rebuild
+
+KEYS = ('pts', 'reb')
+
+
+def _day(offset):
+    return (datetime(2026, 1, 1) + timedelta(days=offset)).strftime('%Y%m%d')
+
+
+def _history(days=40, seed=0):
+    """Historique aléatoire avec des jours sans match (joueur absent) et des NaN"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for offset in range(days):
+        for player in ('A', 'B', 'C'):
+            if rng.random() < 0.7:
+                pts, reb = rng.normal(15, 5), rng.normal(6, 2)
+                rows.append({'date': _day(offset), 'player': player, 'pts': pts,
+                             'reb': np.nan if rng.random() < 0.1 else reb})
+    return pd.DataFrame(rows)
+
+
+def _expected(history, player, end_offset, length):
+    dates = {_day(o) for o in range(end_offset - length + 1, end_offset + 1)}
+    rows = history[(history['player'] == player) & history['date'].isin(dates)]
+    return rows[list(KEYS)].mean().to_numpy()
+
+
+def test_incremental_matches_full_recompute():
+    history = _history()
+    engine = RollingStatsEngine(KEYS)
+    windows = {'last_week': 7, 'rolling_14d': 14, 'rolling_30d': 30}
+    for offset in range(40):
+        day = history[history['date'] == _day(offset)]
+        engine.update(_day(offset), day['player'].tolist(), day[list(KEYS)].to_numpy())
+        means = engine.means(['A', 'B', 'C', 'Inconnu'])
+        for window, length in windows.items():
+            for i, player in enumerate(['A', 'B', 'C']):
+                np.testing.assert_allclose(means[window][i], _expected(history, player, offset, length))
+            assert np.isnan(means[window][3]).all()
+
+
+def test_same_day_update_replaces_and_gap_expires():
+    engine = RollingStatsEngine(KEYS)
+    engine.update(_day(0), ['A'], [[10.0, 5.0]])
+    engine.update(_day(0), ['A', 'A'], [[99.0, 1.0], [20.0, 5.0]])  # Nouvelle exécution : remplace
+    assert engine.means(['A'])['last_week'].tolist() == [[20.0, 5.0]]
+
+    engine.update(_day(8), ['B'], [[1.0, 1.0]])
+    means = engine.means(['A'])
+    assert np.isnan(means['last_week']).all()
+    assert means['rolling_14d'].tolist() == [[20.0, 5.0]]
+
+    engine.update(_day(60), [], np.zeros((0, 2)))
+    assert np.isnan(engine.means(['A', 'B'])['rolling_30d']).all()
+
+
+def test_state_round_trip_and_bootstrap(tmp_path):
+    history = _history(days=20)
+    state_path = str(tmp_path / 'rolling.npz')
+    calls = []
+
+    def read_history():
+        calls.append(1)
+        return [history]
+
+    engine, rebuilt = load_or_rebuild(state_path, read_history)
+    assert rebuilt and calls == [1]
+    engine.save(state_path)
+
+    reloaded, rebuilt = load_or_rebuild(state_path, read_history)
+    assert not rebuilt and calls == [1]  # L'historique n'est pas relu
+    players = ['A', 'B', 'C']
+    for window, values in engine.means(players).items():
+        np.testing.assert_allclose(reloaded.means(players)[window], values)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests de la projection Monte Carlo du classement roto
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collectors.rolling_stats import RollingStatsEngine
+from processors.roto_simulator import CHUNK_SIZE, RotoSimulator
+
+
+def _league(n_teams=12, roster=13, seed=0, current=None):
+    """Ligue aléatoire : catégories PTS, TO (moins = mieux), FG%"""
+    rng = np.random.default_rng(seed)
+    n_players = n_teams * roster
+    means = np.column_stack([rng.uniform(5, 25, n_players), rng.uniform(0.5, 3, n_players),
+                             rng.uniform(0.40, 0.55, n_players)])
+    return RotoSimulator(
+        teams=[f"Équipe {i}" for i in range(n_teams)],
+        categories=['PTS', 'TO', 'FG%'],
+        current=np.zeros((n_teams, 3)) if current is None else current,
+        team_index=np.repeat(np.arange(n_teams), roster),
+        means=means,
+        stds=np.full((n_players, 3), np.nan),
+        games_remaining=40,
+        percentage=[False, False, True],
+        lower_is_better=[False, True, False]
+    )
+
+
+def test_dominant_team_and_lower_is_better():
+    current = np.zeros((3, 3))
+    current[0] = [10000.0, 10000.0, 0.60]  # Loin devant partout, mais pire en TO
+    result = _league(n_teams=3, current=current).run(500, seed=1)
+
+    probabilities = result.rank_probabilities()
+    assert probabilities[0, 0, 0] == 1.0 and probabilities[0, 2, 0] == 1.0
+    assert probabilities[0, 1, 2] == 1.0
+    assert (result.rank_counts.sum(axis=2) == 500).all()
+    # 3 points (PTS) + 1 (TO) + 3 (FG%)
+    assert (result.total_points[:, 0] == 7).all()
+
+
+def test_ties_share_final_places():
+    simulator = _league(n_teams=3, roster=1)
+    simulator.scale[:] = 0.0
+    simulator.loc[:] = simulator.loc[0]  # Trois équipes identiques
+    result = simulator.run(100, seed=0)
+    assert (result.total_points == 6).all()  # 2 points par catégorie (égalité à trois)
+    assert (result.rank_probabilities()[:, :, 0] == 1.0).all()
+    np.testing.assert_allclose(result.final_rank_probabilities(), np.full((3, 3), 1 / 3))
+
+
+def test_parallel_runs_merge_all_simulations():
+    simulator = _league()
+    result = simulator.run(2 * CHUNK_SIZE + 1, workers=2, seed=3)
+    assert result.n_sims == 2 * CHUNK_SIZE + 1
+    assert (result.rank_counts.sum(axis=2) == result.n_sims).all()
+    np.testing.assert_allclose(result.final_rank_probabilities().sum(axis=1), 1.0)
+    summary = result.summary()
+    assert len(summary) == 12 and summary['mean_points'].is_monotonic_decreasing
+
+
+def test_ten_thousand_simulations_of_twelve_teams():
+    simulator = _league()
+    start = time.perf_counter()
+    result = simulator.run(10000, seed=0)
+    assert time.perf_counter() - start < 5.0
+    # Somme des points roto par simulation : catégories × (1 + ... + 12)
+    assert (result.total_points.sum(axis=1) == 3 * 78).all()
+
+
+def test_rolling_stds_match_pandas():
+    engine = RollingStatsEngine(('pts',), {'last_week': 7, 'rolling_30d': 30})
+    values = [10.0, np.nan, 14.0, 9.0, 20.0]
+    for day, value in enumerate(values, 1):
+        engine.update(f"202601{day:02d}", ['A', 'B'], [[value], [5.0 if day == 1 else np.nan]])
+    stds = engine.stds(['A', 'B', 'Inconnu'])
+    np.testing.assert_allclose(stds[0], np.nanstd(values, ddof=1))
+    assert np.isnan(stds[1:]).all()  # Une seule observation / joueur inconnu
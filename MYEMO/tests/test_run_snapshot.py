@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests du snapshot d'exécution de la collecte (ligue récupérée une seule fois)
+"""
+
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from collectors.collect_data import DataCollector
+from collectors.league_snapshot import LeagueRunSnapshot
+from synthetic_league import LeagueShape, make_league
+from utils.instrumentation import PipelineMetrics
+
+
+class CountingLeague:
+    """Ligue synthétique qui compte les accès (attributs et appels) des collecteurs"""
+
+    def __init__(self, league):
+        self._league = league
+        self.accesses = Counter()
+
+    def __getattr__(self, name):
+        self.accesses[name] += 1
+        return getattr(self._league, name)
+
+
+def _league(seed=1):
+    league = make_league(LeagueShape(teams=6, roster_size=6, bench_size=1, free_agents=20, seed=seed))
+    for team in league.teams:
+        for stat, value in team.stats.items():
+            setattr(team, f'stats_{stat.lower()}', round(value))  # Arrondi : quelques égalités
+    return league
+
+
+def test_full_collection_fetches_the_league_once(tmp_path):
+    league = CountingLeague(_league())
+    collector = DataCollector(league=league, base_path=str(tmp_path), today='20260115')
+    collector.run_collection(PipelineMetrics('test_run', str(tmp_path / 'logs')))
+
+    assert league.accesses['free_agents'] == 1
+    assert league.accesses['standings'] == 1
+    assert league.accesses['teams'] == 1
+    assert not league.accesses['fetch_league']
+
+
+def test_stat_ranks_match_brute_force():
+    league = _league(seed=3)
+    categories = DataCollector.STATS_CATEGORIES
+    snapshot = LeagueRunSnapshot.fetch(league, categories)
+
+    standings = league.standings()
+    for stat in categories:
+        values = [getattr(team, f'stats_{stat.lower()}') for team in standings]
+        for i, team in enumerate(standings):
+            # Rang 1 = meilleur ; égalités départagées par l'ordre du classement
+            expected = 1 + sum(value > values[i] for value in values) + sum(value == values[i] for value in values[:i])
+            assert snapshot.stat_rank(team, stat) == expected, (stat, team.team_id)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests du regroupement des requêtes des feuilles d'analyse (faux backend hors ligne)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.advanced_analysis_sheets import AdvancedAnalysisSheets
+from utils.fake_sheets import FakeSpreadsheet
+from utils.sheets_batch import SheetsBatch
+
+ANALYSIS_SHEETS = ['👑 Mon Équipe - Analyse', '🎯 Optimisation ROTO', '🪑 Analyse Banc', '📊 Dashboard Principal']
+
+
+def test_all_analysis_sheets_in_one_batch_update():
+    spreadsheet = FakeSpreadsheet(titles=ANALYSIS_SHEETS)
+
+    AdvancedAnalysisSheets(spreadsheet).create_all_analysis_sheets()
+
+    # Une lecture des feuilles existantes + un seul batchUpdate, aucun appel cellule par cellule
+    assert [name for name, _ in spreadsheet.calls] == ['worksheets', 'batch_update']
+    roto = spreadsheet.sheet('🎯 Optimisation ROTO')
+    assert roto.acell('A1') == '🎯 OPTIMISATION ROTO - STRATÉGIE COMPLÈTE'
+    assert roto.acell('E5') == '=IF(C5>6,"🔴 Critique","🟡 Modéré")'
+    assert len(spreadsheet.sheet('📊 Dashboard Principal').formats) == 6
+
+    requests = spreadsheet.calls[-1][1]['requests']
+    formula = next(r for r in requests if 'updateCells' in r
+                   and r['updateCells']['start'] == {'sheetId': roto.id, 'rowIndex': 4, 'columnIndex': 4})
+    assert formula['updateCells']['rows'][0]['values'][0]['userEnteredValue'] == {
+        'formulaValue': '=IF(C5>6,"🔴 Critique","🟡 Modéré")'}
+
+
+def test_missing_sheet_is_created_once_and_standalone_create_flushes():
+    spreadsheet = FakeSpreadsheet()
+
+    AdvancedAnalysisSheets(spreadsheet).create_bench_analysis()
+
+    assert [name for name, _ in spreadsheet.calls] == ['worksheets', 'add_worksheet', 'batch_update']
+    assert spreadsheet.sheet('🪑 Analyse Banc').acell('F5') == '=E5/D5*100'
+
+
+def test_format_ranges_are_grid_ranges():
+    spreadsheet = FakeSpreadsheet(titles=['Feuille'])
+    batch = SheetsBatch(spreadsheet)
+    batch.worksheet('Feuille').format('B2:D4', {'textFormat': {'bold': True}})
+
+    assert batch.flush() == 1
+    assert batch.flush() == 0
+    repeat = spreadsheet.calls[-1][1]['requests'][0]['repeatCell']
+    assert repeat['range'] == {'sheetId': 0, 'startRowIndex': 1, 'endRowIndex': 4,
+                               'startColumnIndex': 1, 'endColumnIndex': 4}
+    assert repeat['fields'] == 'userEnteredFormat(textFormat)'
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests de la synchronisation incrémentale Google Sheets (faux backend hors ligne)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.fake_sheets import FakeSpreadsheet
+from utils.sheets_sync import SheetsSyncEngine, SheetTable
+
+HEADERS = ['Joueur', 'Équipe', 'Points']
+
+
+def _players(*rows):
+    return SheetTable('👥 Joueurs', HEADERS, [list(row) for row in rows], key_columns=(0,))
+
+
+def test_first_sync_writes_everything(tmp_path):
+    spreadsheet = FakeSpreadsheet()
+    engine = SheetsSyncEngine(spreadsheet, state_dir=str(tmp_path))
+
+    report = engine.sync([_players(('A', 'BOS', 20.5), ('B', 'LAL', np.float64(12.0)))])
+
+    assert spreadsheet.sheet('👥 Joueurs').get_all_values() == [HEADERS, ['A', 'BOS', 20.5], ['B', 'LAL', 12.0]]
+    assert spreadsheet.request_count('values_batch_update') == 1
+    assert report.rows_changed['👥 Joueurs'] == 3
+
+
+def test_only_changed_cells_are_sent(tmp_path):
+    spreadsheet = FakeSpreadsheet()
+    engine = SheetsSyncEngine(spreadsheet, state_dir=str(tmp_path))
+    engine.sync([_players(('A', 'BOS', 20.5), ('B', 'LAL', 12.0), ('C', 'MIA', 8.0))])
+    spreadsheet.calls.clear()
+
+    # Nouvelle instance (état relu sur disque), ordre modifié + une seule stat changée : une cellule envoyée
+    engine = SheetsSyncEngine(spreadsheet, state_dir=str(tmp_path))
+    report = engine.sync(
+        [_players(('C', 'MIA', 8.0), ('A', 'BOS', 20.5), ('B', 'LAL', 14.0))])
+
+    assert spreadsheet.calls == [('values_batch_update', {
+        'valueInputOption': 'USER_ENTERED',
+        'data': [{'range': "'👥 Joueurs'!C3:C3", 'values': [[14.0]]}]
+    })]
+    assert report.cells == 1
+
+    spreadsheet.calls.clear()
+    assert engine.sync([_players(('C', 'MIA', 8.0), ('A', 'BOS', 20.5), ('B', 'LAL', 14.0))]).is_noop
+    assert spreadsheet.calls == []
+
+
+def test_removed_rows_are_blanked_and_reused(tmp_path):
+    spreadsheet = FakeSpreadsheet()
+    engine = SheetsSyncEngine(spreadsheet, state_dir=str(tmp_path))
+    engine.sync([_players(('A', 'BOS', 1), ('B', 'LAL', 2), ('C', 'MIA', 3)),
+                 SheetTable('🔄 Transactions', ['Date', 'Type'], [['2025-10-24', 'ADD']])])
+
+    # B remplacé par D (même ligne), C disparaît, les transactions deviennent vides
+    engine.sync([_players(('A', 'BOS', 1), ('D', 'NYK', 4)),
+                 SheetTable('🔄 Transactions', ['Aucune transaction récente'])])
+
+    assert spreadsheet.sheet('👥 Joueurs').get_all_values() == [HEADERS, ['A', 'BOS', 1], ['D', 'NYK', 4]]
+    assert spreadsheet.sheet('🔄 Transactions').get_all_values() == [['Aucune transaction récente']]
+    assert spreadsheet.request_count('values_batch_update') == 2
+
+
+def test_force_resyncs_from_a_clean_sheet(tmp_path):
+    spreadsheet = FakeSpreadsheet(titles=['👥 Joueurs'])
+    spreadsheet.sheet('👥 Joueurs').update('A1', [['modifié à la main'], ['x'], ['y'], ['z']])
+    engine = SheetsSyncEngine(spreadsheet, state_dir=str(tmp_path))
+
+    engine.sync([_players(('A', 'BOS', 1))])
+
+    assert spreadsheet.sheet('👥 Joueurs').get_all_values() == [HEADERS, ['A', 'BOS', 1]]
+    assert spreadsheet.request_count('values_batch_clear') == 1
+    assert spreadsheet.request_count('add_worksheet') == 0
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests de l'historique borné des snapshots (mémoire + store disque compressé)
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from processors.advanced_analyzer import ESPNNBAAdvancedAnalyzer
+from processors.league_snapshot import ColumnTable, LeagueSnapshot
+from processors.snapshot_history import SnapshotHistory
+
+
+def _snapshot(date, points):
+    players = ColumnTable.from_lists({
+        'name': ['Joueur A', 'Joueur B'], 'injury_status': [None, 'OUT'],
+        'points': [points, 1.0], 'is_bench': [False, True], 'team_row': [0, 0]
+    })
+    teams = ColumnTable.from_lists({'team_id': ['1'], 'team_name': ['Neon Cobras 99'], 'manager': ['Moi'],
+                                    'is_my_team': [True], 'ranking': [3]})
+    stats = {subset: np.array([[points + 1.0]]) for subset in ('total', 'bench', 'active')}
+    return LeagueSnapshot(date, '42', 2026, 'H2H_CATEGORY', players, teams, ['points'], stats,
+                          np.array([[2]]), transactions=[{'type': 'ADD', 'date': date}])
+
+
+def test_compressed_round_trip(tmp_path):
+    path = _snapshot('2026-01-05', 12.5).save_compressed(str(tmp_path / 'snap.npz'))
+    snapshot = LeagueSnapshot.load_compressed(path)
+
+    team = snapshot.my_team
+    assert [p.name for p in team.roster] == ['Joueur A', 'Joueur B']
+    assert team.roster[0].injury_status is None and team.roster[1].is_bench is True
+    assert team.total_stats == {'points': 13.5} and team.category_rankings == {'points': 2}
+    assert snapshot.transactions == [{'type': 'ADD', 'date': '2026-01-05'}]
+
+
+def test_history_is_bounded_and_survives_restart(tmp_path):
+    history = SnapshotHistory(str(tmp_path), max_in_memory=2)
+    for day in range(1, 6):
+        history.append(_snapshot(f'2026-01-0{day}', float(day)))
+
+    assert len(history) == 5 and history.in_memory == 2
+    assert history[-1].player_table['points'][0] == 5.0
+    assert history.loads == 0
+    assert history[0].date == '2026-01-01'  # Relu depuis le disque
+    assert history.loads == 1 and history.in_memory == 2
+
+    restarted = SnapshotHistory(str(tmp_path), max_in_memory=2)
+    assert restarted.in_memory == 0 and restarted.dates[-1] == '2026-01-05'
+    assert [s.date for s in restarted.since('2026-01-04')] == ['2026-01-04', '2026-01-05']
+    assert restarted.loads == 2
+
+    restarted.append(_snapshot('2026-01-06', 6.0))
+    assert os.path.exists(tmp_path / '000005_2026-01-06.npz')
+
+
+def test_disk_retention(tmp_path):
+    history = SnapshotHistory(str(tmp_path), max_in_memory=1, max_on_disk=3)
+    for day in range(1, 6):
+        history.append(_snapshot(f'2026-01-0{day}', float(day)))
+    assert history.dates == ['2026-01-03', '2026-01-04', '2026-01-05']
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_instances_sharing_a_directory_do_not_overwrite(tmp_path):
+    """Deux analyseurs sur le même dossier (même processus du job runner) : numéros lus sur le disque"""
+    first = SnapshotHistory(str(tmp_path / '42'))
+    second = SnapshotHistory(str(tmp_path / '42'))
+    first.append(_snapshot('2026-01-05', 1.0))
+    second.append(_snapshot('2026-01-05', 2.0))
+
+    assert sorted(os.listdir(tmp_path / '42')) == ['000000_2026-01-05.npz', '000001_2026-01-05.npz']
+    assert len(first) == len(second) == 2
+    assert first[-1].player_table['points'][0] == 2.0
+    assert second[0].player_table['points'][0] == 1.0
+
+
+def _players(efficiency, games):
+    return ColumnTable.from_lists({
+        'player_id': ['1', '2', '3'], 'name': ['Chaud', 'Froid', 'Absent'], 'team': ['BOS', 'LAL', 'MIA'],
+        'efficiency': efficiency, 'games_played': games, 'points': efficiency,
+        'injury_status': [None] * 3, 'is_bench': [False] * 3, 'team_row': [0] * 3
+    })
+
+
+def test_hot_cold_compares_with_history_after_restart(tmp_path):
+    """Tendances calculées depuis l'historique disque, même après un redémarrage de l'analyseur"""
+    def days_ago(days):
+        return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+    league = SimpleNamespace(teams=[])
+    before_restart = ESPNNBAAdvancedAnalyzer(42, 2026, league=league, history_dir=str(tmp_path))
+    for date, efficiency, games in ((days_ago(10), [0.0] * 3, [0] * 3), (days_ago(5), [100.0] * 3, [10] * 3)):
+        snapshot = _snapshot(date, 1.0)
+        snapshot.player_table = _players(efficiency, games)
+        before_restart.data_history.append(snapshot)
+
+    analyzer = ESPNNBAAdvancedAnalyzer(42, 2026, league=league, history_dir=str(tmp_path))
+    trends = analyzer._analyze_hot_cold_streaks(_players([160.0, 115.0, 130.0], [13, 13, 11]))
+
+    assert trends['reference_date'] == days_ago(5)
+    assert [t['name'] for t in trends['hot_players']] == ['Chaud']
+    assert [t['name'] for t in trends['cold_players']] == ['Froid']
+    assert trends['hot_players'][0]['recent_avg'] == 20.0 and trends['hot_players'][0]['games'] == 3
+    assert [t['name'] for t in trends['trending_down']] == ['Froid']  # 'Absent' : un seul match récent
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests du score d'adéquation des agents libres (gain roto marginal)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from collectors.collect_data import DataCollector
+from processors.category_matrix import CategoryMatrix
+from processors.team_fit import TeamFitScorer, roto_points
+from synthetic_league import LeagueShape, make_league
+
+
+def _scorer():
+    rosters = [
+        ('A', [SimpleNamespace(stats={'PTS': 10, 'FG%': 0.40}), SimpleNamespace(stats={'PTS': 10, 'FG%': 0.50})]),
+        ('B', [SimpleNamespace(stats={'PTS': 25, 'FG%': 0.47})]),
+        ('C', [SimpleNamespace(stats={'PTS': 30, 'FG%': 0.44})]),
+    ]
+    matrix = CategoryMatrix.from_rosters(['PTS', 'FG%'], rosters, lambda p: p.stats)
+    return TeamFitScorer.from_category_matrix(matrix, 'A', ['FG%'])
+
+
+def test_roto_points_with_ties():
+    others = np.array([[1.0, 5.0], [3.0, 5.0]])
+    assert roto_points(np.array([2.0, 5.0]), others).tolist() == [2.0, 2.0]
+    assert roto_points(np.array([[4.0, 6.0], [0.0, 4.0]]), others).tolist() == [[3.0, 3.0], [1.0, 1.0]]
+    assert roto_points(np.array([2.0, 5.0]), others, np.array([True, False])).tolist() == [2.0, 2.0]
+
+
+def test_marginal_gain_per_free_agent():
+    scorer = _scorer()
+    # Mon équipe : 20 pts (3e), 45 % (2e) -> 1 + 2 points
+    assert scorer.current_points.tolist() == [1.0, 2.0]
+
+    fa = np.array([
+        [6.0, 0.30],     # 26 pts (+1), FG% baisse à 40 % (-1)
+        [11.0, 0.56],    # 31 pts (+2), FG% 48,7 % (+1)
+        [0.0, np.nan],   # Rien ne change
+        [1.0, 0.0],      # 21 pts, 0 % ignoré dans la moyenne
+    ])
+    assert scorer.category_gains(fa).tolist() == [[1.0, -1.0], [2.0, 1.0], [0.0, 0.0], [0.0, 0.0]]
+    assert scorer.score(fa).tolist() == [0.0, 3.0, 0.0, 0.0]
+
+
+def test_vectorized_matches_one_by_one():
+    scorer = _scorer()
+    rng = np.random.default_rng(1)
+    fa = np.column_stack([rng.uniform(0, 15, 200), rng.uniform(0.3, 0.6, 200)])
+    one_by_one = [scorer.score(fa[i:i + 1])[0] for i in range(len(fa))]
+    assert scorer.score(fa).tolist() == one_by_one
+
+
+def test_free_agents_scored_from_espn_season_averages(tmp_path):
+    """Agents libres au format espn_api (dict stats, pas d'attributs stats_*) : valeurs et scores non nuls"""
+    free_agent = SimpleNamespace(name='FA', stats={'2026_total': {'avg': {
+        'PTS': 18.0, 'REB': 6.0, 'AST': 4.0, 'BLK': 1.0, 'STL': 1.5, '3PM': 2.0, 'FG%': 0.48, 'FT%': 0.8}}})
+    assert DataCollector.free_agent_stat_matrix([free_agent]).tolist() == [[18.0, 6.0, 4.0, 1.0, 1.5, 2.0, 0.48, 0.8]]
+
+    league = make_league(LeagueShape(teams=4, roster_size=6, bench_size=1, free_agents=20, seed=1))
+    collector = DataCollector(league=league, base_path=str(tmp_path), today='20260115')
+    fa_data = collector.collect_free_agents().to_frame()
+    assert (fa_data['pickup_pts'].dropna() > 0).all()
+    assert fa_data['team_fit_score'].abs().sum() > 0